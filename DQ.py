@@ -1,7 +1,12 @@
 import pandas as pd
 import numpy as np
-import re
-from ydata_profiling import ProfileReport
+from Data_Validation.datasktch.quantile_sketch import iqr_bounds, percentile_caps
+from Data_Validation.datasktch.heavy_hitters import HeavyHitters
+from Data_Validation.datatime import datetime_scoring
+from Data_Validation.datainstr.instrumentation import stage
+from Data_Validation.dataconf.rule_config import ColumnView, compile_scan_plan, validity_mask, preprocess_options
+from Data_Validation.dataquame.consistency_rules import evaluate_consistency_rules
+from Data_Validation.dataProfrep.native_profile import profile_dataset, render_native_profile
 
 # Load dataset
 def load_dataset(path):
@@ -23,7 +28,8 @@ def preprocess_column(column, dtype):
 
 # Preprocess entire dataset
 def preprocess_dataset(df, date_columns=None, numeric_columns=None, text_columns=None, 
-                        date_formats=None, categorical_columns=None, outlier_method=None):
+                        date_formats=None, categorical_columns=None, outlier_method=None, sketches=None,
+                        rules=None, top_values=None):
     """
     Preprocesses a DataFrame by detecting and handling date, numeric, and text columns.
 
@@ -36,15 +42,29 @@ def preprocess_dataset(df, date_columns=None, numeric_columns=None, text_columns
         categorical_columns (list, optional): List of columns to treat as categorical. Defaults to None.
         outlier_method (str, optional): Method for handling outliers in numeric columns. 
                                         Options: 'cap' (cap at percentiles), 'winsorize'. Defaults to None.
+        sketches (dict, optional): Column name -> QuantileSketch built in a streaming pass
+                                   (see ``sketch_chunks``). Used for the outlier caps instead
+                                   of the exact percentiles of the in-memory column. Defaults to None.
+        rules (dict, optional): Rule configuration whose 'preprocess' section supplies any
+                                argument left as None, plus the outlier percentiles and the
+                                number of categories kept. Defaults to None.
+        top_values (dict, optional): Column name -> HeavyHitters built in a streaming pass
+                                     (see ``track_top_values``). Used to pick the categories
+                                     kept instead of counting the in-memory column. Defaults to None.
 
     Returns:
         pd.DataFrame: The preprocessed DataFrame.
     """
-    date_columns = date_columns or []
-    numeric_columns = numeric_columns or []
-    text_columns = text_columns or []
-    date_formats = date_formats or {}
-    categorical_columns = categorical_columns or []
+    options = preprocess_options(rules)
+    date_columns = date_columns or options["date_columns"]
+    numeric_columns = numeric_columns or options["numeric_columns"]
+    text_columns = text_columns or options["text_columns"]
+    date_formats = date_formats or options["date_formats"]
+    categorical_columns = categorical_columns or options["categorical_columns"]
+    outlier_method = outlier_method or options["outlier_method"]
+    lower_cap, upper_cap = options["outlier_caps"]
+    sketches = sketches or {}
+    top_values = top_values or {}
 
     # Process date columns
     for col in date_columns:
@@ -62,14 +82,10 @@ def preprocess_dataset(df, date_columns=None, numeric_columns=None, text_columns
                 df[col] = df[col].astype(str).str.replace(r"[^\d.-]", "", regex=True)
                 df[col] = pd.to_numeric(df[col], errors="coerce")
 
-                # Handle outliers
-                if outlier_method == 'cap':
-                    upper_lim = df[col].quantile(0.95)
-                    lower_lim = df[col].quantile(0.05)
+                # Handle outliers (both methods cap at the configured percentiles, 5th and 95th by default)
+                if outlier_method in ('cap', 'winsorize'):
+                    lower_lim, upper_lim = percentile_caps(sketches.get(col) or df[col], lower_cap, upper_cap)
                     df[col] = np.clip(df[col], lower_lim, upper_lim)
-                elif outlier_method == 'winsorize':
-                    from scipy.stats.mstats import winsorize
-                    df[col] = winsorize(df[col], limits=[0.05, 0.05])  # Cap at 5th and 95th percentiles
 
             except Exception as e:
                 print(f"Error converting column '{col}' to numeric: {e}")
@@ -88,8 +104,10 @@ def preprocess_dataset(df, date_columns=None, numeric_columns=None, text_columns
         if col in df.columns:
             try:
                 # Example: Group infrequent categories
-                top_categories = df[col].value_counts().head(10).index
-                df[col] = df[col].apply(lambda x: x if x in top_categories else 'Other')
+                tracker = top_values.get(col) or HeavyHitters().update(df[col])
+                top_categories = tracker.top_values(options["top_categories"])
+                column = df[col].astype(object) if isinstance(df[col].dtype, pd.CategoricalDtype) else df[col]
+                df[col] = column.where(column.isin(top_categories), 'Other')
             except Exception as e:
                 print(f"Error processing categorical column '{col}': {e}")
 
@@ -171,13 +189,7 @@ def timeliness_score(column, threshold_date):
         ValueError: If threshold_date is None.
     """
     if pd.api.types.is_datetime64_any_dtype(column):
-        if threshold_date is None:
-            raise ValueError("Threshold date must be provided and cannot be None.")
-
-        threshold_date = threshold_date.tz_localize(None)
-
-        timely_entries = column.apply(lambda x: pd.isna(x) or x >= threshold_date).sum()
-        return timely_entries / len(column) * 100
+        return datetime_scoring.timeliness_score(datetime_scoring.parse_datetime_column(column), threshold_date)
 
 def accuracy_score(column, reference_column=None, threshold=None):
     """Calculate the accuracy score of a column compared to a reference column.
@@ -216,8 +228,11 @@ def consistency_score(df, column1, column2=None, consistency_rule=None, default_
         df (pd.DataFrame): The DataFrame containing the columns.
         column1 (str): The first column to compare.
         column2 (str, optional): The second column to compare. Defaults to None.
-        consistency_rule (callable, optional): A custom consistency rule. 
-                                               Should return True for consistent rows.
+        consistency_rule (str, list or callable, optional): A cross-column rule such as
+                                               ``"start_date <= end_date"`` (see
+                                               ``consistency_rules.ConsistencyRule``), a list of
+                                               them (all must hold), or a callable applied to
+                                               each row with ``df.apply``.
         default_score (float): Default score to return if no comparison is made. Defaults to 100.
 
     Returns:
@@ -231,13 +246,22 @@ def consistency_score(df, column1, column2=None, consistency_rule=None, default_
         print(f"Warning: Column '{column2}' does not exist. Assuming 100% consistency.")
         return default_score
 
-    if consistency_rule:
+    if isinstance(consistency_rule, (str, list, tuple)):
+        # Rules are compiled into column expressions and evaluated in one vectorized scan
+        rules = [consistency_rule] if isinstance(consistency_rule, str) else list(consistency_rule)
+        if not rules:
+            return default_score
+        rule = " and ".join(f"({rule})" for rule in rules)
+        inconsistent_entries = evaluate_consistency_rules(df, [rule])["Violations"].iloc[0]
+    elif consistency_rule:
         inconsistent_entries = df.apply(consistency_rule, axis=1).sum()
     elif column2:
-        if pd.api.types.is_numeric_dtype(df[column1]) and pd.api.types.is_numeric_dtype(df[column2]):
-            inconsistent_entries = (df[column1] > df[column2]).sum()
-        elif pd.api.types.is_datetime64_any_dtype(df[column1]) and pd.api.types.is_datetime64_any_dtype(df[column2]):
-            inconsistent_entries = (df[column1] > df[column2]).sum()
+        comparable = (
+            (pd.api.types.is_numeric_dtype(df[column1]) and pd.api.types.is_numeric_dtype(df[column2]))
+            or (pd.api.types.is_datetime64_any_dtype(df[column1]) and pd.api.types.is_datetime64_any_dtype(df[column2]))
+        )
+        if comparable:
+            inconsistent_entries = evaluate_consistency_rules(df, [f"`{column1}` <= `{column2}`"])["Violations"].iloc[0]
         else:
             print(f"Warning: Columns '{column1}' and '{column2}' are not comparable. Returning default score.")
             return default_score
@@ -250,11 +274,13 @@ def consistency_score(df, column1, column2=None, consistency_rule=None, default_
 
     return round(consistency, 2)
 
-def reliability_score(column):
+def reliability_score(column, sketch=None):
     """Calculate the reliability score of a numerical column based on outlier detection.
 
     Args:
         column (pd.Series): The numeric column to evaluate.
+        sketch (QuantileSketch, optional): Precomputed sketch of the column, e.g. from a
+                                           streaming pass. Defaults to the exact quartiles of ``column``.
 
     Returns:
         float: Reliability score as a percentage.
@@ -266,18 +292,14 @@ def reliability_score(column):
         if len(column) == 0:
             return 0.0  # Return 0% if the column is empty
 
-        Q1 = column.quantile(0.25)
-        Q3 = column.quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
+        lower_bound, upper_bound = iqr_bounds(sketch or column)
 
         reliable_entries = ((column >= lower_bound) & (column <= upper_bound)).sum()
         return reliable_entries / len(column) * 100
     
     return 100.0  # Return 100% reliability if the column is not numerical
 
-def calculate_scores(df, threshold_date=None, reference_columns=None):
+def calculate_scores(df, threshold_date=None, reference_columns=None, sketches=None, date_formats=None, rules=None):
     """
     Calculates data quality scores for each column in a DataFrame.
 
@@ -287,35 +309,41 @@ def calculate_scores(df, threshold_date=None, reference_columns=None):
         reference_columns (dict, optional): A dictionary mapping column names to their 
                                             reference columns for accuracy calculation. 
                                             Defaults to None.
+        sketches (dict, optional): Column name -> QuantileSketch for the reliability check,
+                                   e.g. built with ``sketch_chunks``. Defaults to None.
+        date_formats (dict, optional): Column name -> date format for timeliness. Defaults to
+                                       detecting date columns from a sample of each column.
+        rules (dict, optional): Rule configuration naming the validators of each column
+                                (see ``rule_config``). Defaults to the email check.
 
     Returns:
         pd.DataFrame: A DataFrame with data quality scores for each column.
     """
+    sketches = sketches or {}
+    plan = compile_scan_plan(rules, df.columns)
 
     if threshold_date is None:
         threshold_date = pd.to_datetime("today")
 
+    # Text columns holding dates are parsed once here; df itself is left untouched
+    date_columns = datetime_scoring.parse_datetime_columns(df, date_formats)
+
     detailed_scores = {}
 
     for col in df.columns:
         column_data = df[col]
+        view = ColumnView(column_data)
+        validators = plan[col]["validators"]
 
         # Calculate scores for each column
         column_scores = {
             "Completeness": completeness_score(column_data),
             "Uniqueness": uniqueness_score(column_data),
-            "Validity": validity_score(
-                column_data,
-                lambda x: bool(
-                    re.match(
-                        r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$", str(x)
-                    )
-                ),
-            ) if "email" in col.lower() else 100,
-            "Timeliness": timeliness_score(column_data, threshold_date) if pd.api.types.is_datetime64_any_dtype(column_data) else 100,
+            "Validity": validity_mask(view, validators).mean() * 100 if validators and len(view.column) else 100,
+            "Timeliness": datetime_scoring.timeliness_score(date_columns[col], threshold_date, column_data) if col in date_columns else 100,
             "Consistency": consistency_score(df, col),  # You might need to adjust this based on your consistency logic
             "Accuracy": accuracy_score(column_data, reference_columns.get(col)) if reference_columns else 100,  # Use reference column if provided
-            "Reliability": reliability_score(column_data)
+            "Reliability": reliability_score(column_data, sketches.get(col))
         }
 
         detailed_scores[col] = column_scores
@@ -392,11 +420,27 @@ def generate_quality_summary(df, scores_df, output_path="quality_summary_report.
     except Exception as e:
         print(f"Error generating quality summary report: {e}")
 
+# Generate the native profiling report; deep=True runs ydata-profiling instead (optional, much slower)
+def generate_profiling_report(df, output_path="profiling_report.html", css_path="style.css", deep=False):
+    if deep:
+        return generate_ydata_profiling_report(df, output_path)
+    try:
+        with stage("native_profile"):
+            body = render_native_profile(profile_dataset(df))
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(f"<html><head><title>Profiling Report</title><link rel='stylesheet' href='{css_path}'></head><body>"
+                    f"<h1>Profiling Report</h1>\n{body}</body></html>")
+        print(f"Profiling Report generated successfully: {output_path}")
+    except Exception as e:
+        print(f"Error generating profiling report: {e}")
+
 # Generate YData Profiling Report
 def generate_ydata_profiling_report(df, output_path="ydata_profiling_report.html"):
     try:
-        profile = ProfileReport(df, title="YData Profiling Report", explorative=True)
-        profile.to_file(output_path)
+        from ydata_profiling import ProfileReport  # optional dependency, only needed for this report
+        with stage("ydata_profiling"):
+            profile = ProfileReport(df, title="YData Profiling Report", explorative=True)
+            profile.to_file(output_path)
         print(f"YData Profiling Report generated successfully: {output_path}")
     except Exception as e:
         print(f"Error generating YData profiling report: {e}")
@@ -416,5 +460,5 @@ if __name__ == "__main__":
     # Generate quality summary report
     generate_quality_summary(df, detailed_scores_df)
 
-    # Generate YData profiling report
-    generate_ydata_profiling_report(df)
\ No newline at end of file
+    # Generate the profiling report (pass deep=True for the full ydata-profiling report)
+    generate_profiling_report(df)
\ No newline at end of file
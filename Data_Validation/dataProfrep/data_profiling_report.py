@@ -4,6 +4,11 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 import io
 import base64
+from Data_Validation.datadupl.duplicate_detection import find_duplicates
+from Data_Validation.datanull.null_mask_index import NullMaskIndex
+from Data_Validation.datarender.templates import asset_tags, render_template
+from Data_Validation.datarender.report_bundle import write_report_bundle
+from Data_Validation.dataProfrep.native_profile import render_histogram_svg
 
 # Utility to format memory size
 def format_memory_size(bytes_size):
@@ -20,103 +25,173 @@ def format_memory_size(bytes_size):
         return f"{bytes_size / (1024 ** 4):.2f} TB"
 
 # Function to generate column statistics
-def generate_statistics(df):
-    """Generate detailed statistics for each column."""
+def generate_statistics(df, duplicates=None, columns=None, nulls=None):
+    """Generate detailed statistics for each column.
+
+    ``duplicates`` is an optional summary from ``find_duplicates``; distinct and
+    duplicate counts are read from it instead of hashing every column again.
+    ``columns`` restricts the statistics to a subset of columns (e.g. the ones
+    that drifted since the previous run). ``nulls`` is the frame's
+    ``NullMaskIndex`` when already built.
+    """
+    columns = df.columns if columns is None else [col for col in columns if col in df.columns]
+    if duplicates is None:
+        duplicates = find_duplicates(df[columns])
+    if nulls is None:
+        nulls = NullMaskIndex.from_frame(df)
+    # Memory of every column from one call; each column's figure includes the index, like Series.memory_usage
+    memory = df[columns].memory_usage(index=False, deep=True) + df.index.memory_usage(deep=True)
+    n_rows = len(df)
     report = []
-    for column in df.columns:
-        data = df[column]
-        n_rows = len(data)
-        distinct_values = data.nunique()
-        memory_size = data.memory_usage(deep=True)
-
-        stats = {
-            "Column Name": column,
-            "Missing Cells": data.isnull().sum(),
-            "Missing Cells (%)": f"{(data.isnull().sum() / n_rows) * 100:.2f}%",
-            "Duplicate Values": data.duplicated().sum(),
-            "Duplicate Values (%)": f"{(data.duplicated().sum() / n_rows) * 100:.2f}%",
-            "Distinct Values": distinct_values,
-            "Distinct Values (%)": f"{(distinct_values / n_rows) * 100:.2f}%",
-            "Memory Size": format_memory_size(memory_size),
-        }
-        report.append(stats)
+    for column in columns:
+        column_duplicates = duplicates["columns"].get(column) or find_duplicates(df[[column]])["columns"][column]
+        report.append(column_statistics_row(column, n_rows, nulls.count(column), column_duplicates["distinct"],
+                                            column_duplicates["duplicates"], memory[column]))
     return report
 
-# Function to generate the combined report
-def generate_combined_report(df, detailed_report_content, quality_summary_content, output_path="combined_report.html"):
-    try:
-        # Add serial numbers (S.No) to the DataFrame
-        df.insert(0, 'S.No', range(1, len(df) + 1))
-
-        # Generate statistics
-        column_statistics = generate_statistics(df)
-
-        # Generate HTML for the first and last 10 rows of the dataset
-        first_10_rows_html = df.head(10).to_html(index=False)
-        last_10_rows_html = df.tail(10).to_html(index=False)
-
-         # Correlation visualization
-        correlation_visualization_html = ""
-        numeric_columns = df.select_dtypes(include=['int64', 'float64'])
-
-        if numeric_columns.shape[1] > 1:
-            # Compute correlation matrix
-            corr_matrix = numeric_columns.corr()
-
-            fig, ax = plt.subplots(figsize=(6, 4))  # Reduced figure size for neatness
-            sns.heatmap(
-                corr_matrix,
-                annot=True,
-                cmap='YlGnBu',
-                fmt=".2f",
-                linewidths=0.5,
-                ax=ax,
-                cbar_kws={"shrink": 0.8}
-            )
-            ax.set_title('Correlation Matrix Heatmap', fontsize=14, fontweight='bold')
-            plt.tight_layout()
-
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format="png", dpi=100)
-            buffer.seek(0)
-            heatmap_img = base64.b64encode(buffer.getvalue()).decode('utf-8')
-            buffer.close()
-            plt.close()
-
-            correlation_visualization_html = f"""
-<div class='correlation-section' style="font-family: Arial, sans-serif; color: #333; margin: 20px 0;">
-    <h3 style="text-align: center; font-size: 1.8em; margin-bottom: 20px; border-bottom: 2px solid #ccc; padding-bottom: 10px;">Correlation Analysis</h3>
-    <div style="display: flex; justify-content: center; margin: 0 auto; max-width: 600px; padding: 10px; background: #fff; border-radius: 10px; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1);">
-        <img src="data:image/png;base64,{heatmap_img}" alt="Correlation Heatmap" style="width: 100%; height: auto; display: block; border-radius: 8px;">
+def column_statistics_row(column, n_rows, missing_cells, distinct_values, duplicate_values, memory_size):
+    """Format one column's counts as a row of the column statistics (shared with the partitioned executor)."""
+    return {
+        "Column Name": column,
+        "Missing Cells": missing_cells,
+        "Missing Cells (%)": f"{(missing_cells / n_rows) * 100:.2f}%",
+        "Duplicate Values": duplicate_values,
+        "Duplicate Values (%)": f"{(duplicate_values / n_rows) * 100:.2f}%",
+        "Distinct Values": distinct_values,
+        "Distinct Values (%)": f"{(distinct_values / n_rows) * 100:.2f}%",
+        "Memory Size": format_memory_size(memory_size),
+    }
+
+# Rows shown in each row preview of the combined report
+PREVIEW_ROWS = 10
+
+# Passed as timing_report_content when the timing section is only rendered once the
+# report itself has been timed; replace it in the page before writing
+TIMING_PLACEHOLDER = "<!-- dq-timing-section -->"
+
+def row_preview(df, positions):
+    """Rows of ``df`` at ``positions`` with 1-based serial numbers (S.No).
+
+    Only the selected rows are copied; ``df`` itself is left unchanged.
+    """
+    positions = np.asarray(positions, dtype=np.int64)
+    preview = df.take(positions)
+    preview.insert(0, 'S.No', positions + 1)
+    return preview
+
+def preview_positions(n_rows, preview_rows=PREVIEW_ROWS, sample_rows=0, seed=None):
+    """Row positions of the first, last and (optionally) randomly sampled previews."""
+    preview_rows = min(preview_rows, n_rows)
+    positions = {
+        "first": np.arange(preview_rows),
+        "last": np.arange(n_rows - preview_rows, n_rows),
+    }
+    if sample_rows:
+        rng = np.random.default_rng(seed)
+        positions["sample"] = np.sort(rng.choice(n_rows, size=min(sample_rows, n_rows), replace=False))
+    return positions
+
+def render_combined_report(df, detailed_report_content, quality_summary_content, output_path="combined_report.html",
+                           timing_report_content=None, duplicates=None, drift_report_content=None,
+                           columns=None, failure_report_content=None, preview_rows=PREVIEW_ROWS, sample_rows=0,
+                           sample_seed=None, inline_assets=False, histograms=None, nulls=None):
+    """Render the combined HTML report and return the page.
+
+    ``df`` is not modified. The row previews show the first and last
+    ``preview_rows`` rows and, when ``sample_rows`` is set, that many randomly
+    chosen rows (reproducible with ``sample_seed``).
+
+    The page's CSS and JS are written once per output directory and linked
+    (see ``datarender.templates.asset_tags``); ``inline_assets=True`` embeds
+    them instead. ``histograms`` ({column: Histogram}, see
+    ``datastats.histograms``) adds a distribution chart to each column's
+    statistics. ``nulls`` is the frame's ``NullMaskIndex`` when already built.
+    """
+    # Generate statistics
+    # In delta mode only the columns that moved since the previous run are rendered
+    column_statistics = generate_statistics(df, duplicates, columns, nulls)
+
+    # Row previews, numbered by their position in the dataset
+    positions = preview_positions(len(df), preview_rows, sample_rows, sample_seed)
+    first_rows_html = row_preview(df, positions["first"]).to_html(index=False)
+    last_rows_html = row_preview(df, positions["last"]).to_html(index=False)
+    sample_button_html = ""
+    sample_rows_html = ""
+    if "sample" in positions:
+        sample_button_html = "<button onclick=\"showRows('sample-rows')\">Random Rows</button>"
+        sample_rows_html = f"""
+<div id='sample-rows' class='row-table row-table-hidden'>
+    <div class="scrollable-table">
+        {row_preview(df, positions["sample"]).to_html(index=False)}
+    </div>
+</div>
+"""
+
+     # Correlation visualization
+    correlation_visualization_html = ""
+    numeric_columns = df.select_dtypes(include=['int64', 'float64'])
+
+    if numeric_columns.shape[1] > 1:
+        # Compute correlation matrix
+        corr_matrix = numeric_columns.corr()
+
+        fig, ax = plt.subplots(figsize=(6, 4))  # Reduced figure size for neatness
+        sns.heatmap(
+            corr_matrix,
+            annot=True,
+            cmap='YlGnBu',
+            fmt=".2f",
+            linewidths=0.5,
+            ax=ax,
+            cbar_kws={"shrink": 0.8}
+        )
+        ax.set_title('Correlation Matrix Heatmap', fontsize=14, fontweight='bold')
+        plt.tight_layout()
+
+        buffer = io.BytesIO()
+        plt.savefig(buffer, format="png", dpi=100)
+        buffer.seek(0)
+        heatmap_img = base64.b64encode(buffer.getvalue()).decode('utf-8')
+        buffer.close()
+        plt.close()
+
+        correlation_visualization_html = f"""
+<div class='correlation-section'>
+    <h3>Correlation Analysis</h3>
+    <div class='correlation-figure'>
+        <img src="data:image/png;base64,{heatmap_img}" alt="Correlation Heatmap">
     </div>
 </div>
 """
-        else:
-            # Message when no numeric columns are present
-            correlation_visualization_html = """
-<div class='correlation-section' style="font-family: Arial, sans-serif; color: #333; margin: 20px 0; text-align: center;">
-    <h3 style="font-size: 1.8em; margin-bottom: 20px; border-bottom: 2px solid #ccc; padding-bottom: 10px;">Correlation Analysis</h3>
-    <p style="font-size: 1.2em; color: #555;">No numeric columns found in the dataset. Correlation analysis is only applicable to numeric data.</p>
+    else:
+        # Message when no numeric columns are present
+        correlation_visualization_html = """
+<div class='correlation-section correlation-empty'>
+    <h3>Correlation Analysis</h3>
+    <p>No numeric columns found in the dataset. Correlation analysis is only applicable to numeric data.</p>
 </div>
 """
 
 
 
-        # Generate dropdown menu
-        
-        dropdown_html = """
+    # Generate dropdown menu
+    
+    dropdown_html = """
         <h2>Column Analytics</h2>
         <select id='column-select' onchange='filterColumnStats(this.value)'>
             <option value='all' selected>All Columns</option>
         """
-        for stats in column_statistics:
-            dropdown_html += f"<option value='{stats['Column Name']}'>{stats['Column Name']}</option>"
-        dropdown_html += "</select>"
-
-        # Generate HTML for column statistics
-        column_html = ""
-        for stats in column_statistics:
-            column_html += f"""
+    for stats in column_statistics:
+        dropdown_html += f"<option value='{stats['Column Name']}'>{stats['Column Name']}</option>"
+    dropdown_html += "</select>"
+
+    # Generate HTML for column statistics
+    histograms = histograms or {}
+    column_html = ""
+    for stats in column_statistics:
+        histogram = histograms.get(stats["Column Name"])
+        histogram_html = render_histogram_svg(histogram) if histogram is not None and histogram.n else ""
+        column_html += f"""
             <div class='column-container' data-column='{stats["Column Name"]}'>
                 <h3>{stats["Column Name"]}</h3>
                 <table class="stats-table">
@@ -126,26 +201,29 @@ def generate_combined_report(df, detailed_report_content, quality_summary_conten
                     <tr><td>Distinct Values</td><td>{stats['Distinct Values']} ({stats['Distinct Values (%)']})</td></tr>
                     <tr><td>Memory Size</td><td>{stats['Memory Size']}</td></tr>
                 </table>
+                {histogram_html}
             </div>
             """
 
-        column_statistics_html = f"""
+    column_statistics_html = f"""
 <h2>Sample dataset</h2>
 
 <div>
     <button onclick="showRows('first-rows')">First Rows</button>
     <button onclick="showRows('last-rows')">Last Rows</button>
+    {sample_button_html}
 </div>
-<div id='first-rows' class='row-table' style='overflow-x:auto;'>
+<div id='first-rows' class='row-table'>
     <div class="scrollable-table">
-        {first_10_rows_html}
+        {first_rows_html}
     </div>
 </div>
-<div id='last-rows' class='row-table' style='display:none; overflow-x:auto;'>
+<div id='last-rows' class='row-table row-table-hidden'>
     <div class="scrollable-table">
-        {last_10_rows_html}
+        {last_rows_html}
     </div>
 </div>
+{sample_rows_html}
 
 {dropdown_html}
 {column_html}
@@ -153,72 +231,75 @@ def generate_combined_report(df, detailed_report_content, quality_summary_conten
 """
 
 
-        # Final HTML structure
-        final_html = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Data Quality Report</title>
-    <link rel="stylesheet" href="Data_Validation\\dataProfrep\\Dpr.css">
-    <script>
-        function filterColumnStats(selectedValue) {{
-            const allContainers = document.querySelectorAll('.column-container');
-            if (selectedValue === 'all') {{
-                allContainers.forEach(container => container.style.display = 'block');
-            }} else {{
-                allContainers.forEach(container => {{
-                    container.style.display = container.getAttribute('data-column') === selectedValue ? 'block' : 'none';
-                }});
-            }}
-        }}
-        function showSection(sectionId) {{
-            const sections = document.querySelectorAll('.section-content');
-            sections.forEach(section => section.classList.remove('active'));
-            document.getElementById(sectionId).classList.add('active');
-        }}
-        function showRows(rowId) {{
-            const allTables = document.querySelectorAll('.row-table');
-            allTables.forEach(table => table.style.display = 'none');
-            document.getElementById(rowId).style.display = 'block';
-        }}
-    </script>
-    
-</head>
-<body>
-    <body>
-    <div class="navbar">
-        <div class="logo-container">
-            <img src="images/image22.png" alt="Logo">
-            <p class="logo-title">Data Quality Report</p>
-        </div>
-        <div class="nav-links">
-            <a href="javascript:void(0);" onclick="showSection('detailed-report')">Detailed Report</a>
-            <a href="javascript:void(0);" onclick="showSection('quality-summary')">Quality Summary</a>
-            <a href="javascript:void(0);" onclick="showSection('column-statistics')">Column Statistics</a>
-        </div>
-    </div>
-</body>
-
-    <div class="content">
-        <div id="detailed-report" class="section-content active">
-            {detailed_report_content}
-        </div>
-        <div id="quality-summary" class="section-content">
-            {quality_summary_content}
-        </div>
-        <div id="column-statistics" class="section-content">
-            {column_statistics_html}
-        </div>
-    </div>
-</body>
-</html>
-"""
+    # Optional pipeline timing section (see PipelineTrace / render_timing_section)
+    timing_link_html = ""
+    timing_section_html = ""
+    if timing_report_content:
+        timing_link_html = """<a href="javascript:void(0);" onclick="showSection('pipeline-timing')">Timing</a>"""
+        timing_section_html = f"""<div id="pipeline-timing" class="section-content">
+            {timing_report_content}
+        </div>"""
+
+    # Optional run-over-run drift section (see compare_runs / render_drift_section)
+    drift_link_html = ""
+    drift_section_html = ""
+    if drift_report_content:
+        drift_link_html = """<a href="javascript:void(0);" onclick="showSection('drift-report')">Changes</a>"""
+        drift_section_html = f"""<div id="drift-report" class="section-content">
+            {drift_report_content}
+        </div>"""
+
+    # Optional sampled failing rows (see FailureSamples / render_failure_section)
+    failure_link_html = ""
+    failure_section_html = ""
+    if failure_report_content:
+        failure_link_html = """<a href="javascript:void(0);" onclick="showSection('failing-rows')">Failing Rows</a>"""
+        failure_section_html = f"""<div id="failing-rows" class="section-content">
+            {failure_report_content}
+        </div>"""
+
+    # Final HTML structure
+    final_html = render_template(
+        "combined_report",
+        assets=asset_tags("combined", output_path, inline=inline_assets),
+        failure_link=failure_link_html,
+        drift_link=drift_link_html,
+        timing_link=timing_link_html,
+        detailed_report=detailed_report_content,
+        quality_summary=quality_summary_content,
+        column_statistics=column_statistics_html,
+        failure_section=failure_section_html,
+        drift_section=drift_section_html,
+        timing_section=timing_section_html,
+    )
+    return final_html
+
+# Function to generate the combined report
+def generate_combined_report(df, detailed_report_content, quality_summary_content, output_path="combined_report.html",
+                             timing_report_content=None, duplicates=None, drift_report_content=None,
+                             columns=None, failure_report_content=None, preview_rows=PREVIEW_ROWS, sample_rows=0,
+                             sample_seed=None, inline_assets=False, bundle="html", histograms=None, nulls=None):
+    """Write the combined HTML report (see ``render_combined_report``).
+
+    ``bundle`` selects a compressed output mode ("gzip", "brotli" or "zip", see
+    ``datarender.report_bundle.write_report_bundle``).
+
+    Returns:
+        str: Path of the written file (e.g. the ``.zip`` in zip mode). Errors are
+        printed and re-raised, so a failed report is never mistaken for a written one.
+    """
+    try:
+        final_html = render_combined_report(df, detailed_report_content, quality_summary_content, output_path,
+                                            timing_report_content=timing_report_content, duplicates=duplicates,
+                                            drift_report_content=drift_report_content, columns=columns,
+                                            failure_report_content=failure_report_content, preview_rows=preview_rows,
+                                            sample_rows=sample_rows, sample_seed=sample_seed,
+                                            inline_assets=inline_assets, histograms=histograms, nulls=nulls)
         # Save the report
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(final_html)
+        output_path = write_report_bundle(final_html, output_path, bundle)
 
         print(f"Detailed report saved successfully to {output_path}")
+        return output_path
     except Exception as e:
-        print(f"Error generating combined report: {e}")
\ No newline at end of file
+        print(f"Error generating combined report: {e}")
+        raise
@@ -0,0 +1,181 @@
+import html
+
+import numpy as np
+import pandas as pd
+
+from Data_Validation.datasktch.quantile_sketch import quantile_values
+from Data_Validation.datasktch.heavy_hitters import track_top_values
+from Data_Validation.datastats.histograms import build_histograms
+from Data_Validation.datastats.wide_table import wide_column_statistics, wide_correlation_pairs
+from Data_Validation.datanull.null_mask_index import NullMaskIndex
+
+# Quantiles shown for every numeric column
+PROFILE_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+# Correlation pairs listed, strongest first, and the smallest |r| listed
+TOP_CORRELATIONS = 20
+MIN_CORRELATION = 0.5
+
+
+def _kind(dtype):
+    if pd.api.types.is_bool_dtype(dtype):
+        return "Boolean"
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "Numeric"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "DateTime"
+    if isinstance(dtype, pd.CategoricalDtype):
+        return "Categorical"
+    return "Text"
+
+
+def profile_dataset(df, sketches=None, top_values=None, histograms=None, nulls=None):
+    """Profile every column from the project's own statistics.
+
+    The figures ydata-profiling computes for its overview and variable pages,
+    built from the modules the rest of the report already uses: missing counts
+    from the ``NullMaskIndex``, distinct counts, min/max and moments from
+    ``wide_column_statistics`` (one reduction per dtype block), quantiles from
+    ``QuantileSketch``, most frequent values from ``HeavyHitters``,
+    distributions from ``build_histograms`` and the strongest pairwise
+    correlations from ``wide_correlation_pairs``. ``sketches``, ``top_values``,
+    ``histograms`` and ``nulls`` are reused when given.
+
+    Returns:
+        dict: ``{"rows", "memory", "missing_cells", "columns": {column: {...}},
+        "correlation_pairs": pd.DataFrame}`` (pairs with |r| ≥ ``MIN_CORRELATION``).
+    """
+    sketches = sketches or {}
+    if nulls is None:
+        nulls = NullMaskIndex.from_frame(df)
+    statistics = wide_column_statistics(df, nulls=nulls)
+    if top_values is None:
+        top_values = track_top_values(df)
+    if histograms is None:
+        histograms = build_histograms(df)
+    n_rows = len(df)
+
+    columns = {}
+    for col in df.columns:
+        column = df[col]
+        stats = statistics.loc[col]
+        kind = _kind(column.dtype)
+        profile = {
+            "kind": kind,
+            "dtype": str(column.dtype),
+            "missing": int(stats["missing"]),
+            "distinct": int(stats["distinct"]),
+        }
+        if kind == "Numeric":
+            # Exact quantiles of the in-memory column unless a streaming sketch was handed in
+            source = sketches.get(col) or column
+            profile.update({name: float(stats[name]) for name in ("min", "max", "mean", "std", "skewness", "kurtosis")})
+            profile["zeros"] = int((column == 0).sum())
+            profile["negatives"] = int(stats["negatives"])
+            profile["quantiles"] = dict(zip(PROFILE_QUANTILES, np.atleast_1d(quantile_values(source, list(PROFILE_QUANTILES))).tolist())) \
+                if n_rows - profile["missing"] else {}
+            profile["quantiles_approximate"] = source is not column and not source.is_exact
+        elif kind == "DateTime":
+            profile["min"], profile["max"] = column.min(), column.max()
+        if col in histograms and histograms[col].n:
+            profile["histogram"] = histograms[col]
+        if col in top_values:
+            profile["top_values"] = top_values[col].top(10)
+        columns[col] = profile
+
+    return {
+        "rows": n_rows,
+        "memory": int(df.memory_usage(index=True, deep=True).sum()),
+        "missing_cells": int(sum(nulls.null_counts().values())),
+        "columns": columns,
+        "correlation_pairs": wide_correlation_pairs(df, MIN_CORRELATION),
+    }
+
+
+def _format(value):
+    if isinstance(value, (float, np.floating)):
+        return "—" if np.isnan(value) else f"{value:,.4g}"
+    return html.escape(str(value))
+
+
+def render_histogram_svg(histogram, width=320, height=120):
+    """Inline SVG bar chart of a ``Histogram`` (no image is rendered)."""
+    counts = histogram.counts.tolist()
+    edges = [_format(edge) for edge in histogram.labels()]
+    peak = max(counts) or 1
+    bar = width / len(counts)
+    bars = []
+    for i, count in enumerate(counts):
+        bar_height = count / peak * (height - 2)
+        bars.append(f"<rect x='{i * bar:.2f}' y='{height - bar_height:.2f}' width='{max(bar - 1, 1):.2f}' "
+                    f"height='{bar_height:.2f}'><title>[{edges[i]}, {edges[i + 1]}): {count:,.0f}</title></rect>")
+    return (f"<svg class='profile-histogram' viewBox='0 0 {width} {height}' width='{width}' height='{height}'>"
+            + "".join(bars) + "</svg>")
+
+
+def _column_card(col, profile, n_rows):
+    rows = [
+        ("Type", f"{profile['kind']} ({profile['dtype']})"),
+        ("Missing", f"{profile['missing']} ({profile['missing'] / n_rows * 100:.2f}%)" if n_rows else profile["missing"]),
+        ("Distinct", f"{profile['distinct']} ({profile['distinct'] / n_rows * 100:.2f}%)" if n_rows else profile["distinct"]),
+    ]
+    if profile["kind"] == "Numeric":
+        rows += [(name.capitalize(), _format(profile[name])) for name in ("min", "max", "mean", "std", "skewness", "kurtosis")]
+        rows += [("Zeros", profile["zeros"]), ("Negatives", profile["negatives"])]
+        marker = " (≈)" if profile.get("quantiles_approximate") else ""
+        rows += [(f"{q:.0%}{marker}", _format(value)) for q, value in profile["quantiles"].items()]
+    elif profile["kind"] == "DateTime":
+        rows += [("Min", _format(profile["min"])), ("Max", _format(profile["max"]))]
+    table = "".join(f"<tr><td>{name}</td><td>{value}</td></tr>" for name, value in rows)
+
+    parts = [f"<div class='profile-column'><h3>{html.escape(str(col))}</h3>",
+             f"<table class='profile-table'>{table}</table>"]
+    if profile.get("histogram"):
+        parts.append(render_histogram_svg(profile["histogram"]))
+    if profile.get("top_values"):
+        parts.append("<table class='profile-table'><tr><th>Value</th><th>Count</th><th>Share (%)</th></tr>")
+        for entry in profile["top_values"]:
+            count = f"{entry['count'] - entry['error']}–{entry['count']}" if entry["error"] else f"{entry['count']}"
+            parts.append(f"<tr><td>{html.escape(str(entry['value']))}</td><td>{count}</td>"
+                         f"<td>{entry['percentage']:.2f}%</td></tr>")
+        parts.append("</table>")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def _correlation_pairs(pairs, top=TOP_CORRELATIONS):
+    order = np.argsort(-pairs["correlation"].abs().to_numpy(), kind="stable")[:top]
+    return list(pairs.iloc[order].itertuples(index=False, name=None))
+
+
+def render_native_profile(profile):
+    """HTML of a profile from ``profile_dataset``: overview, correlations and one card per column."""
+    n_rows = profile["rows"]
+    n_columns = len(profile["columns"])
+    kinds = pd.Series([column["kind"] for column in profile["columns"].values()], dtype=object).value_counts()
+    cells = n_rows * n_columns
+    overview = [
+        ("Rows", n_rows),
+        ("Columns", n_columns),
+        ("Missing cells", f"{profile['missing_cells']} ({profile['missing_cells'] / cells * 100:.2f}%)" if cells else 0),
+        ("Memory", f"{profile['memory'] / 1024 ** 2:.2f} MiB"),
+    ] + [(f"{kind} columns", count) for kind, count in kinds.items()]
+    parts = ["<div class='profile-overview'><h2>Overview</h2><table class='profile-table'>",
+             "".join(f"<tr><td>{name}</td><td>{value}</td></tr>" for name, value in overview),
+             "</table></div>"]
+
+    pairs = _correlation_pairs(profile["correlation_pairs"])
+    parts.append("<div class='profile-correlations'><h2>Correlations</h2>")
+    if pairs:
+        parts.append("<table class='profile-table'><tr><th>Column</th><th>Column</th><th>Pearson r</th></tr>")
+        parts.extend(f"<tr><td>{html.escape(str(a))}</td><td>{html.escape(str(b))}</td><td>{r:.3f}</td></tr>"
+                     for a, b, r in pairs)
+        parts.append("</table>")
+    else:
+        parts.append(f"<p>No pair of numeric columns with |r| ≥ {MIN_CORRELATION}.</p>")
+    parts.append("</div>")
+
+    parts.append("<h2>Variables</h2><div class='profile-columns'>")
+    parts.extend(_column_card(col, column, n_rows) for col, column in profile["columns"].items())
+    parts.append("</div>")
+    return "\n".join(parts)
@@ -0,0 +1,278 @@
+import copy
+import fnmatch
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from Data_Validation.dataquame.consistency_rules import ConsistencyRule
+
+# Metrics in the order they appear in the scores table
+METRIC_ORDER = ["Completeness", "Uniqueness", "Validity", "Timeliness", "Accuracy", "Consistency"]
+
+EMAIL_PATTERN = r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$"
+
+# Thresholds used by generate_alerts
+DEFAULT_ALERT_THRESHOLDS = {
+    "correlation": 0.85,            # |r| above this is a high correlation
+    "low_cardinality": 5,           # text columns with fewer unique values
+    "near_unique_ratio": 0.95,      # unique values above this share of rows
+    "iqr_multiplier": 1.5,          # outlier fences at Q1/Q3 -/+ multiplier * IQR
+    "skewness": 1,
+    "kurtosis": 3,
+    "coefficient_of_variation": 1.0,        # std / |mean| above this varies widely
+    "min_coefficient_of_variation": 0.01,   # non-constant columns with std / |mean| below this
+    "dominant_value_ratio": 0.95,   # one value in more than this share of the non-missing values
+}
+
+# Options used by preprocess_dataset
+DEFAULT_PREPROCESS = {
+    "date_columns": [],
+    "numeric_columns": [],
+    "text_columns": [],
+    "categorical_columns": [],
+    "date_formats": {},
+    "outlier_method": None,
+    "outlier_caps": [0.05, 0.95],   # percentiles used by 'cap' and 'winsorize'
+    "top_categories": 10,           # categories kept before grouping the rest as 'Other'
+}
+
+# The checks the pipeline ran before rules were configurable
+DEFAULT_RULES = {
+    "select": None,                 # columns to validate (names or glob patterns); None selects every column
+    "metrics": ["Completeness", "Validity", "Uniqueness", "Accuracy", "Consistency"],
+    "columns": {
+        "*email*": {"validators": [{"type": "regex", "pattern": EMAIL_PATTERN}]},
+    },
+    "alerts": DEFAULT_ALERT_THRESHOLDS,
+    "preprocess": DEFAULT_PREPROCESS,
+    "consistency_rules": [],        # cross-column rules, e.g. "start_date <= end_date"
+}
+
+
+def load_rules(path):
+    """Load a rule configuration from a JSON or YAML file.
+
+    YAML needs the optional ``PyYAML`` package. The file is merged over
+    ``DEFAULT_RULES`` (see ``resolve_rules``).
+    """
+    with open(path, encoding="utf-8") as f:
+        if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError as e:
+                raise ImportError("Reading YAML rules requires PyYAML (pip install pyyaml).") from e
+            rules = yaml.safe_load(f) or {}
+        else:
+            rules = json.load(f)
+    return resolve_rules(rules)
+
+
+def resolve_rules(rules=None):
+    """Fill in a rule configuration with the defaults.
+
+    ``alerts`` and ``preprocess`` are merged key by key over the defaults;
+    ``select``, ``metrics``, ``columns`` and ``consistency_rules`` replace the
+    defaults when given. Consistency rules are compiled here so syntax errors surface
+    when the configuration is loaded.
+    """
+    resolved = copy.deepcopy(DEFAULT_RULES)
+    if not rules:
+        return resolved
+
+    unknown = set(rules) - set(resolved)
+    if unknown:
+        raise ValueError(f"Unknown rule section(s): {', '.join(sorted(unknown))}.")
+    for section in ("alerts", "preprocess"):
+        resolved[section].update(rules.get(section) or {})
+    for section in ("select", "metrics", "columns", "consistency_rules"):
+        if section in rules:
+            resolved[section] = copy.deepcopy(rules[section])
+
+    _check_metrics(resolved["metrics"])
+    select = resolved["select"]
+    if select is not None and (isinstance(select, str) or not all(isinstance(selector, str) for selector in select)):
+        raise ValueError("'select' must be a list of column names or patterns.")
+    for rule in resolved["consistency_rules"]:
+        ConsistencyRule(rule)
+    for selector, column_rules in resolved["columns"].items():
+        _check_metrics(column_rules.get("metrics", []))
+        for spec in column_rules.get("validators", []):
+            if spec.get("type") not in VALIDATORS:
+                raise ValueError(f"Unknown validator '{spec.get('type')}' for columns '{selector}'.")
+        unknown = set(column_rules.get("tolerance") or {}) - {"atol", "rtol"}
+        if unknown:
+            raise ValueError(f"Unknown tolerance option(s) {', '.join(sorted(unknown))} for columns '{selector}'.")
+    return resolved
+
+
+def _check_metrics(metrics):
+    unknown = [metric for metric in metrics if metric not in METRIC_ORDER]
+    if unknown:
+        raise ValueError(f"Unknown metric(s): {', '.join(unknown)}. Use any of {', '.join(METRIC_ORDER)}.")
+
+
+def alert_thresholds(rules=None):
+    """Return the alert thresholds of a rule configuration."""
+    return resolve_rules(rules)["alerts"]
+
+
+def preprocess_options(rules=None):
+    """Return the preprocessing options of a rule configuration."""
+    return resolve_rules(rules)["preprocess"]
+
+
+# Column data shared by every check of one column
+class ColumnView:
+    """A column plus the intermediate arrays its checks share.
+
+    Each intermediate (missing mask, text form, numeric form) is computed on
+    first use and then reused, so all checks on a column make one pass per
+    representation instead of one pass per check. With ``nulls`` (the
+    ``NullMaskIndex`` of the column's frame) the missing mask and count come
+    from its bitmap.
+    """
+
+    def __init__(self, column, nulls=None):
+        self.column = column
+        self.size = len(column)
+        self._nulls = nulls
+        self._null_mask = None
+        self._text = None
+        self._numeric = None
+
+    @property
+    def null_mask(self):
+        if self._null_mask is None:
+            if self._nulls is not None:
+                self._null_mask = self._nulls.mask(self.column.name)
+            else:
+                self._null_mask = self.column.isna().to_numpy()
+        return self._null_mask
+
+    @property
+    def null_count(self):
+        if self._nulls is not None:
+            return self._nulls.count(self.column.name)
+        return int(self.null_mask.sum())
+
+    @property
+    def text(self):
+        """Values as strings (missing values become 'nan', like ``str(x)``)."""
+        if self._text is None:
+            self._text = self.column.astype(str)
+        return self._text
+
+    @property
+    def numeric(self):
+        """Values as float64; anything that is not a number becomes NaN."""
+        if self._numeric is None:
+            self._numeric = pd.to_numeric(self.column, errors="coerce").to_numpy(dtype=np.float64)
+        return self._numeric
+
+
+# Vectorized validators: each takes a ColumnView and returns a boolean array of valid rows
+def _regex_validator(spec):
+    pattern = spec["pattern"]
+    return lambda view: view.text.str.fullmatch(pattern).fillna(False).to_numpy(dtype=bool) & ~view.null_mask
+
+
+def _not_null_validator(spec):
+    return lambda view: ~view.null_mask
+
+
+def _non_empty_validator(spec):
+    return lambda view: (view.text.str.strip() != "").to_numpy() & ~view.null_mask
+
+
+def _range_validator(spec):
+    minimum = -np.inf if spec.get("min") is None else spec["min"]
+    maximum = np.inf if spec.get("max") is None else spec["max"]
+    return lambda view: (view.numeric >= minimum) & (view.numeric <= maximum)
+
+
+def _allowed_values_validator(spec):
+    allowed = list(spec["values"])
+    return lambda view: view.column.isin(allowed).to_numpy()
+
+
+def _max_length_validator(spec):
+    length = spec["length"]
+    return lambda view: (view.text.str.len() <= length).to_numpy() & ~view.null_mask
+
+
+VALIDATORS = {
+    "regex": _regex_validator,
+    "not_null": _not_null_validator,
+    "non_empty": _non_empty_validator,
+    "range": _range_validator,
+    "allowed_values": _allowed_values_validator,
+    "max_length": _max_length_validator,
+}
+
+
+def _matches(selector, column):
+    return selector == column or fnmatch.fnmatch(str(column).lower(), str(selector).lower())
+
+
+def selected_columns(rules, columns):
+    """The columns a rule configuration's ``select`` section picks, in the order of ``columns``."""
+    select = resolve_rules(rules)["select"]
+    if select is None:
+        return list(columns)
+    return [col for col in columns if any(_matches(selector, col) for selector in select)]
+
+
+# Compile a rule configuration into one scan per column
+def compile_scan_plan(rules, columns, selected_metrics=None):
+    """Group every check configured for a column into one column scan.
+
+    Args:
+        rules (dict, optional): Rule configuration; column selectors are exact
+            names or case-insensitive glob patterns (e.g. ``"*email*"``). Every
+            matching selector contributes its validators. A column's
+            ``tolerance`` (``{"atol": ..., "rtol": ...}``) makes accuracy on
+            numeric columns compare within that tolerance instead of exactly.
+        columns (iterable): Columns of the dataset.
+        selected_metrics (list, optional): Metrics to compute, overriding the
+            configured ``metrics``. Per-column ``metrics`` narrow it further.
+
+    Returns:
+        dict: Column name -> ``{"metrics": [...], "validators": [callable], "rules": [spec],
+        "tolerance": dict or None}``, with metrics in ``METRIC_ORDER``, for the
+        columns picked by ``select``.
+    """
+    rules = resolve_rules(rules)
+    base_metrics = list(selected_metrics) if selected_metrics is not None else rules["metrics"]
+    _check_metrics(base_metrics)
+
+    plan = {}
+    for col in selected_columns(rules, columns):
+        metrics = base_metrics
+        specs = []
+        tolerance = None
+        for selector, column_rules in rules["columns"].items():
+            if not _matches(selector, col):
+                continue
+            specs.extend(column_rules.get("validators", []))
+            if column_rules.get("tolerance"):
+                tolerance = {**(tolerance or {}), **column_rules["tolerance"]}
+            if "metrics" in column_rules:
+                metrics = [metric for metric in column_rules["metrics"] if metric in base_metrics]
+
+        plan[col] = {
+            "metrics": [metric for metric in METRIC_ORDER if metric in metrics],
+            "validators": [VALIDATORS[spec["type"]](spec) for spec in specs],
+            "rules": specs,
+            "tolerance": tolerance,
+        }
+    return plan
+
+
+def validity_mask(view, validators):
+    """Rows of a column that pass every validator (one vectorized pass each)."""
+    valid = np.ones(view.size, dtype=bool)
+    for validator in validators:
+        valid &= validator(view)
+    return valid
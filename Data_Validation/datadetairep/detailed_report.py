@@ -4,6 +4,17 @@ import numpy as np
 import pandas as pd
 import io
 import base64
+import json
+import html
+from Data_Validation.datasktch.quantile_sketch import iqr_bounds
+from Data_Validation.datasktch.heavy_hitters import track_top_values
+from Data_Validation.datainstr.instrumentation import stage, column_timer
+from Data_Validation.datadupl.duplicate_detection import find_duplicates
+from Data_Validation.datastats.dataset_statistics import compute_dataset_statistics
+from Data_Validation.datastats.moments import MomentsAccumulator
+from Data_Validation.datastats.wide_table import correlation_pairs, is_wide, wide_column_statistics, wide_correlation_pairs
+from Data_Validation.dataconf.rule_config import DEFAULT_ALERT_THRESHOLDS
+from Data_Validation.datanull.null_mask_index import NullMaskIndex
 
 # Function to dynamically represent memory usage
 def format_memory_size(bytes_size):
@@ -14,112 +25,412 @@ def format_memory_size(bytes_size):
         index += 1
     return f"{bytes_size:.2f} {units[index]}"
 
-def generate_alerts(df):
+def generate_alerts(df, sketches=None, duplicates=None, thresholds=None, output="messages", top_values=None,
+                    wide=None, nulls=None):
+    # sketches: optional {column: QuantileSketch} from a streaming pass, used for the IQR check
+    # duplicates: optional summary from find_duplicates, so rows are not hashed again
+    # top_values: optional {column: HeavyHitters} from track_top_values, used for the cardinality alerts
+    # wide: compute per-column figures a dtype block at a time (see datastats.wide_table);
+    #       by default for frames with WIDE_TABLE_MIN_COLUMNS columns or more
+    # thresholds: optional overrides of DEFAULT_ALERT_THRESHOLDS (the 'alerts' section of the rules)
+    # nulls: optional NullMaskIndex of df, for the missing counts
+    # output: "messages" (list of strings), "records" (list of dicts, see alert_records) or
+    #         "counts" ({alert type: count}, no message is formatted)
+    thresholds = {**DEFAULT_ALERT_THRESHOLDS, **(thresholds or {})}
+    records = alert_records(alert_facts(df, sketches, duplicates, thresholds, top_values, wide, nulls), thresholds)
+    if output == "records":
+        return [dict(record, message=alert_message(record)) for record in records]
+    if output == "counts":
+        return alert_counts(records)
+    if output != "messages":
+        raise ValueError("output must be 'messages', 'records' or 'counts'.")
+    return [alert_message(record) for record in records]
+
+
+# Figures the alerts are built from; the partitioned executor builds the same dictionary from partials
+def alert_facts(df, sketches=None, duplicates=None, thresholds=None, top_values=None, wide=None, nulls=None):
+    sketches = sketches or {}
+    thresholds = {**DEFAULT_ALERT_THRESHOLDS, **(thresholds or {})}
+    if duplicates is None:
+        duplicates = find_duplicates(df)
+    if nulls is None:
+        nulls = NullMaskIndex.from_frame(df)
+
+    numeric_columns = df.select_dtypes(include=['int64', 'float64']).columns
+    wide = is_wide(df, wide)
+    facts = {
+        "rows": len(df),
+        "dtypes": df.dtypes.to_dict(),
+        "missing": nulls.null_counts(),
+        "duplicate_rows": duplicates["duplicate_rows"],
+        # Only the pairs at or above the threshold are kept (the wide path never builds the whole matrix)
+        "correlation_pairs": wide_correlation_pairs(df, thresholds["correlation"]) if wide
+        else correlation_pairs(df.corr(numeric_only=True), thresholds["correlation"]),
+        "numeric_columns": list(numeric_columns),
+        "negatives": {},
+        "distinct": {},
+        "outliers": {},
+    }
+
+    # Most frequent values of the text, categorical and boolean columns
+    with stage("generate_alerts.top_values"):
+        facts["top_values"] = top_values if top_values is not None else track_top_values(df)
+
+    wide_statistics = None
+    if wide:
+        # Negative and distinct counts and moments from one reduction per dtype block
+        with stage("generate_alerts.wide_statistics"):
+            wide_statistics = wide_column_statistics(df, nulls=nulls)
+        facts["negatives"] = wide_statistics.loc[numeric_columns, "negatives"].astype(np.int64).to_dict()
+        facts["distinct"] = wide_statistics["distinct"].astype(np.int64).to_dict()
+    else:
+        for col in numeric_columns:
+            with column_timer("generate_alerts.negative_values", col):
+                facts["negatives"][col] = (df[col] < 0).sum()
+
+        for col in df.columns:
+            with column_timer("generate_alerts.distinct_values", col):
+                facts["distinct"][col] = df[col].nunique(dropna=True)  # Exclude NaNs from unique count
+
+    # Outliers (using IQR)
+    for col in numeric_columns:
+        with column_timer("generate_alerts.outliers", col):
+            lower_bound, upper_bound = iqr_bounds(sketches.get(col) or df[col], thresholds["iqr_multiplier"])
+            facts["outliers"][col] = ((df[col] < lower_bound) | (df[col] > upper_bound)).sum()
+
+    # Variance, skewness and kurtosis of all numeric columns from one pass
+    if wide_statistics is not None:
+        facts.update(moment_facts(wide_statistics.loc[numeric_columns]))
+    else:
+        with stage("generate_alerts.moments"):
+            facts.update(moment_facts(MomentsAccumulator(numeric_columns).update_frame(df)))
+    return facts
+
+
+def moment_facts(moments):
+    """The ``alert_facts`` entries read from a ``MomentsAccumulator`` (or a table of its ``summary`` columns)."""
+    summary = moments.summary() if isinstance(moments, MomentsAccumulator) else moments
+    return {key: summary[key].to_dict() for key in ("variance", "coefficient_of_variation", "skewness", "kurtosis")}
+
+
+# Severity and message of each alert type
+ALERT_TYPES = {
+    "missing_values": ("warning", "ALERT: '{column}' has {value} missing values ({percentage:.2f}%)."),
+    "duplicate_rows": ("warning", "ALERT: Dataset contains {value} duplicate rows ({percentage:.2f}%)."),
+    "high_correlation": ("info", "ALERT: '{column}' is highly correlated with '{related}' (correlation: {value:.2f})."),
+    "multiple_correlations": ("info", "ALERT: '{column}' is overall highly correlated with multiple columns ({value} columns)."),
+    "negative_values": ("info", "ALERT: '{column}' contains {value} negative values."),
+    "constant": ("warning", "ALERT: '{column}' has low variance, with only one unique value across the dataset."),
+    "low_cardinality": ("info", "ALERT: '{column}' has low cardinality (only {value} unique values)."),
+    "empty": ("critical", "ALERT: '{column}' is entirely empty or contains only missing values."),
+    "unique": ("info", "ALERT: '{column}' has unique values across all rows (unique distribution)."),
+    "near_unique": ("info", "ALERT: '{column}' is nearly unique ({value} unique values, {duplicates} duplicates)."),
+    "outliers": ("warning", "ALERT: '{column}' has {value} potential outliers."),
+    "skewed": ("info", "ALERT: '{column}' is significantly skewed (skewness: {value:.2f})."),
+    "high_kurtosis": ("info", "ALERT: '{column}' has high kurtosis (kurtosis: {value:.2f})."),
+    "high_variation": ("info", "ALERT: '{column}' varies widely around its mean (coefficient of variation: {value:.2f})."),
+    "dominant_value": ("info", "ALERT: '{column}' is dominated by one value ({percentage:.2f}% of its values are '{value}')."),
+    "low_variance": ("warning", "ALERT: '{column}' has near-zero variance (variance: {value:.3g}, coefficient of variation: {coefficient_of_variation:.4f})."),
+}
+
+
+def _alert(alert_type, column, value, **details):
+    record = {"type": alert_type, "column": column, "severity": ALERT_TYPES[alert_type][0], "value": _plain_number(value)}
+    record.update({key: _plain_number(detail) for key, detail in details.items()})
+    return record
+
+
+def _plain_number(value):
+    # numpy scalars become Python numbers so records serialize to JSON
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def alert_records(facts, thresholds=None):
+    """Alerts as ``{"type", "column", "severity", "value", ...}`` dictionaries.
+
+    Built from ``alert_facts`` without formatting any text; ``alert_message``
+    turns a record into the message ``generate_alerts`` returns. Dataset-level
+    alerts (duplicate rows) have ``column`` None.
+    """
+    thresholds = {**DEFAULT_ALERT_THRESHOLDS, **(thresholds or {})}
+    n_rows = facts["rows"]
     alerts = []
 
     # Missing Values
-    missing_values = df.isnull().sum()
-    for col, count in missing_values.items():
+    for col, count in facts["missing"].items():
         if count > 0:
-            percentage = (count / len(df)) * 100
-            alerts.append(f"ALERT: '{col}' has {count} missing values ({percentage:.2f}%).")
+            alerts.append(_alert("missing_values", col, count, percentage=(count / n_rows) * 100))
 
     #Duplicate Rows 
-    duplicate_rows = df.duplicated().sum()
+    duplicate_rows = facts["duplicate_rows"]
     if duplicate_rows > 0:
-        alerts.append(f"ALERT: Dataset contains {duplicate_rows} duplicate rows ({(duplicate_rows / len(df)) * 100:.2f}%).")
+        alerts.append(_alert("duplicate_rows", None, duplicate_rows, percentage=(duplicate_rows / n_rows) * 100))
 
     #High Correlation
-    correlation_matrix = df.corr(numeric_only=True)
-    threshold = 0.85 
+    pairs = facts["correlation_pairs"]
+    threshold = thresholds["correlation"]
     overall_correlations = {}
-    for col1 in correlation_matrix.columns:
-        for col2 in correlation_matrix.columns:
-            if col1 != col2 and abs(correlation_matrix.loc[col1, col2]) > threshold:
-                alerts.append(
-                    f"ALERT: '{col1}' is highly correlated with '{col2}' (correlation: {correlation_matrix.loc[col1, col2]:.2f})."
-                )
-                if col1 not in overall_correlations:
-                    overall_correlations[col1] = 0
-                if col2 not in overall_correlations:
-                    overall_correlations[col2] = 0
-                overall_correlations[col1] += 1
-                overall_correlations[col2] += 1
+    # Each pair is reported from both sides, row by row in column order, as a scan of the whole matrix would
+    position = {col: i for i, col in enumerate(facts["dtypes"])}
+    strong = pairs[pairs["correlation"].abs() > threshold]
+    directed = list(zip(strong["column"], strong["related"], strong["correlation"]))
+    directed += [(col2, col1, value) for col1, col2, value in directed]
+    directed.sort(key=lambda pair: (position[pair[0]], position[pair[1]]))
+    for col1, col2, value in directed:
+        alerts.append(_alert("high_correlation", col1, value, related=col2))
+        if col1 not in overall_correlations:
+            overall_correlations[col1] = 0
+        if col2 not in overall_correlations:
+            overall_correlations[col2] = 0
+        overall_correlations[col1] += 1
+        overall_correlations[col2] += 1
 
     for col, count in overall_correlations.items():
         if count > 1:  
-            alerts.append(f"ALERT: '{col}' is overall highly correlated with multiple columns ({count} columns).")
+            alerts.append(_alert("multiple_correlations", col, count))
 
     #Negative Values
-    numeric_columns = df.select_dtypes(include=['int64', 'float64']).columns
-    for col in numeric_columns:
-        if (df[col] < 0).any():
-            negative_count = (df[col] < 0).sum()
-            alerts.append(f"ALERT: '{col}' contains {negative_count} negative values.")
+    for col, negative_count in facts["negatives"].items():
+        if negative_count > 0:
+            alerts.append(_alert("negative_values", col, negative_count))
 
     # Low Variance
-    for col in df.columns: 
-        if df[col].nunique() == 1:
-            alerts.append(f"ALERT: '{col}' has low variance, with only one unique value across the dataset.")
-        elif df[col].nunique() < 5 and df[col].dtype == 'object': 
-            alerts.append(f"ALERT: '{col}' has low cardinality (only {df[col].nunique()} unique values).") 
+    top_values = facts.get("top_values", {})
+    for col, unique_count in facts["distinct"].items():
+        if unique_count == 1:
+            alerts.append(_alert("constant", col, unique_count))
+        elif facts["dtypes"][col] == 'object':
+            # A top-values summary is exact below its capacity; past it the column is not low-cardinality
+            tracker = top_values.get(col)
+            if tracker is not None and tracker.capacity >= thresholds["low_cardinality"]:
+                unique_count = tracker.distinct()
+            if unique_count is not None and unique_count < thresholds["low_cardinality"]:
+                alerts.append(_alert("low_cardinality", col, unique_count))
+
+    # Dominant Values (lower bound of the top count, so approximate counts never overstate it)
+    for col, tracker in top_values.items():
+        top = tracker.top(1)
+        if len(tracker.counters) > 1 and top[0]["count"] - top[0]["error"] > tracker.n * thresholds["dominant_value_ratio"]:
+            alerts.append(_alert("dominant_value", col, top[0]["value"], percentage=top[0]["percentage"]))
 
     # Unique Value Columns
-    for col in df.columns:
-        try:
-            # Handle empty or all-null columns
-            if df[col].isnull().all():
-                alerts.append(f"ALERT: '{col}' is entirely empty or contains only missing values.")
-                continue
-
-            # Handle numeric, categorical, and mixed-type columns
-            unique_count = df[col].nunique(dropna=True)  # Exclude NaNs from unique count
-            total_count = len(df[col])
-
-            if unique_count == total_count:
-                alerts.append(f"ALERT: '{col}' has unique values across all rows (unique distribution).")
-            elif unique_count > total_count * 0.95:  # Mostly unique values
-                alerts.append(f"ALERT: '{col}' is nearly unique ({unique_count} unique values, {total_count - unique_count} duplicates).")
-        except Exception as e:
-            # Log any issues with a column that cannot be processed
-            alerts.append(f"WARNING: Could not process column '{col}' due to {str(e)}.")
+    for col, unique_count in facts["distinct"].items():
+        # Handle empty or all-null columns
+        if facts["missing"][col] == n_rows:
+            alerts.append(_alert("empty", col, facts["missing"][col]))
+            continue
+
+        if unique_count == n_rows:
+            alerts.append(_alert("unique", col, unique_count))
+        elif unique_count > n_rows * thresholds["near_unique_ratio"]:  # Mostly unique values
+            alerts.append(_alert("near_unique", col, unique_count, duplicates=n_rows - unique_count))
 
     # Outliers (using IQR) 
-    for col in numeric_columns:
-        Q1 = df[col].quantile(0.25)
-        Q3 = df[col].quantile(0.75)
-        IQR = Q3 - Q1
-        lower_bound = Q1 - 1.5 * IQR
-        upper_bound = Q3 + 1.5 * IQR
-        outliers = df[(df[col] < lower_bound) | (df[col] > upper_bound)]
-        if len(outliers) > 0:
-            alerts.append(f"ALERT: '{col}' has {len(outliers)} potential outliers.")
+    for col, outlier_count in facts["outliers"].items():
+        if outlier_count > 0:
+            alerts.append(_alert("outliers", col, outlier_count))
 
     #Skewness and Kurtosis
-    for col in numeric_columns:
-        skewness = df[col].skew()
-        kurtosis = df[col].kurtosis()
-        if abs(skewness) > 1:  # Threshold for significant skewness
-            alerts.append(f"ALERT: '{col}' is significantly skewed (skewness: {skewness:.2f}).")
-        if abs(kurtosis) > 3:  # Threshold for significant kurtosis
-            alerts.append(f"ALERT: '{col}' has high kurtosis (kurtosis: {kurtosis:.2f}).")
+    for col in facts["numeric_columns"]:
+        skewness = facts["skewness"][col]
+        kurtosis = facts["kurtosis"][col]
+        if abs(skewness) > thresholds["skewness"]:  # Threshold for significant skewness
+            alerts.append(_alert("skewed", col, skewness))
+        if abs(kurtosis) > thresholds["kurtosis"]:  # Threshold for significant kurtosis
+            alerts.append(_alert("high_kurtosis", col, kurtosis))
+
+    # Variance and Coefficient of Variation (undefined, and skipped, where the mean is zero)
+    for col in facts["numeric_columns"]:
+        variation = facts["coefficient_of_variation"][col]
+        if np.isnan(variation):
+            continue
+        if variation > thresholds["coefficient_of_variation"]:
+            alerts.append(_alert("high_variation", col, variation))
+        # Identifiers (near-unique values) have a small spread around a large offset by design
+        elif (facts["variance"][col] > 0 and variation < thresholds["min_coefficient_of_variation"]
+              and facts["distinct"][col] <= n_rows * thresholds["near_unique_ratio"]):
+            alerts.append(_alert("low_variance", col, facts["variance"][col], coefficient_of_variation=variation))
 
     return alerts
 
 
-def generate_detailed_report(df, detailed_scores_df, overall_score):
+def alert_message(record):
+    """The text of one alert record."""
+    return ALERT_TYPES[record["type"]][1].format(**record)
+
+
+def alert_counts(records):
+    """Number of alerts of each type, e.g. for dashboards that only need totals."""
+    counts = {}
+    for record in records:
+        counts[record["type"]] = counts.get(record["type"], 0) + 1
+    return counts
+
+
+def format_alerts(facts, thresholds=None):
+    """Alert messages for ``alert_facts`` (see ``alert_records``)."""
+    return [alert_message(record) for record in alert_records(facts, thresholds)]
+
+
+# Render the present/missing values bar chart as a base64 PNG
+def generate_missing_values_chart(features, present_data, missing_data):
+    plt.figure(figsize=(14, 10))  
+    bar_width = 0.8
+
+    bar1 = plt.bar(features, present_data, color="#3498db", label="Present Values", width=bar_width)
+    bar2 = plt.bar(features, missing_data, bottom=present_data, color="#e74c3c", label="Missing Values", width=bar_width)
+
+    for bar in bar1:
+        height = bar.get_height()
+        plt.text(
+            bar.get_x() + bar.get_width() / 2,
+            height / 2,
+            f'{int(height)}',
+            ha='center',
+            va='center',
+            fontsize=12,
+            fontweight='bold',
+            color='white',
+            bbox=dict(facecolor='black', alpha=0.6, edgecolor='none', boxstyle='round,pad=0.3')
+        )
+
+    for bar in bar2:
+        height = bar.get_height()
+        if height > 0:
+            plt.text(
+                bar.get_x() + bar.get_width() / 2,
+                bar.get_y() + height / 2,
+                f'{int(height)}',
+                ha='center',
+                va='center',
+                fontsize=12,
+                fontweight='bold',
+                color='white',
+                bbox=dict(facecolor='black', alpha=0.6, edgecolor='none', boxstyle='round,pad=0.3')
+            )
+
+    plt.xlabel("Columns", fontsize=14)
+    plt.ylabel("Number of values", fontsize=14)
+    plt.xticks(rotation=45, ha='right', fontsize=12)
+    plt.legend(loc="upper right", fontsize=12)
+    plt.tight_layout()
+
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format="png", dpi=100)
+    buffer.seek(0)
+    chart = base64.b64encode(buffer.getvalue()).decode("utf-8")
+    buffer.close()
+    plt.close()
+    return chart
+
+
+# Render the co-missing column groups and the most frequent row signatures
+def render_missingness_patterns(patterns):
+    if not patterns["rows_with_nulls"]:
+        return "<p class='section-description'>No row has a missing value.</p>"
+    rows = patterns["rows"]
+    html = [f"""<div class="missingness-patterns">
+        <p class="section-description">{patterns['rows_with_nulls']} of {rows} rows
+        ({patterns['rows_with_nulls'] / rows * 100:.2f}%) have at least one missing value.</p>"""]
+
+    if patterns["groups"]:
+        html.append("<h4>Columns Missing Together</h4><table><tr><th>Columns</th><th>Missing Together</th>"
+                    "<th>Missing In Any</th><th>Similarity</th></tr>")
+        for group in patterns["groups"]:
+            html.append(f"<tr><td>{', '.join(map(str, group['columns']))}</td><td>{group['missing_together']}</td>"
+                        f"<td>{group['missing_any']}</td><td>{group['jaccard']:.2f}</td></tr>")
+        html.append("</table>")
+
+    html.append("<h4>Most Frequent Missing-Value Patterns</h4><table><tr><th>Missing Columns</th>"
+                "<th>Rows</th><th>Rows (%)</th></tr>")
+    for signature in patterns["signatures"]:
+        html.append(f"<tr><td>{', '.join(map(str, signature['columns']))}</td><td>{signature['rows']}</td>"
+                    f"<td>{signature['percentage']:.2f}%</td></tr>")
+    html.append("</table></div>")
+    return "\n".join(html)
+
+
+# Render the most frequent values of each tracked column
+def render_top_values(top_values, k=10):
+    if not top_values:
+        return "<p class='section-description'>No text, categorical or boolean column to summarize.</p>"
+    html_parts = ["<div class='top-values-grid'>"]
+    for col, tracker in top_values.items():
+        html_parts.append(f"<div class='top-values-column'><h4>{html.escape(str(col))}</h4>"
+                          "<table><tr><th>Value</th><th>Count</th><th>Share (%)</th></tr>")
+        for entry in tracker.top(k):
+            # Approximate counts are shown as the range the true count lies in
+            count = f"{entry['count'] - entry['error']}–{entry['count']}" if entry["error"] else f"{entry['count']}"
+            html_parts.append(f"<tr><td>{html.escape(str(entry['value']))}</td><td>{count}</td>"
+                              f"<td>{entry['percentage']:.2f}%</td></tr>")
+        if not tracker.n:
+            html_parts.append("<tr><td colspan='3'>No values</td></tr>")
+        html_parts.append("</table></div>")
+    html_parts.append("</div>")
+    return "\n".join(html_parts)
+
+
+# Render the bar chart and heatmap of one column's scores as base64 PNGs
+def generate_column_charts(col, values, metrics):
+    # Generate Bar Chart
+    plt.figure(figsize=(18, 12))  
+
+    plt.bar(metrics, values, color='#3498db')
+    plt.title(f"{col}", fontsize=20)
+    plt.xticks(rotation=45,fontsize=16)
+    plt.yticks(fontsize=16)
+    plt.tight_layout(rect=[0, 0, 1, 0.96]) 
+
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format='png', dpi=100)
+    buffer.seek(0)
+    bar_chart = base64.b64encode(buffer.getvalue()).decode('utf-8')
+    buffer.close()
+    plt.close()
+
+    # Generate Heatmap
+    plt.figure(figsize=(18, 12))  
+
+    sns.heatmap(np.array(values).reshape(1, -1), annot=True,annot_kws={"size": 20}, fmt=".2f", cmap="coolwarm", cbar=False, xticklabels=metrics, yticklabels=[col])
+    plt.title(f"{col}", fontsize=20)
+    plt.xticks(rotation=45,fontsize=16)
+    plt.yticks(fontsize=16)
+    plt.tight_layout(rect=[0, 0, 1, 0.96])  
+
+    buffer = io.BytesIO()
+    plt.savefig(buffer, format='png', dpi=100)
+    buffer.seek(0)
+    heatmap = base64.b64encode(buffer.getvalue()).decode('utf-8')
+    buffer.close()
+    plt.close()
+
+    return {'bar_chart': bar_chart, 'heatmap': heatmap}
+
+
+def generate_detailed_report(df, detailed_scores_df, overall_score, duplicates=None, alert_thresholds=None, nulls=None):
     try:
+        # Row and column hashes are computed once and shared with the alerts
+        if duplicates is None:
+            duplicates = find_duplicates(df)
+        # Missing-value bitmaps, shared by the statistics, the alerts and the missing values section
+        if nulls is None:
+            nulls = NullMaskIndex.from_frame(df)
+
         # Step 1: Calculate Dataset Statistics and Variable Types
+        # Dataset-wide figures are merged from per-column partials (no df.values copy)
+        with stage("dataset_statistics"):
+            raw_statistics = compute_dataset_statistics(df, duplicates=duplicates, nulls=nulls)
+        total_cells = raw_statistics["total_cells"]
         dataset_statistics = {
-            "Number of Rows": len(df),
-            "Number of Columns": df.shape[1],
-            "Missing Cells": df.isnull().sum().sum(),
-            "Missing Cells (%)": f"{(df.isnull().sum().sum() / (len(df) * df.shape[1])) * 100:.2f}%",  # Missing cells percentage
-            "Unique Values": len(pd.unique(df.values.ravel())),  # Unique values in the dataset
-            "Unique Values (%)": f"{(len(pd.unique(df.values.ravel())) / (len(df) * df.shape[1])) * 100:.2f}%",  # Unique values percentage
-            "Duplicate Rows": df.duplicated().sum(),
-            "Duplicate Rows (%)": f"{(df.duplicated().sum() / len(df)) * 100:.2f}%",  # Duplicate rows percentage
-            "Total Memory Usage": format_memory_size(df.memory_usage(deep=True).sum())  # Memory usage
+            "Number of Rows": raw_statistics["rows"],
+            "Number of Columns": raw_statistics["columns"],
+            "Missing Cells": raw_statistics["missing_cells"],
+            "Missing Cells (%)": f"{(raw_statistics['missing_cells'] / total_cells) * 100:.2f}%",  # Missing cells percentage
+            "Unique Values": raw_statistics["distinct_cells"],  # Unique values in the dataset
+            "Unique Values (%)": f"{(raw_statistics['distinct_cells'] / total_cells) * 100:.2f}%",  # Unique values percentage
+            "Duplicate Rows": raw_statistics["duplicate_rows"],
+            "Duplicate Rows (%)": f"{(raw_statistics['duplicate_rows'] / len(df)) * 100:.2f}%",  # Duplicate rows percentage
+            "Total Memory Usage": format_memory_size(raw_statistics["memory_bytes"])  # Memory usage
         }
 
         variable_types = {
@@ -135,9 +446,7 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
         # Step 3: Initialize HTML Content
         html_content = []
 
-        # Add external CSS file
-        html_content.append("""<link rel="stylesheet" type="text/css" href="Data_Validation\\datadetairep\\Gde.css">""")
-        html_content.append(""" <script src="Data_Validation\\datadetairep\\DR.js"></script> """)
+        # Styles and scripts (Gde.css, DR.js) come from the page's shared asset bundle (see datarender.templates)
 
         # Add navigation bar
         html_content.append("""<div class="navigation-bar"><ul>
@@ -145,120 +454,68 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
             <li><a href="#detailed-scores">Column-Wise Quality Scores</a></li>
             <li><a href="#average-scores">Average Quality Scores</a></li>
             <li><a href="#missing-values">Missing Values Analysis</a></li>
+            <li><a href="#top-values">Top Values</a></li>
             <li><a href="#visualizations">Visualizations</a></li>
         </ul></div>""")
 
+        # Most frequent values, shared by the cardinality alerts and the Top Values section
+        with stage("top_values"):
+            top_values = track_top_values(df)
+
         # Generate alerts
-        alerts = generate_alerts(df)
+        with stage("alerts"):
+            alerts = generate_alerts(df, duplicates=duplicates, thresholds=alert_thresholds, output="records",
+                                     top_values=top_values, nulls=nulls)
         alerts_count = len(alerts)
 
         # Overview and Alerts Buttons Section
         html_content.append(f"""
-        <div class="button-container" style="display: flex; gap: 10px; padding: 10px;">
-            <button class="overview-button" onclick="toggleOverview()" 
-                    style="padding: 10px 20px; font-size: 14px; border-radius: 5px; border: none; background-color: #3498db; color: white; cursor: pointer;">
-                Overview
-            </button>
-            <button id="alerts-button" class="alerts-button" onclick="toggleAlerts()" 
-                    style="padding: 10px 20px; font-size: 14px; border-radius: 5px; border: none; background-color: #e74c3c; color: white; cursor: pointer;">
-                Alerts({alerts_count})
-            </button>
+        <div class="button-container">
+            <button class="overview-button" onclick="toggleOverview()">Overview</button>
+            <button id="alerts-button" class="alerts-button" onclick="toggleAlerts()">Alerts({alerts_count})</button>
         </div>
         """)
 
         html_content.append("""
-<div id="alerts-section" style="display: none; padding: 30px; background: linear-gradient(145deg, #fdfbfb, #ebedee); border-radius: 20px; box-shadow: 0 10px 20px rgba(0, 0, 0, 0.1), 0 -5px 15px rgba(255, 255, 255, 0.6); font-family: 'Poppins', sans-serif; color: #34495e;">
-    <h2 style="text-align: center; color: #2c3e50; font-weight: 700; margin-bottom: 25px; letter-spacing: 1.2px; text-transform: uppercase;">🚨 Dataset Alerts</h2>
-    <div id="alerts-content" style="padding: 20px; border-top: 2px solid rgba(0, 0, 0, 0.1);">
-        <p style="text-align: center; color: rgba(44, 62, 80, 0.6); font-style: italic;">Scanning for alerts...</p>
+<div id="alerts-section">
+    <h2>🚨 Dataset Alerts</h2>
+    <div id="alerts-content">
+        <p class="alerts-placeholder">Scanning for alerts...</p>
     </div>
 </div>
-
 """)
 
-        alerts_js = ", ".join([f'"{alert}"' for alert in alerts])
-
-        # JavaScript for toggling sections and displaying alerts
-        html_content.append(f"""
-        <script>
-            function toggleOverview() {{
-                const sections = ['dataset-statistics', 'detailed-scores', 'average-scores', 'missing-values', 'visualizations','overall-score'];
-                sections.forEach(section => {{
-                    const elem = document.getElementById(section);
-                    if (elem) elem.style.display = 'block';
-                }});
-                document.getElementById('alerts-section').style.display = 'none';
-            }}
-
-            function toggleAlerts() {{
-                const datasetStatistics = document.getElementById('dataset-statistics');
-                const detailedScores = document.getElementById('detailed-scores');
-                const averageScores = document.getElementById('average-scores');
-                const missingValues = document.getElementById('missing-values');
-                const visualizations = document.getElementById('visualizations');
-                const alertsSection = document.getElementById('alerts-section');
-                const overallScore = document.getElementById('overall-score');
-                const charts = document.querySelectorAll('.charts-side-by-side');
-
-                if (datasetStatistics) datasetStatistics.style.display = 'none';
-                if (detailedScores) detailedScores.style.display = 'none';
-                if (averageScores) averageScores.style.display = 'none';
-                if (missingValues) missingValues.style.display = 'none';
-                if (visualizations) visualizations.style.display = 'none';
-                if(overallScore) overallScore.style.display = 'none';
-                charts.forEach(chart => chart.style.display = 'none');
-                if (alertsSection) {{
-                    alertsSection.style.display = 'block';
-
-                    const alertsContent = document.getElementById('alerts-content');
-                    const alerts = [{alerts_js}];
-
-                    if (alerts.length > 0) {{
-                        let alertList = '<ul>';
-                        alerts.forEach(alert => {{
-                            alertList += `<li>${{alert}}</li>`; 
-                        }});
-                        alertList += '</ul>';
-                        alertsContent.innerHTML = alertList;
-                    }} else {{
-                        alertsContent.innerHTML = '<p>No alerts found for this dataset.</p>';
-                    }}
-                }}
-            }}
-        </script>
-        """)
+        # Alert records as one JSON payload; report.js groups, filters and lists them with textContent
+        alerts_json = json.dumps(alerts, separators=(",", ":"), default=str).replace("<", "\\u003c")
+        html_content.append(f"""<script type="application/json" id="alerts-data">{alerts_json}</script>""")
 
         # Step 4: Dataset Statistics and Variable Types Section
-        html_content.append("""<div id='dataset-statistics' class='statistics-container' style="display: flex; justify-content: space-between; gap: 20px; padding: 20px; background-color: #f4f6f9; max-width: 1200px; margin: 20px auto; border-radius: 12px; box-shadow: 0 8px 16px rgba(0, 0, 0, 0.1);">
-             <div class='statistics-section' style="flex: 1; padding: 20px; background-color: #fff; border-radius: 12px; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1); transition: transform 0.2s ease, box-shadow 0.2s ease;">
-                 <h6 class='section-title' style="font-size: 1.2em; font-weight: bold; color: #2c3e50; margin-bottom: 20px; border-bottom: 3px solid #3498db; padding-bottom: 10px;">Dataset Statistics</h6>
-                 <table style="width: 100%; border-collapse: collapse; margin-top: 10px;">""")
+        html_content.append("""<div id='dataset-statistics' class='statistics-container'>
+             <div class='statistics-section'>
+                 <h6 class='section-title'>Dataset Statistics</h6>
+                 <table>""")
 
         for key, value in dataset_statistics.items():
             if isinstance(value, dict):  # Handle dictionary values (Unique Values and Data Types)
-                html_content.append(f"<tr><td colspan='2' style='padding: 8px; font-size: 1.0em; color: #34495e; text-align: left; font-weight: 500;'>{key}</td></tr>")
+                html_content.append(f"<tr><td colspan='2' class='stat-key'>{key}</td></tr>")
                 for sub_key, sub_value in value.items():
-                    html_content.append(f"<tr><td style='padding: 8px; font-size: 1.0em; color: #34495e; text-align: left; font-weight: 500;'>{sub_key}</td><td style='padding: 8px; font-size: 1.0em; color: #7f8c8d; text-align: left;'>{sub_value}</td></tr>")
+                    html_content.append(f"<tr><td class='stat-key'>{sub_key}</td><td class='stat-value'>{sub_value}</td></tr>")
             else:
-                html_content.append(f"<tr style='border-bottom: 1px solid #e9ecef; transition: background-color 0.2s ease;'><td style='padding: 8px; font-size: 1.0em; color: #34495e; text-align: left; font-weight: 500;'>{key}</td><td style='padding: 8px; font-size: 1.0em; color: #7f8c8d; text-align: left;'>{value}</td></tr>")
+                html_content.append(f"<tr class='stat-row'><td class='stat-key'>{key}</td><td class='stat-value'>{value}</td></tr>")
 
         html_content.append("""</table></div>
-             <div class='statistics-section' style="flex: 1; padding: 20px; background-color: #fff; border-radius: 12px; box-shadow: 0 4px 12px rgba(0, 0, 0, 0.1); transition: transform 0.2s ease, box-shadow 0.2s ease;">
-                 <h6 class='section-title' style="font-size: 1.2em; font-weight: bold; color: #2c3e50; margin-bottom: 20px; border-bottom: 3px solid #2ecc71; padding-bottom: 10px;">Variable Types</h6>
-                 <table style="width: 100%; border-collapse: collapse; margin-top: 10px;">""")
+             <div class='statistics-section variable-types'>
+                 <h6 class='section-title'>Variable Types</h6>
+                 <table>""")
 
         for key, value in variable_types.items():
-            html_content.append(f"<tr style='border-bottom: 1px solid #e9ecef; transition: background-color 0.2s ease;'><td style='padding: 8px; font-size: 1.0em; color: #34495e; text-align: left; font-weight: 500;'>{key}</td><td style='padding: 8px; font-size: 1.0em; color: #7f8c8d; text-align: left;'>{value}</td></tr>")
+            html_content.append(f"<tr class='stat-row'><td class='stat-key'>{key}</td><td class='stat-value'>{value}</td></tr>")
 
-        html_content.append("""</table></div></div>
-         <style>
-             .statistics-section:hover { transform: scale(1.02); box-shadow: 0 8px 16px rgba(0, 0, 0, 0.15); }
-             tr:hover { background-color: #f1f5f8; }
-         </style>""")
-        
-        html_content.append(""" <div id="overall-quality-score" style="margin-top: 20px; display: none;">
+        html_content.append("""</table></div></div>""")
+
+        html_content.append(""" <div id="overall-quality-score">
     <h4>Overall Quality Score</h4>
-    <p id="overall-score-value" style="font-size: 1.2em; font-weight: bold;">0.00%</p>
+    <p id="overall-score-value">0.00%</p>
 </div>
  """)
         
@@ -279,13 +536,13 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
         # Add containers to display column-wise scores dynamically
         html_content.append("<div id='scores-table-container'>")
         html_content.append("<h4>Quality Scores</h4>")
-        html_content.append("<table id='scores-table' style='display: none; border-collapse: collapse; width: 100%;'>")  
+        html_content.append("<table id='scores-table'>")
         html_content.append("<thead id='table-header'>") 
         html_content.append("<tr><th>Column</th>")
 
         # Add column headers for each metric
         for metric in metrics:
-            html_content.append(f"<th id='header-{metric}' style='display: none;'>{metric} Score (%)</th>")
+            html_content.append(f"<th id='header-{metric}' class='metric-header'>{metric} Score (%)</th>")
 
         html_content.append("</tr></thead><tbody id='table-body'>")
 
@@ -293,11 +550,7 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
         for col, scores in detailed_scores_df.iterrows():
             html_content.append(f"<tr><td>{col}</td>")
             for metric in metrics:
-                html_content.append(f"""
-                    <td id="score-{metric}-{col}" style="display: none; text-align: center;">
-                        {scores.get(metric, 0):.2f}%
-                    </td>
-                """)
+                html_content.append(f"""<td id="score-{metric}-{col}" class="metric-score">{scores.get(metric, 0):.2f}%</td>""")
             html_content.append("</tr>")
 
         html_content.append("</tbody></table></div>")
@@ -348,57 +601,13 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
 
 
         # Step 6: Move Missing Values Analysis Section here (after Average Scores)
-        missing_data = df.isnull().sum()
-        present_data = df.notnull().sum()
+        # Counts and missingness patterns come from the frame's null-mask bitmaps
+        missing_data = pd.Series(nulls.null_counts())
+        present_data = pd.Series(nulls.present_counts())
         features = df.columns
 
-        plt.figure(figsize=(14, 10))  
-        bar_width = 0.8
-
-        bar1 = plt.bar(features, present_data, color="#3498db", label="Present Values", width=bar_width)
-        bar2 = plt.bar(features, missing_data, bottom=present_data, color="#e74c3c", label="Missing Values", width=bar_width)
-
-        for bar in bar1:
-            height = bar.get_height()
-            plt.text(
-                bar.get_x() + bar.get_width() / 2,
-                height / 2,
-                f'{int(height)}',
-                ha='center',
-                va='center',
-                fontsize=12,
-                fontweight='bold',
-                color='white',
-                bbox=dict(facecolor='black', alpha=0.6, edgecolor='none', boxstyle='round,pad=0.3')
-            )
-
-        for bar in bar2:
-            height = bar.get_height()
-            if height > 0:
-                plt.text(
-                    bar.get_x() + bar.get_width() / 2,
-                    bar.get_y() + height / 2,
-                    f'{int(height)}',
-                    ha='center',
-                    va='center',
-                    fontsize=12,
-                    fontweight='bold',
-                    color='white',
-                    bbox=dict(facecolor='black', alpha=0.6, edgecolor='none', boxstyle='round,pad=0.3')
-                )
-
-        plt.xlabel("Columns", fontsize=14)
-        plt.ylabel("Number of values", fontsize=14)
-        plt.xticks(rotation=45, ha='right', fontsize=12)
-        plt.legend(loc="upper right", fontsize=12)
-        plt.tight_layout()
-
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format="png", dpi=100)
-        buffer.seek(0)
-        missing_values_chart = base64.b64encode(buffer.getvalue()).decode("utf-8")
-        buffer.close()
-        plt.close()
+        with stage("missing_values_chart"):
+            missing_values_chart = generate_missing_values_chart(features, present_data, missing_data)
 
         html_content.append(f"""<div id="missing-values" class="missing-values-container">
             <h3 class="section-title">Missing Values Analysis</h3>
@@ -406,6 +615,13 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
             <div class="chart-wrapper">
                 <img src="data:image/png;base64,{missing_values_chart}" alt="Missing Values Chart" class="missing-values-chart">
             </div>
+            {render_missingness_patterns(nulls.missingness_patterns())}
+        </div>""")
+
+        html_content.append(f"""<div id="top-values" class="top-values-container">
+            <h3 class="section-title">Top Values</h3>
+            <p class="section-description">The most frequent values of each text, categorical and boolean column.</p>
+            {render_top_values(top_values)}
         </div>""")
 
         html_content.append("""<div id="visualizations">
@@ -418,46 +634,15 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
             html_content.append(f"<option value='{col}'>{col}</option>")
             values = [scores.get(metric, 0) for metric in metrics]
  
-            # Generate Bar Chart
-            plt.figure(figsize=(18, 12))  
-
-            plt.bar(metrics, values, color='#3498db')
-            plt.title(f"{col}", fontsize=20)
-            plt.xticks(rotation=45,fontsize=16)
-            plt.yticks(fontsize=16)
-            plt.tight_layout(rect=[0, 0, 1, 0.96]) 
-
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=100)
-            buffer.seek(0)
-            bar_chart = base64.b64encode(buffer.getvalue()).decode('utf-8')
-            buffer.close()
-            plt.close()
- 
-           
-            plt.figure(figsize=(18, 12))  
-
-            sns.heatmap(np.array(values).reshape(1, -1), annot=True,annot_kws={"size": 20}, fmt=".2f", cmap="coolwarm", cbar=False, xticklabels=metrics, yticklabels=[col])
-            plt.title(f"{col}", fontsize=20)
-            plt.xticks(rotation=45,fontsize=16)
-            plt.yticks(fontsize=16)
-            plt.tight_layout(rect=[0, 0, 1, 0.96])  
-
-            buffer = io.BytesIO()
-            plt.savefig(buffer, format='png', dpi=100)
-            buffer.seek(0)
-            heatmap = base64.b64encode(buffer.getvalue()).decode('utf-8')
-            buffer.close()
-            plt.close()
- 
-            charts_data[col] = {'bar_chart': bar_chart, 'heatmap': heatmap}
+            with column_timer("charts", col):
+                charts_data[col] = generate_column_charts(col, values, metrics)
  
         html_content.append("</select></div>")
  
         # Charts Section
         html_content.append("<div class='chart-container' id='chart-container'>")
         for col, charts in charts_data.items():
-            html_content.append(f"""<div id="{col}-charts" style="display:none;" class="charts-side-by-side">
+            html_content.append(f"""<div id="{col}-charts" class="charts-side-by-side">
                 <div class="chart">
                     <h3>Bar Chart</h3>
                     <img src='data:image/png;base64,{charts['bar_chart']}' alt='{col} Bar Chart'>
@@ -469,23 +654,6 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
             </div>""")
         html_content.append("</div>")  # End Chart Container
  
-        html_content.append("""<script>
-            function showChart(column) {
-                const charts = document.querySelectorAll("[id$='-charts']");
-                charts.forEach(chart => chart.style.display = 'none');
-               
-                if (column) {
-                    const selectedChart = document.getElementById(`${column}-charts`);
-                    document.getElementById("chart-container").style.display = 'block';
-                    selectedChart.style.display = 'flex';
-                } else {
-                    document.getElementById("chart-container").style.display = 'none';
-                }
-            }
-        </script>""")
-
-        
- 
         return "\n".join(html_content)
  
     except Exception as e:
@@ -0,0 +1,221 @@
+import datetime
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from Data_Validation.datasktch.quantile_sketch import QuantileSketch, sketch_series
+from Data_Validation.datastats.histograms import Histogram, build_histograms, histogram_psi
+from Data_Validation.datanull.null_mask_index import NullMaskIndex
+
+SNAPSHOT_VERSION = 1
+# Smoothing for empty bins in the PSI computation
+_PSI_EPSILON = 1e-4
+
+# Default thresholds for a column to count as "moved"
+DEFAULT_THRESHOLDS = {
+    "psi": 0.2,            # population stability index on numeric columns
+    "ks": 0.1,             # max CDF distance estimated from the sketches
+    "category_shift": 0.1, # total variation distance of top-value frequencies
+    "missing_rate": 0.05,  # absolute change in the share of missing cells
+    "score": 5.0,          # absolute change of any quality score (percentage points)
+}
+
+
+# Column profile stored with each run
+def _column_profile(column, sketch=None, top_k=20, missing=None, histogram=None):
+    n_rows = len(column)
+    if missing is None:
+        missing = int(column.isna().sum())
+    profile = {
+        "rows": n_rows,
+        "missing_rate": missing / n_rows if n_rows else 0.0,
+    }
+    if pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+        profile["kind"] = "numeric"
+        profile["sketch"] = (sketch or sketch_series(column)).to_dict()
+    else:
+        counts = column.value_counts(dropna=True)
+        non_null = int(counts.sum())
+        top = counts.head(top_k)
+        profile["kind"] = "categorical"
+        profile["distinct"] = int(counts.size)
+        profile["top_values"] = {str(value): int(count) / non_null for value, count in top.items()} if non_null else {}
+    if histogram is not None:
+        profile["histogram"] = histogram.to_dict()
+    return profile
+
+
+def build_run_snapshot(df, scores_df, sketches=None, top_k=20, histograms=None, nulls=None):
+    """Capture what the next run needs to detect drift: column profiles and scores.
+
+    Args:
+        df (pd.DataFrame): The dataset of this run.
+        scores_df (pd.DataFrame): Output of ``calculate_scores``.
+        sketches (dict, optional): Column name -> QuantileSketch already built this run.
+        top_k (int): Number of most frequent values kept per categorical column.
+        histograms (dict, optional): Column name -> Histogram already built this run
+            (see ``datastats.histograms``); built for the numeric and datetime columns otherwise.
+        nulls (NullMaskIndex, optional): Missing-value bitmaps of ``df``, built otherwise.
+
+    Returns:
+        dict: JSON-serializable snapshot.
+    """
+    sketches = sketches or {}
+    if histograms is None:
+        histograms = build_histograms(df)
+    if nulls is None:
+        nulls = NullMaskIndex.from_frame(df)
+    return {
+        "version": SNAPSHOT_VERSION,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "columns": {str(col): _column_profile(df[col], sketches.get(col), top_k, nulls.count(col), histograms.get(col))
+                    for col in df.columns},
+        "scores": {str(col): {metric: float(value) for metric, value in row.items()} for col, row in scores_df.iterrows()},
+    }
+
+
+def save_run_snapshot(snapshot, path):
+    # Written next to the target and renamed over it, so a failed write leaves the previous snapshot intact
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(snapshot, f)
+    os.replace(temporary, path)
+    return path
+
+
+def load_run_snapshot(path):
+    with open(path, encoding="utf-8") as f:
+        snapshot = json.load(f)
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported run snapshot version in {path}: {snapshot.get('version')}")
+    return snapshot
+
+
+# Distribution distances computed from stored summaries only
+def sketch_psi(previous, current, bins=10):
+    """Population stability index with decile bins taken from the previous sketch."""
+    if previous.n == 0 or current.n == 0:
+        return 0.0 if previous.n == current.n else np.inf
+    edges = np.unique(previous.quantile(np.linspace(0, 1, bins + 1)[1:-1]))
+    expected = np.diff(np.concatenate([[0.0], previous.cdf(edges), [1.0]]))
+    actual = np.diff(np.concatenate([[0.0], current.cdf(edges), [1.0]]))
+    expected = np.clip(expected, _PSI_EPSILON, None)
+    actual = np.clip(actual, _PSI_EPSILON, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def sketch_ks(previous, current, points=101):
+    """Kolmogorov-Smirnov statistic estimated on a quantile grid of both sketches."""
+    if previous.n == 0 or current.n == 0:
+        return 0.0 if previous.n == current.n else 1.0
+    grid = np.linspace(0, 1, points)
+    x = np.unique(np.concatenate([previous.quantile(grid), current.quantile(grid)]))
+    return float(np.max(np.abs(previous.cdf(x) - current.cdf(x))))
+
+
+def category_shift(previous, current):
+    """Total variation distance between two top-value frequency tables.
+
+    A value missing from one table was below that table's top-k cut, so its
+    frequency there is taken as at most the smallest tracked frequency.
+    """
+    keys = set(previous) | set(current)
+    previous_floor = min(previous.values(), default=0.0)
+    current_floor = min(current.values(), default=0.0)
+    distance = 0.0
+    for key in keys:
+        old = previous.get(key, min(previous_floor, current.get(key, 0.0)))
+        new = current.get(key, min(current_floor, previous.get(key, 0.0)))
+        distance += abs(old - new)
+    return float(distance / 2)
+
+
+# Compare the current run with the previous one
+def compare_runs(previous, current, thresholds=None):
+    """Compute per-column drift between two run snapshots.
+
+    Returns:
+        pd.DataFrame: One row per column of the current run with PSI, KS, category
+        shift, missing-rate change, the largest score change, a "Changed" flag and
+        the reasons that triggered it. New columns are always flagged.
+    """
+    thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    rows = {}
+    for col, profile in current["columns"].items():
+        old = previous["columns"].get(col)
+        row = {"PSI": np.nan, "KS": np.nan, "Category Shift": np.nan, "Missing Rate Change": np.nan,
+               "Max Score Change": np.nan, "Changed": True, "Reasons": "new column"}
+        if old is not None:
+            reasons = []
+            row["Missing Rate Change"] = profile["missing_rate"] - old["missing_rate"]
+            if abs(row["Missing Rate Change"]) > thresholds["missing_rate"]:
+                reasons.append("missing rate")
+
+            if profile["kind"] != old["kind"]:
+                reasons.append("type changed")
+            elif profile["kind"] == "numeric":
+                old_sketch = QuantileSketch.from_dict(old["sketch"])
+                new_sketch = QuantileSketch.from_dict(profile["sketch"])
+                row["PSI"] = sketch_psi(old_sketch, new_sketch)
+                row["KS"] = sketch_ks(old_sketch, new_sketch)
+                if row["PSI"] > thresholds["psi"]:
+                    reasons.append("PSI")
+                if row["KS"] > thresholds["ks"]:
+                    reasons.append("KS")
+            else:
+                row["Category Shift"] = category_shift(old["top_values"], profile["top_values"])
+                if row["Category Shift"] > thresholds["category_shift"]:
+                    reasons.append("category frequencies")
+                # Datetime columns have no sketch; their stored histograms give the PSI
+                if "histogram" in old and "histogram" in profile:
+                    row["PSI"] = histogram_psi(Histogram.from_dict(old["histogram"]),
+                                               Histogram.from_dict(profile["histogram"]))
+                    if row["PSI"] > thresholds["psi"]:
+                        reasons.append("PSI")
+
+            old_scores = previous["scores"].get(col, {})
+            new_scores = current["scores"].get(col, {})
+            changes = [abs(new_scores[m] - old_scores[m]) for m in new_scores if m in old_scores]
+            row["Max Score Change"] = max(changes) if changes else np.nan
+            if changes and row["Max Score Change"] > thresholds["score"]:
+                reasons.append("scores")
+
+            row["Changed"] = bool(reasons)
+            row["Reasons"] = ", ".join(reasons)
+        rows[col] = row
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def changed_columns(drift_df):
+    """Columns whose metrics moved beyond the thresholds."""
+    return drift_df.index[drift_df["Changed"]].tolist()
+
+
+def _format_metric(value, fmt):
+    return "-" if pd.isna(value) else format(value, fmt)
+
+
+# HTML section listing only the columns that moved
+def render_drift_section(drift_df, previous_created=None):
+    changed = drift_df[drift_df["Changed"]]
+    html_content = ["<div class='drift-section'>", "<h2>Changes Since Previous Run</h2>"]
+    if previous_created:
+        html_content.append(f"<p>Compared with the run of {previous_created}.</p>")
+    html_content.append(f"<p>{len(changed)} of {len(drift_df)} columns moved beyond the drift thresholds.</p>")
+
+    if not changed.empty:
+        html_content.append("<table class='stats-table'>")
+        html_content.append("<tr><th>Column</th><th>Reasons</th><th>PSI</th><th>KS</th><th>Category Shift</th>"
+                            "<th>Missing Rate Change</th><th>Max Score Change</th></tr>")
+        for col, row in changed.iterrows():
+            html_content.append(
+                f"<tr><td>{col}</td><td>{row['Reasons']}</td><td>{_format_metric(row['PSI'], '.3f')}</td>"
+                f"<td>{_format_metric(row['KS'], '.3f')}</td><td>{_format_metric(row['Category Shift'], '.3f')}</td>"
+                f"<td>{_format_metric(row['Missing Rate Change'], '+.2%')}</td>"
+                f"<td>{_format_metric(row['Max Score Change'], '.2f')}</td></tr>"
+            )
+        html_content.append("</table>")
+    html_content.append("</div>")
+    return "\n".join(html_content)
@@ -0,0 +1,306 @@
+import zlib
+
+import numpy as np
+import pandas as pd
+
+# Odd 64-bit multiplier used to fold column hashes into one row hash
+_ROW_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_SHINGLE_SIZE = 3
+# Hash of every missing value, whatever the column's dtype
+_NULL_HASH = pd.util.hash_array(np.array([np.nan]))[0]
+# Pending chunk hashes are folded into the sorted set once they outnumber it
+_MIN_COMPACT_SIZE = 1 << 20
+
+
+def _is_number(value):
+    return isinstance(value, (bool, int, float, np.number, np.bool_))
+
+
+_IS_NUMBER = np.frompyfunc(_is_number, 1, 1)
+
+
+def value_hashes(column):
+    """Hash a column so equal values hash equally whatever dtype a chunk was read with.
+
+    Numbers and booleans are hashed as float64, so an int64 ``1`` in one chunk
+    and a float64 ``1.0`` in the next match, as do ``1``, ``1.0`` and ``True``
+    in an object column (they are equal for ``Series.duplicated``); text keeps
+    pandas' string hashing, so ``"1"`` and ``1`` differ. Missing values all
+    hash to one value (``DataFrame.duplicated`` treats them as equal).
+    """
+    missing = column.isna().to_numpy()
+    if pd.api.types.is_bool_dtype(column) or pd.api.types.is_numeric_dtype(column):
+        hashes = pd.util.hash_array(column.to_numpy(dtype=np.float64, na_value=np.nan))
+    elif pd.api.types.is_object_dtype(column) and pd.api.types.infer_dtype(column, skipna=True) != "string":
+        values = column.to_numpy()
+        numbers = _IS_NUMBER(values).astype(bool) & ~missing
+        hashes = np.empty(len(values), dtype=np.uint64)
+        hashes[numbers] = pd.util.hash_array(values[numbers].astype(np.float64))
+        hashes[~numbers] = pd.util.hash_array(values[~numbers])
+    else:
+        hashes = pd.util.hash_pandas_object(column, index=False).to_numpy(dtype=np.uint64)
+    hashes[missing] = _NULL_HASH
+    return hashes
+
+
+def _null_kinds(column, null_mask):
+    # Series.duplicated keeps None, NaN, pd.NA and NaT apart in object columns
+    if not null_mask.any():
+        return set()
+    if pd.api.types.is_object_dtype(column):
+        return {type(value).__name__ for value in column.to_numpy()[null_mask]}
+    return {"nan"}
+
+
+# Exact duplicates from 64-bit hashes
+def column_hashes(df, columns=None):
+    """Hash every column once with vectorized hashing (see ``value_hashes``).
+
+    Returns:
+        dict: Column name -> uint64 array with one hash per row. Missing values
+        hash to the same value, so they count as duplicates of each other like
+        in ``Series.duplicated``.
+    """
+    columns = df.columns if columns is None else columns
+    return {col: value_hashes(df[col]) for col in columns}
+
+
+def row_hashes(hashes_by_column, n_rows=None):
+    """Fold per-column hashes into one 64-bit hash per row (order sensitive)."""
+    if not hashes_by_column:
+        return np.zeros(n_rows or 0, dtype=np.uint64)
+    n_rows = len(next(iter(hashes_by_column.values())))
+    combined = np.full(n_rows, 0x345678, dtype=np.uint64)
+    for hashes in hashes_by_column.values():
+        combined = (combined ^ hashes) * _ROW_HASH_MULTIPLIER
+    return combined
+
+
+# Distinct hashes seen so far, deduplicated in batches rather than on every chunk
+class _HashSet:
+    def __init__(self):
+        self._unique = np.empty(0, dtype=np.uint64)
+        self._pending = []
+        self._pending_size = 0
+
+    def add(self, hashes):
+        hashes = np.unique(hashes)
+        self._pending.append(hashes)
+        self._pending_size += hashes.size
+        # Folding in only once the batch outgrows the set keeps the total cost O(n log n)
+        if self._pending_size >= max(self._unique.size, _MIN_COMPACT_SIZE):
+            self.values()
+        return self
+
+    def merge(self, other):
+        self._pending.extend([other._unique, *other._pending])
+        self._pending_size += other._unique.size + other._pending_size
+        return self
+
+    def values(self):
+        """The sorted distinct hashes."""
+        if self._pending:
+            self._unique = np.unique(np.concatenate([self._unique, *self._pending]))
+            self._pending = []
+            self._pending_size = 0
+        return self._unique
+
+
+class DuplicateCounter:
+    """Counts duplicate rows and per-column duplicates over chunks or partitions.
+
+    Only the distinct 64-bit hashes are kept (8 bytes per distinct row and per
+    distinct value), so data that does not fit in memory can be streamed through
+    ``update`` and partition results combined with ``merge``.
+    """
+
+    def __init__(self, track_columns=True):
+        self.track_columns = track_columns
+        self.n_rows = 0
+        self._row_hashes = _HashSet()
+        self._column_hashes = {}
+        self._column_nulls = {}  # column -> kinds of missing value seen
+
+    def update(self, chunk):
+        hashes = column_hashes(chunk)
+        self.n_rows += len(chunk)
+        self._row_hashes.add(row_hashes(hashes, len(chunk)))
+
+        if self.track_columns:
+            for col, col_hashes in hashes.items():
+                null_mask = chunk[col].isna().to_numpy()
+                self._column_hashes.setdefault(col, _HashSet()).add(col_hashes[~null_mask])
+                self._column_nulls.setdefault(col, set()).update(_null_kinds(chunk[col], null_mask))
+        return self
+
+    def merge(self, other):
+        self.n_rows += other.n_rows
+        self._row_hashes.merge(other._row_hashes)
+        for col, hashes in other._column_hashes.items():
+            self._column_hashes.setdefault(col, _HashSet()).merge(hashes)
+            self._column_nulls.setdefault(col, set()).update(other._column_nulls[col])
+        return self
+
+    def summary(self):
+        """Return the duplicate summary dictionary (see ``find_duplicates``)."""
+        columns = {}
+        for col, hashes in self._column_hashes.items():
+            distinct = int(hashes.values().size)
+            columns[col] = {
+                "distinct": distinct,
+                # Matches Series.duplicated(): repeated missing values (of the same kind) are duplicates too
+                "duplicates": self.n_rows - distinct - len(self._column_nulls[col]),
+            }
+        return {
+            "rows": self.n_rows,
+            "duplicate_rows": self.n_rows - int(self._row_hashes.values().size),
+            "columns": columns,
+        }
+
+
+def find_duplicates(df, chunksize=None):
+    """Count exact duplicate rows and per-column duplicates from hashes computed once.
+
+    Args:
+        df (pd.DataFrame or iterable of pd.DataFrame): The data, or chunks of it.
+        chunksize (int, optional): Split an in-memory frame into chunks of this size
+                                   to bound the temporary hash arrays.
+
+    Returns:
+        dict: ``{"rows": int, "duplicate_rows": int, "columns": {col: {"distinct": int,
+        "duplicates": int}}}``. ``distinct`` excludes missing values like
+        ``Series.nunique()``; ``duplicates`` equals ``Series.duplicated().sum()``.
+    """
+    counter = DuplicateCounter()
+    if isinstance(df, pd.DataFrame):
+        chunks = [df] if not chunksize else (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+    else:
+        chunks = df
+    for chunk in chunks:
+        counter.update(chunk)
+    return counter.summary()
+
+
+# Near duplicates with MinHash over normalized text
+def normalize_text(column):
+    """Lowercase, strip punctuation and collapse whitespace; missing values become ''."""
+    text = column.fillna("").astype(str).str.lower()
+    text = text.str.replace(r"[^\w\s]", " ", regex=True)
+    return text.str.replace(r"\s+", " ", regex=True).str.strip()
+
+
+def _shingle_hashes(text, size=_SHINGLE_SIZE):
+    if len(text) <= size:
+        return np.array([zlib.crc32(text.encode("utf-8"))], dtype=np.uint64)
+    shingles = {text[i:i + size] for i in range(len(text) - size + 1)}
+    return np.fromiter((zlib.crc32(s.encode("utf-8")) for s in shingles), dtype=np.uint64, count=len(shingles))
+
+
+def minhash_signatures(texts, num_perm=64, seed=0):
+    """MinHash signature (``num_perm`` uint64 values) of each text's character shingles."""
+    rng = np.random.default_rng(seed)
+    # a < 2**31 and shingle hashes < 2**32 keep a * h + b inside uint64
+    a = rng.integers(1, 1 << 31, num_perm, dtype=np.uint64)
+    b = rng.integers(0, 1 << 32, num_perm, dtype=np.uint64)
+
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint64)
+    for row, text in enumerate(texts):
+        shingles = _shingle_hashes(text)
+        permuted = (np.outer(shingles, a) + b) % _MERSENNE_PRIME  # every permutation at once
+        signatures[row] = permuted.min(axis=0)
+    return signatures
+
+
+class NearDuplicateDetector:
+    """Streams rows through MinHash + LSH banding to find near-duplicate rows.
+
+    Only one representative row per group of near duplicates is kept (its
+    signature and LSH bucket keys), so memory grows with the number of distinct
+    rows, not with the input size.
+
+    Args:
+        text_columns (list, optional): Columns compared; defaults to the text
+            (object) columns of the first chunk.
+        threshold (float): Minimum estimated Jaccard similarity of two rows.
+        num_perm (int): MinHash permutations per row.
+        bands (int): LSH bands; ``num_perm`` must be divisible by it.
+        max_pairs (int): Number of example pairs kept for the report.
+    """
+
+    def __init__(self, text_columns=None, threshold=0.8, num_perm=64, bands=16, max_pairs=100, seed=0):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands.")
+        self.text_columns = text_columns
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.max_pairs = max_pairs
+        self.seed = seed
+        self.n_rows = 0
+        self.near_duplicate_rows = 0
+        self.pairs = []
+        self._buckets = {}  # (band, band signature bytes) -> representative row
+        self._signatures = {}  # representative row -> signature
+
+    def update(self, chunk):
+        if self.text_columns is None:
+            self.text_columns = list(chunk.select_dtypes(include="object").columns)
+        columns = [col for col in self.text_columns if col in chunk.columns]
+
+        if columns:
+            texts = normalize_text(chunk[columns[0]])
+            for col in columns[1:]:
+                texts = texts + " | " + normalize_text(chunk[col])
+        else:
+            texts = pd.Series([""] * len(chunk))
+        signatures = minhash_signatures(texts.tolist(), self.num_perm, self.seed)
+
+        rows_per_band = self.num_perm // self.bands
+        for offset, signature in enumerate(signatures):
+            row = self.n_rows + offset
+            keys = [(band, signature[band * rows_per_band:(band + 1) * rows_per_band].tobytes())
+                    for band in range(self.bands)]
+            candidates = sorted({self._buckets[key] for key in keys if key in self._buckets})
+
+            match = next(
+                (other for other in candidates if np.mean(self._signatures[other] == signature) >= self.threshold),
+                None,
+            )
+            if match is not None:
+                self.near_duplicate_rows += 1
+                if len(self.pairs) < self.max_pairs:
+                    self.pairs.append((match, row))
+                continue
+
+            # Only rows that start a new group are kept as representatives
+            for key in keys:
+                self._buckets.setdefault(key, row)
+            self._signatures[row] = signature
+
+        self.n_rows += len(chunk)
+        return self
+
+    def summary(self):
+        return {
+            "rows": self.n_rows,
+            "near_duplicate_rows": self.near_duplicate_rows,
+            "threshold": self.threshold,
+            "text_columns": self.text_columns,
+            "example_pairs": self.pairs,
+        }
+
+
+def find_near_duplicates(df, text_columns=None, threshold=0.8, chunksize=50_000, **kwargs):
+    """Count rows whose normalized text columns nearly match an earlier row.
+
+    Accepts a DataFrame or an iterable of chunks; see ``NearDuplicateDetector``.
+    """
+    detector = NearDuplicateDetector(text_columns=text_columns, threshold=threshold, **kwargs)
+    if isinstance(df, pd.DataFrame):
+        chunks = (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+    else:
+        chunks = df
+    for chunk in chunks:
+        detector.update(chunk)
+    return detector.summary()
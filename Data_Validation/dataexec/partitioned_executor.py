@@ -0,0 +1,558 @@
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from Data_Validation.dataconf.rule_config import ColumnView, compile_scan_plan, validity_mask, DEFAULT_ALERT_THRESHOLDS
+from Data_Validation.datadupl.duplicate_detection import DuplicateCounter
+from Data_Validation.datastats.dataset_statistics import DatasetStatistics
+from Data_Validation.datastats.moments import CoMoments, MomentsAccumulator
+from Data_Validation.datastats.wide_table import correlation_pairs
+from Data_Validation.dataexec.shared_columns import SharedFrame, adopt_frame, attach_frame, release_frame
+from Data_Validation.datasktch.quantile_sketch import DEFAULT_K, QuantileSketch, iqr_bounds
+from Data_Validation.datasktch.heavy_hitters import HeavyHitters
+from Data_Validation.datatime.datetime_scoring import DATE_SAMPLE_SIZE, detect_datetime_columns, parse_datetime_columns, timely_mask
+from Data_Validation.dataquame.data_quality_metrics import accuracy_matches, consistency_matches
+from Data_Validation.dataquame.numeric_accuracy import numeric_columns, numeric_matches
+from Data_Validation.dataquame.failure_samples import FailureSamples
+from Data_Validation.datadetairep.detailed_report import alert_message, alert_records, moment_facts
+from Data_Validation.dataProfrep.data_profiling_report import column_statistics_row
+from Data_Validation.datainstr.instrumentation import stage
+
+# Upper and lower bounds of the automatic partition size
+MAX_PARTITION_BYTES = 64 * 1024 * 1024
+MIN_PARTITION_BYTES = 1024 * 1024
+PREVIEW_ROWS = 10
+
+# Same parser options as load_dataset, so partitions parse exactly like the whole file
+_READ_OPTIONS = {"engine": "python", "on_bad_lines": "skip", "encoding": "utf-8"}
+
+# pandas dtype of each column kind (see _column_kind)
+_KIND_DTYPES = {
+    "int": np.dtype("int64"),
+    "float": np.dtype("float64"),
+    "bool": np.dtype("bool"),
+    "boolobj": np.dtype("object"),
+    "str": np.dtype("object"),
+}
+
+
+# Line-aligned byte ranges
+def byte_range_partitions(path, partition_bytes=MAX_PARTITION_BYTES):
+    """Split a CSV file after its header line into ``[(start, end), ...]`` byte ranges.
+
+    Every range ends at a line boundary, so a partition holds whole records as
+    long as no quoted field spans several lines.
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as f:
+        f.readline()
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + partition_bytes, size))
+            if f.tell() < size:
+                f.readline()  # move to the end of the current line
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges or [(size, size)]
+
+
+def _read_header(path):
+    with open(path, "rb") as f:
+        return f.readline()
+
+
+def _raw_column_names(header):
+    """Column names as written in the header, keyed by their stripped name."""
+    raw = pd.read_csv(io.BytesIO(header), nrows=0, **_READ_OPTIONS).columns
+    return dict(zip(raw.str.strip(), raw))
+
+
+def _read_partition(path, header, start, end, kinds=None, usecols=None):
+    """Parse one byte range; with ``kinds`` the columns get the whole-file dtypes."""
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    options = dict(_READ_OPTIONS)
+    raw_names = _raw_column_names(header)
+    if kinds is not None:
+        # Text columns are read as written; pandas may have inferred numbers within this partition
+        options["dtype"] = {raw_names[col]: str for col, kind in kinds.items() if kind == "str"}
+    if usecols is not None:
+        wanted = set(usecols)
+        options["usecols"] = lambda name: name.strip() in wanted
+
+    df = pd.read_csv(io.BytesIO(header + data), **options)
+    df.columns = df.columns.str.strip()  # Strip column names
+    if kinds is not None:
+        for col in df.columns:
+            target = _KIND_DTYPES[kinds[col]]
+            if df[col].dtype != target:
+                df[col] = df[col].astype(target)
+    return df
+
+
+# Whole-file dtypes from the dtypes pandas infers per partition
+def _column_kind(column):
+    if len(column) == 0:
+        return None  # an empty partition says nothing about the column
+    first = column.first_valid_index()
+    if first is None:
+        return "empty"
+    if pd.api.types.is_bool_dtype(column):
+        return "bool"
+    if pd.api.types.is_integer_dtype(column):
+        return "int"
+    if pd.api.types.is_float_dtype(column):
+        return "float"
+    # pandas keeps True/False as bools in an object column when values are missing
+    return "boolobj" if isinstance(column[first], (bool, np.bool_)) else "str"
+
+
+def _combine_kinds(kinds):
+    """The kind pandas infers for the whole column from the kinds of its partitions."""
+    kinds = {kind for kind in kinds if kind is not None}
+    if not kinds:
+        return "str"  # header only: pandas reads object columns
+    if "str" in kinds:
+        return "str"
+    if kinds & {"bool", "boolobj"}:
+        if kinds & {"int", "float"}:
+            return "str"
+        return "boolobj" if kinds & {"boolobj", "empty"} else "bool"
+    if kinds & {"float", "empty"}:
+        return "float"
+    return "int"
+
+
+def _scan_partition(task):
+    path, header, start, end = task
+    df = _read_partition(path, header, start, end)
+    return len(df), {col: _column_kind(df[col]) for col in df.columns}
+
+
+# Partial aggregates of one partition (or of several merged partitions)
+class PartitionPartial:
+    """Everything the scores, alerts and statistics need from a block of rows.
+
+    Counts are additive, hash sets and sketches merge, and the moments and
+    co-moments combine exactly, so partials reduce in any tree shape to the figures of
+    the whole dataset. Partials must be merged in row order (left with right)
+    for the tail preview.
+    """
+
+    def __init__(self, columns, numeric_columns, correlation_columns, k=DEFAULT_K, categorical_columns=()):
+        self.rows = 0
+        self.columns = list(columns)
+        self.numeric_columns = list(numeric_columns)
+        self.statistics = DatasetStatistics(duplicates=False)
+        self.duplicates = DuplicateCounter()
+        self.counts = {col: {} for col in self.columns}  # column -> {metric: passing rows}
+        self.negatives = {col: 0 for col in self.numeric_columns}
+        self.moments = MomentsAccumulator(self.numeric_columns)
+        self.sketches = {col: QuantileSketch(k=k) for col in self.numeric_columns}
+        self.top_values = {col: HeavyHitters() for col in categorical_columns}
+        self.comoments = CoMoments(correlation_columns)
+        self.failures = None
+        self.head = None
+        self.tail = None
+
+    def update(self, chunk):
+        """Add the column-independent figures of a chunk (scores are added by the caller)."""
+        self.rows += len(chunk)
+        self.statistics.update(chunk)
+        self.duplicates.update(chunk)
+
+        for col in self.numeric_columns:
+            values = chunk[col].to_numpy(dtype=np.float64)
+            values = values[~np.isnan(values)]
+            self.negatives[col] += int((values < 0).sum())
+            self.sketches[col].update(values)
+        self.moments.update_frame(chunk)
+        for col, tracker in self.top_values.items():
+            tracker.update(chunk[col])
+
+        if self.comoments.columns:
+            self.comoments.update(chunk[self.comoments.columns].to_numpy(dtype=np.float64, na_value=np.nan))
+
+        self.head = chunk.head(PREVIEW_ROWS)
+        self.tail = chunk.tail(PREVIEW_ROWS)
+        return self
+
+    def add_count(self, column, metric, count):
+        self.counts[column][metric] = self.counts[column].get(metric, 0) + int(count)
+
+    def merge(self, other):
+        self.rows += other.rows
+        self.statistics.merge(other.statistics)
+        self.duplicates.merge(other.duplicates)
+        for col, metrics in other.counts.items():
+            for metric, count in metrics.items():
+                self.add_count(col, metric, count)
+        for col in self.numeric_columns:
+            self.negatives[col] += other.negatives[col]
+            self.sketches[col].merge(other.sketches[col])
+        self.moments.merge(other.moments)
+        for col, tracker in self.top_values.items():
+            tracker.merge(other.top_values[col])
+        self.comoments.merge(other.comoments)
+        if other.failures is not None:
+            self.failures = other.failures if self.failures is None else self.failures.merge(other.failures)
+
+        if self.head is None or len(self.head) < PREVIEW_ROWS:
+            self.head = pd.concat([frame for frame in (self.head, other.head) if frame is not None]).head(PREVIEW_ROWS)
+        if other.tail is not None:
+            self.tail = pd.concat([frame for frame in (self.tail, other.tail) if frame is not None]).tail(PREVIEW_ROWS)
+        return self
+
+
+def _share_reference_partition(task):
+    """Reference worker: parse a partition of the reference once and share the compared columns."""
+    path, header, start, end, kinds, columns = task
+    return SharedFrame(_read_partition(path, header, start, end, kinds, usecols=columns)).detach()
+
+
+# Neighbouring data partitions overlap the same reference partition; keep the last ones attached
+_reference_cache = {}
+
+
+def _cached_reference_partition(handle):
+    key = handle["path"]
+    if key not in _reference_cache:
+        if len(_reference_cache) >= 2:
+            _reference_cache.pop(next(iter(_reference_cache)))
+        _reference_cache[key] = attach_frame(handle)
+    return _reference_cache[key]
+
+
+def _reference_rows(reference, start_row, stop_row):
+    """Rows [start_row, stop_row) of the reference, from the shared partitions covering them."""
+    partitions, handles = reference
+    pieces = []
+    for (start, end, offset, n_rows), handle in zip(partitions, handles):
+        if offset >= stop_row or offset + n_rows <= start_row:
+            continue
+        part = _cached_reference_partition(handle)
+        pieces.append(part.iloc[max(start_row - offset, 0):min(stop_row - offset, n_rows)])
+    if not pieces:
+        pieces.append(_cached_reference_partition(handles[0]).iloc[:0])
+    rows = pd.concat(pieces, ignore_index=True)
+    rows.index = pd.RangeIndex(start_row, start_row + len(rows))
+    return rows
+
+
+def _aggregate_partition(task):
+    """Phase 2 worker: parse a partition with the whole-file dtypes and build its partial."""
+    chunk_path, header, start, end, row_offset, kinds, reference, options = task
+    chunk = _read_partition(chunk_path, header, start, end, kinds)
+    chunk.index = pd.RangeIndex(row_offset, row_offset + len(chunk))
+
+    partial = PartitionPartial(chunk.columns, options["numeric_columns"], options["correlation_columns"], options["k"],
+                               options["categorical_columns"])
+    partial.update(chunk)
+    failures = None
+    if options["failure_capacity"]:
+        failures = FailureSamples(options["failure_capacity"], seed=[options["seed"], row_offset])
+        partial.failures = failures
+
+    plan = compile_scan_plan(options["rules"], chunk.columns, options["selected_metrics"])
+    needs_reference = any({"Accuracy", "Consistency"} & set(column_plan["metrics"]) for column_plan in plan.values())
+    chunk2 = _reference_rows(reference, row_offset, row_offset + len(chunk)) if needs_reference else None
+    date_columns = parse_datetime_columns(chunk, options["date_formats"]) if options["date_formats"] else {}
+
+    for col, column_plan in plan.items():
+        column_data = chunk[col]
+        metrics = column_plan["metrics"]
+        if "Validity" in metrics and column_plan["validators"]:
+            valid = validity_mask(ColumnView(column_data), column_plan["validators"])
+            partial.add_count(col, "Validity", valid.sum())
+            if failures is not None:
+                failures.record("Validity", col, ~valid, column_data, offset=row_offset)
+        if "Timeliness" in metrics and col in date_columns:
+            partial.add_count(col, "Timeliness", timely_mask(date_columns[col], options["threshold_date"], column_data).sum())
+        if "Accuracy" in metrics:
+            tolerance = column_plan["tolerance"]
+            if tolerance and numeric_columns(chunk, chunk2, [col]):
+                correct = numeric_matches(column_data, chunk2[col].reindex(chunk.index), tolerance.get("atol", 0.0),
+                                          tolerance.get("rtol", 0.0))
+            else:
+                correct = accuracy_matches(column_data, chunk2[col])
+            partial.add_count(col, "Accuracy", correct.sum())
+            if failures is not None:
+                failures.record("Accuracy", col, ~correct, column_data, chunk2[col].reindex(chunk.index), offset=row_offset)
+        if "Consistency" in metrics:
+            values2 = chunk2[col].reset_index(drop=True)
+            consistent = consistency_matches(column_data.reset_index(drop=True), values2)
+            partial.add_count(col, "Consistency", consistent.sum())
+            if failures is not None:
+                failures.record("Consistency", col, ~consistent, column_data, values2, offset=row_offset)
+    return partial
+
+
+def _read_numeric_columns(path, header, start, end, columns):
+    """Parse only numeric columns of a byte range with the C parser.
+
+    For numbers the C parser yields the same float64 values as the python engine
+    load_dataset uses, and it is several times faster on the columns it skips.
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+    wanted = set(columns)
+    raw_names = _raw_column_names(header)
+    df = pd.read_csv(
+        io.BytesIO(header + data),
+        engine="c",
+        on_bad_lines="skip",
+        encoding="utf-8",
+        usecols=lambda name: name.strip() in wanted,
+        dtype={raw_names[col]: np.float64 for col in columns},
+    )
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def _count_outliers(task):
+    """Phase 3 worker: count values outside the final IQR fences."""
+    path, header, start, end, bounds = task
+    chunk = _read_numeric_columns(path, header, start, end, list(bounds))
+    return {
+        col: int(((chunk[col] < lower) | (chunk[col] > upper)).sum())
+        for col, (lower, upper) in bounds.items()
+    }
+
+
+def _merge_pair(pair):
+    left, right = pair
+    return left.merge(right)
+
+
+def _tree_reduce(items, pool):
+    """Merge partials pairwise, level by level (in the pool when there is one), keeping row order."""
+    while len(items) > 1:
+        pairs = [(items[i], items[i + 1]) for i in range(0, len(items) - 1, 2)]
+        merged = list(pool.map(_merge_pair, pairs)) if pool is not None else [_merge_pair(pair) for pair in pairs]
+        if len(items) % 2:
+            merged.append(items[-1])
+        items = merged
+    return items[0]
+
+
+def _map(pool, func, tasks):
+    return list(pool.map(func, tasks)) if pool is not None else [func(task) for task in tasks]
+
+
+def _scan_file(path, pool, partition_bytes):
+    """Phase 1: partitions of a file with their row offsets, plus the whole-file column kinds."""
+    header = _read_header(path)
+    ranges = byte_range_partitions(path, partition_bytes)
+    scans = _map(pool, _scan_partition, [(path, header, start, end) for start, end in ranges])
+
+    partitions, offset = [], 0
+    for (start, end), (n_rows, _) in zip(ranges, scans):
+        partitions.append((start, end, offset, n_rows))
+        offset += n_rows
+    columns = list(scans[0][1])
+    kinds = {col: _combine_kinds(scan[1][col] for scan in scans) for col in columns}
+    return header, partitions, kinds, offset
+
+
+def run_partitioned_pipeline(path, reference_path=None, workers=None, partition_bytes=None, selected_metrics=None,
+                             rules=None, threshold_date=None, date_formats=None, alert_thresholds=None,
+                             failure_capacity=None, k=DEFAULT_K, seed=0):
+    """Run scoring, alerts and statistics over a CSV file partition by partition.
+
+    The file is split into line-aligned byte ranges that worker processes parse
+    and aggregate independently; the partial aggregates are combined in a tree
+    reduction. Three passes are made over the data:
+
+    1. schema: row counts and the dtypes pandas infers per partition, combined
+       into the dtypes of the whole file;
+    2. aggregate: partials (counts, hashes, sketches, moments, top values,
+       co-moments) computed with the whole-file dtypes;
+    3. outliers: counts outside the IQR fences of the merged sketches (numeric
+       columns only).
+
+    The results equal what ``load_dataset``, ``calculate_scores``,
+    ``generate_alerts`` and ``generate_statistics`` produce in memory, so they
+    feed the HTML generators unchanged. Outlier fences come from the quantile
+    sketch, which is exact while a column has at most ``k`` values and within
+    the sketch's rank error above that, as in memory. Records must not contain
+    line breaks inside quoted fields. Accuracy and consistency compare the rows
+    of ``reference_path`` by position; the compared columns of each reference
+    partition are parsed once and handed to the workers through a
+    ``SharedFrame`` (deleted when the run ends).
+
+    Args:
+        path (str): CSV file to validate.
+        reference_path (str, optional): Reference CSV (``df2``), required for
+            the Accuracy and Consistency metrics.
+        workers (int, optional): Worker processes; defaults to ``os.cpu_count()``.
+            With 1 everything runs in this process.
+        partition_bytes (int, optional): Target partition size. Defaults to about
+            four partitions per worker, between 1 and 64 MiB.
+        selected_metrics, rules, threshold_date, date_formats: As in ``calculate_scores``.
+        alert_thresholds (dict, optional): As ``thresholds`` in ``generate_alerts``.
+        failure_capacity (int, optional): Keep a ``FailureSamples`` with this
+            many rows per check and column.
+        k (int): Compactor size of the quantile sketches.
+        seed (int): Seed of the failure sampling.
+
+    Returns:
+        dict: ``scores`` (DataFrame as from ``calculate_scores``), ``alerts`` (list
+        as from ``generate_alerts``) and their ``alert_records``, ``statistics`` (list as from
+        ``generate_statistics``), ``dataset_statistics`` (as from
+        ``compute_dataset_statistics``), ``duplicates`` (as from ``find_duplicates``),
+        ``sketches``, ``top_values`` (as from ``track_top_values``), ``failures``,
+        ``dtypes``, ``head`` and ``tail`` previews.
+    """
+    workers = workers or os.cpu_count() or 1
+    if partition_bytes is None:
+        partition_bytes = min(MAX_PARTITION_BYTES, max(MIN_PARTITION_BYTES, os.path.getsize(path) // (4 * workers) + 1))
+    if threshold_date is None:
+        threshold_date = pd.to_datetime("today")
+    thresholds = {**DEFAULT_ALERT_THRESHOLDS, **(alert_thresholds or {})}
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    shared_reference = []
+    try:
+        with stage("partitioned.schema"):
+            header, partitions, kinds, n_rows = _scan_file(path, pool, partition_bytes)
+            columns = list(kinds)
+            plan = compile_scan_plan(rules, columns, selected_metrics)
+            metrics_used = {metric for column_plan in plan.values() for metric in column_plan["metrics"]}
+
+            reference = None
+            if metrics_used & {"Accuracy", "Consistency"}:
+                if reference_path is None:
+                    raise ValueError("Accuracy and Consistency need a reference_path.")
+                ref_header, ref_partitions, ref_kinds, ref_rows = _scan_file(reference_path, pool, partition_bytes)
+                missing = [col for col in columns if col not in ref_kinds]
+                if missing:
+                    raise ValueError("Column(s) missing: " + ", ".join(f"'{col}' in the second DataFrame" for col in missing))
+                if "Consistency" in metrics_used and ref_rows < n_rows:
+                    raise ValueError(f"The second DataFrame has {ref_rows} rows; at least {n_rows} are needed to compare by position.")
+                reference = (ref_header, ref_partitions, ref_kinds)
+
+            # Date formats are detected from the head of the file, like parse_datetime_columns does in memory
+            if "Timeliness" in metrics_used and date_formats is None:
+                first_start, first_end = partitions[0][:2]
+                head = _read_partition(path, header, first_start, first_end, kinds).head(DATE_SAMPLE_SIZE * 5)
+                date_formats = detect_datetime_columns(head)
+
+        if reference is not None:
+            # Each reference partition is parsed once and its compared columns shared with every worker
+            with stage("partitioned.reference"):
+                ref_header, ref_partitions, ref_kinds = reference
+                compared = [col for col, column_plan in plan.items()
+                            if {"Accuracy", "Consistency"} & set(column_plan["metrics"])]
+                tasks = [(reference_path, ref_header, start, end, ref_kinds, compared) for start, end, _, _ in ref_partitions]
+                for handle in _map(pool, _share_reference_partition, tasks):
+                    shared_reference.append(adopt_frame(handle))
+                reference = (ref_partitions, shared_reference)
+
+        dtypes = {col: _KIND_DTYPES[kind] for col, kind in kinds.items()}
+        numeric_columns = [col for col in columns if dtypes[col] in (np.dtype("int64"), np.dtype("float64"))]
+        correlation_columns = [col for col in columns if kinds[col] in ("int", "float", "bool")]
+        categorical_columns = [col for col in columns if kinds[col] in ("str", "boolobj", "bool")]
+        options = {
+            "numeric_columns": numeric_columns,
+            "correlation_columns": correlation_columns,
+            "categorical_columns": categorical_columns,
+            "k": k,
+            "rules": rules,
+            "selected_metrics": selected_metrics,
+            "date_formats": date_formats if "Timeliness" in metrics_used else None,
+            "threshold_date": threshold_date,
+            "failure_capacity": failure_capacity,
+            "seed": seed,
+        }
+
+        with stage("partitioned.aggregate"):
+            tasks = [(path, header, start, end, offset, kinds, reference, options) for start, end, offset, _ in partitions]
+            partial = _tree_reduce(_map(pool, _aggregate_partition, tasks), pool)
+
+        with stage("partitioned.outliers"):
+            bounds = {}
+            for col in numeric_columns:
+                if partial.sketches[col].n:
+                    bounds[col] = iqr_bounds(partial.sketches[col], thresholds["iqr_multiplier"])
+            outliers = {col: 0 for col in numeric_columns}
+            if bounds:
+                tasks = [(path, header, start, end, bounds) for start, end, _, _ in partitions]
+                for counts in _map(pool, _count_outliers, tasks):
+                    for col, count in counts.items():
+                        outliers[col] += count
+    finally:
+        _reference_cache.clear()
+        if pool is not None:
+            pool.shutdown()
+        for handle in shared_reference:
+            release_frame(handle)
+
+    duplicates = partial.duplicates.summary()
+    dataset_statistics = partial.statistics.result()
+    dataset_statistics["duplicate_rows"] = duplicates["duplicate_rows"]
+    missing = partial.statistics.missing
+
+    # Scores, with the same arithmetic as execute_scan_plan
+    detailed_scores = {}
+    for col, column_plan in plan.items():
+        counts = partial.counts[col]
+        column_scores = {}
+        for metric in column_plan["metrics"]:
+            if metric == "Completeness":
+                column_scores[metric] = (n_rows - missing[col]) / n_rows * 100 if n_rows else 0.0
+            elif metric == "Uniqueness":
+                column_scores[metric] = duplicates["columns"][col]["distinct"] / n_rows * 100 if n_rows else 0.0
+            elif metric == "Validity":
+                column_scores[metric] = (counts.get(metric, 0) / n_rows * 100 if n_rows else 0.0) if column_plan["validators"] else 100
+            elif metric == "Timeliness":
+                column_scores[metric] = (counts.get(metric, 0) / n_rows * 100 if n_rows else 0.0) if col in (date_formats or {}) else 100
+            else:  # Accuracy and Consistency
+                column_scores[metric] = (counts.get(metric, 0) / n_rows) * 100 if n_rows > 0 else 100
+        detailed_scores[col] = column_scores
+    scores_df = pd.DataFrame(detailed_scores).T
+
+    facts = {
+        "rows": n_rows,
+        "dtypes": dtypes,
+        "missing": dict(missing),
+        "duplicate_rows": duplicates["duplicate_rows"],
+        "correlation_pairs": correlation_pairs(partial.comoments.correlation(), thresholds["correlation"]),
+        "numeric_columns": numeric_columns,
+        "negatives": partial.negatives,
+        "distinct": {col: duplicates["columns"][col]["distinct"] for col in columns},
+        "outliers": outliers,
+        **moment_facts(partial.moments),
+        "top_values": partial.top_values,
+    }
+    records = alert_records(facts, thresholds)
+
+    index_memory = pd.RangeIndex(n_rows).memory_usage()
+    statistics = [
+        column_statistics_row(col, n_rows, missing[col], duplicates["columns"][col]["distinct"],
+                              duplicates["columns"][col]["duplicates"], partial.statistics.memory[col] + index_memory)
+        for col in columns
+    ]
+
+    return {
+        "rows": n_rows,
+        "dtypes": dtypes,
+        "scores": scores_df,
+        "alerts": [alert_message(record) for record in records],
+        "alert_records": records,
+        "statistics": statistics,
+        "dataset_statistics": dataset_statistics,
+        "duplicates": duplicates,
+        "sketches": partial.sketches,
+        "top_values": partial.top_values,
+        "failures": partial.failures,
+        "head": partial.head,
+        "tail": partial.tail,
+    }
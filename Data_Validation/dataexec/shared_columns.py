@@ -0,0 +1,318 @@
+import atexit
+import mmap
+import os
+import pickle
+import tempfile
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+# Segment files are named <prefix><owner pid>_<token>; the pid lets stale segments be found
+SEGMENT_PREFIX = "dq_columns_"
+# Buffers start on 64-byte boundaries, like Arrow buffers
+ALIGNMENT = 64
+
+# Segments created by this process that are still alive
+_owned_segments = {}
+
+
+def default_segment_directory():
+    """RAM-backed /dev/shm when available, otherwise the temporary directory."""
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True  # exists but belongs to someone else, or we cannot tell
+    return True
+
+
+def release_stale_segments(directory=None):
+    """Delete segments left behind by processes that no longer run (e.g. after a crash).
+
+    Returns:
+        list: Paths of the deleted segment files.
+    """
+    directory = directory or default_segment_directory()
+    removed = []
+    for name in os.listdir(directory):
+        if not name.startswith(SEGMENT_PREFIX):
+            continue
+        pid = name[len(SEGMENT_PREFIX):].split("_", 1)[0]
+        if not pid.isdigit() or _pid_alive(int(pid)):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            os.remove(path)
+            removed.append(path)
+        except OSError:
+            pass
+    return removed
+
+
+@atexit.register
+def _release_owned_segments():
+    # Forked workers inherit the registry; only the creating process removes its segments
+    for path, owner in list(_owned_segments.items()):
+        if owner == os.getpid():
+            _remove_segment(path)
+
+
+def _remove_segment(path):
+    _owned_segments.pop(path, None)
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# Column encoders: each returns (kind, metadata, {buffer name: array})
+def _encode_column(series):
+    dtype = series.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        values = series.dt.tz_convert(None).to_numpy()
+        return "datetimetz", {"tz": str(dtype.tz), "unit": dtype.unit}, {"values": values.view(np.int64)}
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufc":
+        return "numeric", {"dtype": dtype.str}, {"values": series.to_numpy()}
+    if isinstance(dtype, np.dtype) and dtype.kind in "mM":
+        return "datetime", {"dtype": dtype.str}, {"values": series.to_numpy().view(np.int64)}
+    if isinstance(dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        return "category", {"dtype": pickle.dumps(dtype)}, {"codes": codes}
+    if dtype == object and pd.api.types.infer_dtype(series, skipna=True) in ("string", "empty"):
+        return "string", {}, _encode_strings(series)
+    # Anything else (mixed objects, extension dtypes) is shared as one pickled blob
+    return "pickle", {}, {"blob": np.frombuffer(pickle.dumps(series, protocol=pickle.HIGHEST_PROTOCOL), dtype=np.uint8)}
+
+
+def _encode_strings(series):
+    """Arrow-style layout: int64 offsets, UTF-8 bytes and a validity byte per row."""
+    valid = series.notna().to_numpy()
+    encoded = [value.encode("utf-8") if ok else b"" for value, ok in zip(series.to_numpy(), valid)]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return {"offsets": offsets, "data": data, "validity": valid.view(np.uint8)}
+
+
+def _decode_strings(offsets, data, validity):
+    raw = data.tobytes()
+    if not data.size or data.max() < 0x80:
+        # ASCII: byte offsets are character offsets, so decode once and slice
+        text = raw.decode("ascii")
+    else:
+        text = None
+    values = np.empty(len(validity), dtype=object)
+    for i, ok in enumerate(validity):
+        if not ok:
+            values[i] = np.nan
+        elif text is not None:
+            values[i] = text[offsets[i]:offsets[i + 1]]
+        else:
+            values[i] = raw[offsets[i]:offsets[i + 1]].decode("utf-8")
+    return values
+
+
+def _decode_column(kind, meta, buffers, name, index):
+    if kind == "numeric":
+        return pd.Series(buffers["values"], index=index, name=name, copy=False)
+    if kind == "datetime":
+        return pd.Series(buffers["values"].view(np.dtype(meta["dtype"])), index=index, name=name, copy=False)
+    if kind == "datetimetz":
+        values = buffers["values"].view(f"datetime64[{meta['unit']}]")
+        return pd.Series(pd.DatetimeIndex(values).tz_localize("UTC").tz_convert(meta["tz"]), index=index, name=name)
+    if kind == "category":
+        categorical = pd.Categorical.from_codes(buffers["codes"], dtype=pickle.loads(meta["dtype"]))
+        return pd.Series(categorical, index=index, name=name)
+    if kind == "string":
+        values = _decode_strings(buffers["offsets"], buffers["data"], buffers["validity"])
+        return pd.Series(values, index=index, name=name, copy=False)
+    series = pickle.loads(buffers["blob"].tobytes())
+    series.index = index
+    return series
+
+
+# A DataFrame's columns written once to a memory-mapped segment
+class SharedFrame:
+    """Share a DataFrame's columns with other processes by reference.
+
+    Every column is written once into a single segment file (in /dev/shm when
+    available) with a columnar layout: numeric, boolean and datetime columns as
+    raw value buffers, text columns as offsets + UTF-8 bytes + validity, and
+    categoricals as codes. ``handle`` is a small picklable description of the
+    segment; ``attach_frame(handle)`` in any process maps the file read-only,
+    so numeric and datetime columns are views of the shared pages instead of
+    pickled copies. Text is decoded into Python strings on attach.
+
+    The segment is deleted by ``close()`` (or leaving the ``with`` block), at
+    interpreter exit, and, if the process was killed, by the next
+    ``release_stale_segments()`` (which every new SharedFrame runs once).
+
+    Example:
+        with SharedFrame(df) as shared:
+            results = pool.map(check_column, [(shared.handle, col) for col in df.columns])
+    """
+
+    _stale_checked = False
+
+    def __init__(self, df, directory=None):
+        directory = directory or default_segment_directory()
+        if not SharedFrame._stale_checked:
+            release_stale_segments(directory)
+            SharedFrame._stale_checked = True
+
+        columns = []
+        arrays = []
+        for name in df.columns:
+            kind, meta, buffers = _encode_column(df[name])
+            columns.append((name, kind, meta, list(buffers)))
+            arrays.append(buffers)
+        if isinstance(df.index, pd.RangeIndex):
+            index = ("range", (df.index.start, df.index.stop, df.index.step, df.index.name))
+            index_buffers = {}
+        else:
+            kind, meta, index_buffers = _encode_column(df.index.to_series())
+            index = (kind, meta, list(index_buffers), df.index.name)
+
+        self.path = os.path.join(directory, f"{SEGMENT_PREFIX}{os.getpid()}_{uuid.uuid4().hex}")
+        _owned_segments[self.path] = os.getpid()
+        layout = self._write(arrays + [index_buffers])
+        self.handle = {
+            "path": self.path,
+            "rows": len(df),
+            "columns": columns,
+            "index": index,
+            "layout": layout,
+        }
+
+    def _write(self, groups):
+        """Write every buffer at an aligned offset; returns per-group ``{name: (offset, dtype, count)}``."""
+        layout = []
+        with open(self.path, "wb") as f:
+            position = 0
+            for buffers in groups:
+                placed = {}
+                for name, array in buffers.items():
+                    array = np.ascontiguousarray(array)
+                    position = -(-position // ALIGNMENT) * ALIGNMENT
+                    f.seek(position)
+                    f.write(memoryview(array).cast("B"))
+                    placed[name] = (position, array.dtype.str, array.size)
+                    position += array.nbytes
+                layout.append(placed)
+            f.truncate(position)
+        return layout
+
+    def close(self):
+        """Delete the segment. Frames attached elsewhere stay valid until they are released."""
+        _remove_segment(self.path)
+
+    def detach(self):
+        """Hand the segment over to whoever receives the handle (see ``adopt_frame``) and return the handle.
+
+        This process no longer deletes it, e.g. a worker returning a frame it
+        parsed to the process that merges the results.
+        """
+        _owned_segments.pop(self.path, None)
+        return self.handle
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def adopt_frame(handle):
+    """Take over a segment created by another process and return its handle in this one.
+
+    The segment is renamed after this process, so ``release_stale_segments``
+    judges it by this process's lifetime, and it is deleted at exit unless
+    ``release_frame`` deletes it first.
+    """
+    token = os.path.basename(handle["path"])[len(SEGMENT_PREFIX):].split("_", 1)[1]
+    path = os.path.join(os.path.dirname(handle["path"]), f"{SEGMENT_PREFIX}{os.getpid()}_{token}")
+    if path != handle["path"]:
+        os.rename(handle["path"], path)
+    _owned_segments[path] = os.getpid()
+    return dict(handle, path=path)
+
+
+def release_frame(handle):
+    """Delete the segment of a handle this process owns; frames already attached stay valid."""
+    _remove_segment(handle["path"])
+
+
+def _map_segment(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _buffers(segment, placed):
+    return {
+        name: np.frombuffer(segment, dtype=np.dtype(dtype), count=count, offset=offset)
+        for name, (offset, dtype, count) in placed.items()
+    }
+
+
+def attach_frame(handle, columns=None):
+    """Rebuild the DataFrame described by a ``SharedFrame.handle``.
+
+    Numeric, boolean and datetime columns are read-only views of the shared
+    segment (no copy); the mapping lives as long as any of them does.
+
+    Args:
+        handle (dict): ``SharedFrame.handle`` from the creating process.
+        columns (list, optional): Only attach these columns.
+    """
+    segment = _map_segment(handle["path"])
+    *column_layouts, index_layout = handle["layout"]
+    index_spec = handle["index"]
+    if index_spec[0] == "range":
+        start, stop, step, index_name = index_spec[1]
+        index = pd.RangeIndex(start, stop, step, name=index_name)
+    else:
+        kind, meta, _, index_name = index_spec
+        index = pd.Index(_decode_column(kind, meta, _buffers(segment, index_layout), None,
+                                        pd.RangeIndex(handle["rows"])), name=index_name)
+
+    wanted = None if columns is None else set(columns)
+    data = {}
+    for (name, kind, meta, _), placed in zip(handle["columns"], column_layouts):
+        if wanted is None or name in wanted:
+            data[name] = _decode_column(kind, meta, _buffers(segment, placed), name, index)
+    return pd.DataFrame(data, index=index, copy=False)
+
+
+def _apply_to_column(task):
+    func, handle, column = task
+    return func(attach_frame(handle, [column])[column])
+
+
+def map_columns(func, df, columns=None, workers=None):
+    """Apply ``func(series)`` to columns of ``df`` in worker processes.
+
+    The frame is shared once through a ``SharedFrame`` instead of being pickled
+    to every worker. ``func`` must be picklable (a module-level function).
+
+    Returns:
+        dict: Column name -> result, in column order.
+    """
+    columns = list(df.columns if columns is None else columns)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(columns) <= 1:
+        return {col: func(df[col]) for col in columns}
+    with SharedFrame(df) as shared, ProcessPoolExecutor(max_workers=min(workers, len(columns))) as pool:
+        tasks = [(func, shared.handle, col) for col in columns]
+        return dict(zip(columns, pool.map(_apply_to_column, tasks)))
@@ -1,10 +1,30 @@
 import pandas as pd
 
-# Load dataset
-def load_dataset(path):
+def _usecols(columns):
+    # Matched on the stripped names, which is how the columns are known after loading
+    if columns is None:
+        return None
+    wanted = set(columns)
+    return lambda name: name.strip() in wanted
+
+
+# Load dataset; with usecols only those columns are parsed (see dataloD.projection)
+def load_dataset(path, usecols=None):
     try:
-        df = pd.read_csv(path, engine="python", on_bad_lines="skip", encoding="utf-8")
+        df = pd.read_csv(path, engine="python", on_bad_lines="skip", encoding="utf-8", usecols=_usecols(usecols))
         df.columns = df.columns.str.strip()  # Strip column names
         return df
     except Exception as e:
         raise ValueError(f"Error reading the file: {e}")
+
+
+# Load dataset in chunks, for single-pass streaming statistics (e.g. quantile sketches)
+def load_dataset_chunks(path, chunksize=100_000, usecols=None):
+    try:
+        reader = pd.read_csv(path, engine="python", on_bad_lines="skip", encoding="utf-8", chunksize=chunksize,
+                             usecols=_usecols(usecols))
+        for chunk in reader:
+            chunk.columns = chunk.columns.str.strip()  # Strip column names
+            yield chunk
+    except Exception as e:
+        raise ValueError(f"Error reading the file: {e}")
@@ -0,0 +1,80 @@
+import pandas as pd
+
+from Data_Validation.dataconf.rule_config import compile_scan_plan, resolve_rules, selected_columns
+from Data_Validation.dataquame.consistency_rules import ConsistencyRule
+
+# Metrics that compare a column against the reference dataset
+REFERENCE_METRICS = ("Accuracy", "Consistency")
+
+
+def read_columns(path):
+    """Column names of a CSV file (stripped, like ``load_dataset``), from its header alone."""
+    try:
+        header = pd.read_csv(path, engine="python", encoding="utf-8", nrows=0)
+    except Exception as e:
+        raise ValueError(f"Error reading the file: {e}")
+    return [str(col).strip() for col in header.columns]
+
+
+def plan_projection(columns, rules=None, selected_metrics=None, report=True):
+    """Work out which columns of the dataset and of the reference a run reads.
+
+    The scan plan decides the metric columns; with ``report`` the report
+    sections (statistics, alerts, profile) describe every column picked by the
+    rules' ``select``, so those are all kept. Columns used by consistency rules
+    are always kept. The reference is only needed for the columns scored on
+    Accuracy or Consistency.
+
+    Args:
+        columns (list): Columns of the dataset, in file order.
+        rules (dict, optional): Rule configuration (see ``rule_config``).
+        selected_metrics (list, optional): Metrics to compute, overriding the rules.
+        report (bool): Whether the report sections are generated too.
+
+    Returns:
+        dict: ``{"columns": [...], "reference_columns": [...] or None}``; both
+        lists are in dataset order, and ``reference_columns`` is None when the
+        reference dataset is not needed at all.
+    """
+    rules = resolve_rules(rules)
+    plan = compile_scan_plan(rules, columns, selected_metrics)
+    if rules["select"] is not None:
+        unmatched = [selector for selector in rules["select"] if not selected_columns({"select": [selector]}, columns)]
+        if unmatched:
+            raise ValueError("No columns match: " + ", ".join(f"'{selector}'" for selector in unmatched))
+
+    wanted = set(selected_columns(rules, columns) if report else plan)
+    for rule in rules["consistency_rules"]:
+        rule_columns = ConsistencyRule(rule).columns
+        missing = [col for col in rule_columns if col not in columns]
+        if missing:
+            raise ValueError(f"Rule {rule!r} uses unknown column(s): " + ", ".join(f"'{col}'" for col in missing))
+        wanted.update(rule_columns)
+
+    reference_columns = [col for col, column_plan in plan.items()
+                         if any(metric in column_plan["metrics"] for metric in REFERENCE_METRICS)]
+    return {
+        "columns": [col for col in columns if col in wanted],
+        "reference_columns": reference_columns or None,
+    }
+
+
+def plan_inputs(dataset_path, reference_path=None, rules=None, selected_metrics=None, report=True):
+    """``plan_projection`` from the file headers, checking the reference has the compared columns.
+
+    Only the headers are read; the reference file is not opened when no
+    selected metric needs it.
+
+    Raises:
+        ValueError: When the reference is needed but missing or lacks a compared column.
+    """
+    projection = plan_projection(read_columns(dataset_path), rules, selected_metrics, report)
+    reference_columns = projection["reference_columns"]
+    if reference_columns is not None:
+        if reference_path is None:
+            raise ValueError(f"A reference dataset is needed for {', '.join(REFERENCE_METRICS)}.")
+        available = set(read_columns(reference_path))
+        missing = [col for col in reference_columns if col not in available]
+        if missing:
+            raise ValueError("Column(s) missing: " + ", ".join(f"'{col}' in the second DataFrame" for col in missing))
+    return projection
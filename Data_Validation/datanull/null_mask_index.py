@@ -0,0 +1,235 @@
+import numpy as np
+import pandas as pd
+
+# Rows handled per block when row signatures are assembled (a multiple of 64)
+_SIGNATURE_BLOCK_ROWS = 1 << 16
+# Cells masked per slice of columns when an index is built
+_MASK_BLOCK_CELLS = 1 << 24
+# Unpacked mask cells per block of rows multiplied for the co-missing counts
+_CO_MISSING_BLOCK_CELLS = 1 << 22
+# Co-missing counts held at once: columns are paired a tile of rows of the matrix at a time
+_CO_MISSING_TILE_CELLS = 1 << 24
+_POPCOUNT_TABLE = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def _pack(mask):
+    """Pack a boolean mask into little-endian uint64 words (row i is bit i % 64 of word i // 64).
+
+    A 2-D mask is packed along its last axis, one row of words per mask row.
+    """
+    packed = np.packbits(mask, axis=-1, bitorder="little")
+    padded = np.zeros(packed.shape[:-1] + (-(-packed.shape[-1] // 8) * 8,), dtype=np.uint8)
+    padded[..., :packed.shape[-1]] = packed
+    return padded.view("<u8")
+
+
+def popcount(words):
+    """Number of set bits in an array of uint64 words."""
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+        return int(np.bitwise_count(words).sum(dtype=np.int64))
+    return int(_POPCOUNT_TABLE[words.view(np.uint8)].sum(dtype=np.int64))
+
+
+# Missing cells of a frame, one bit per cell
+class NullMaskIndex:
+    """Missing-value bitmaps of every column of a frame.
+
+    Each column's missing mask is stored packed, one bit per row (1/8 of a
+    boolean mask), with its missing count. Metrics read counts and masks from
+    here instead of calling ``isna()`` again, and missingness patterns across
+    columns are found with AND/OR and popcount on 64-row words.
+
+    Build it once per loaded frame with ``NullMaskIndex.from_frame(df)`` and
+    pass it on (``nulls=``); it describes the frame as it was when built, so
+    build a new one after changing the frame.
+    """
+
+    def __init__(self, columns, n_rows, bitmaps, counts=None):
+        self.columns = list(columns)
+        self.n_rows = n_rows
+        self.bitmaps = bitmaps
+        self.counts = counts if counts is not None else {col: popcount(bitmaps[col]) for col in self.columns}
+
+    @classmethod
+    def from_frame(cls, df):
+        # Slices of columns are masked and packed as 2-D blocks, so wide frames take few pandas calls
+        bitmaps, counts = {}, {}
+        step = max(1, _MASK_BLOCK_CELLS // max(len(df), 1))
+        for start in range(0, len(df.columns), step):
+            block = df.iloc[:, start:start + step]
+            mask = block.isna().to_numpy(dtype=bool).T
+            words = _pack(mask)
+            for col, column_words, count in zip(block.columns, words, mask.sum(axis=1).tolist()):
+                bitmaps[col] = column_words
+                counts[col] = count
+        return cls(df.columns, len(df), bitmaps, counts)
+
+    def count(self, column):
+        return self.counts[column]
+
+    def null_counts(self):
+        """``{column: missing cells}``, like ``df.isna().sum().to_dict()``."""
+        return dict(self.counts)
+
+    def present_counts(self):
+        return {col: self.n_rows - count for col, count in self.counts.items()}
+
+    @property
+    def missing_cells(self):
+        return sum(self.counts.values())
+
+    def mask(self, column):
+        """Boolean array of the missing rows of ``column``."""
+        return np.unpackbits(self.bitmaps[column].view(np.uint8), count=self.n_rows, bitorder="little").view(bool)
+
+    def columns_with_nulls(self):
+        return [col for col in self.columns if self.counts[col]]
+
+    def rows_with_nulls(self):
+        """Number of rows with at least one missing cell."""
+        columns = self.columns_with_nulls()
+        if not columns:
+            return 0
+        return popcount(np.bitwise_or.reduce([self.bitmaps[col] for col in columns]))
+
+    def _unpacked(self, columns, words):
+        """Float32 (rows, columns) 0/1 missing matrix of the rows in a slice of words."""
+        n_bits = min((words.stop - words.start) * 64, self.n_rows - words.start * 64)
+        packed = np.stack([self.bitmaps[col][words] for col in columns])
+        return np.unpackbits(packed.view(np.uint8), axis=1, count=n_bits, bitorder="little").T.astype(np.float32)
+
+    def _co_missing_tiles(self, columns):
+        """Yield ``(start, counts)``: rows missing in both ``columns[start + i]`` and ``columns[start + j]``.
+
+        Counts are matrix products ``mask.T @ mask`` over blocks of rows, for a
+        tile of columns against the columns from ``start`` on (the upper
+        triangle), so neither the unpacked masks nor the whole matrix are held.
+        """
+        n_columns = len(columns)
+        tile = max(1, _CO_MISSING_TILE_CELLS // max(n_columns, 1))
+        n_words = -(-self.n_rows // 64)
+        for start in range(0, n_columns, tile):
+            rest = columns[start:]
+            block_words = max(1, _CO_MISSING_BLOCK_CELLS // (64 * len(rest)))
+            counts = np.zeros((min(tile, len(rest)), len(rest)))
+            for word in range(0, n_words, block_words):
+                rows = self._unpacked(rest, slice(word, word + block_words))
+                counts += rows[:, :tile].T @ rows  # exact: a block has far fewer than 2**24 rows
+            yield start, counts.astype(np.int64)
+
+    def co_missing_counts(self):
+        """Rows where both columns are missing, for every pair of columns with missing cells.
+
+        Returns:
+            pd.DataFrame: Symmetric matrix; the diagonal holds the missing counts.
+        """
+        columns = self.columns_with_nulls()
+        counts = np.zeros((len(columns), len(columns)), dtype=np.int64)
+        for start, tile in self._co_missing_tiles(columns):
+            counts[start:start + len(tile), start:] = tile
+            counts[start:, start:start + len(tile)] = tile.T
+        return pd.DataFrame(counts, index=columns, columns=columns)
+
+    def co_missing_groups(self, min_jaccard=0.9):
+        """Groups of columns that tend to be missing in the same rows.
+
+        Two columns are linked when the Jaccard similarity of their missing rows
+        (rows missing in both / rows missing in either) is at least
+        ``min_jaccard``; a group is a connected set of linked columns.
+
+        Returns:
+            list[dict]: ``{"columns", "missing_together", "missing_any", "jaccard"}``
+            per group of two or more columns, largest first. ``jaccard`` is the
+            lowest similarity of a linked pair in the group.
+        """
+        columns = self.columns_with_nulls()
+        missing = np.array([self.counts[col] for col in columns], dtype=np.int64)
+        parent = list(range(len(columns)))
+
+        def root(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        links = []
+        for start, tile in self._co_missing_tiles(columns):
+            jaccard = tile / (missing[start:start + len(tile), None] + missing[None, start:] - tile)
+            # Pairs above the diagonal only: j > i
+            rows, cols = np.nonzero(np.triu(jaccard >= min_jaccard, k=1))
+            for i, j, value in zip((rows + start).tolist(), (cols + start).tolist(), jaccard[rows, cols].tolist()):
+                links.append((i, value))
+                parent[root(j)] = root(i)
+
+        members = {}
+        for i in range(len(columns)):
+            members.setdefault(root(i), []).append(columns[i])
+        lowest = {}
+        for i, jaccard in links:
+            lowest[root(i)] = min(jaccard, lowest.get(root(i), 1.0))
+        groups = []
+        for group_root, group in members.items():
+            if len(group) < 2:
+                continue
+            bitmaps = [self.bitmaps[col] for col in group]
+            groups.append({
+                "columns": group,
+                "missing_together": popcount(np.bitwise_and.reduce(bitmaps)),
+                "missing_any": popcount(np.bitwise_or.reduce(bitmaps)),
+                "jaccard": float(lowest.get(group_root, 1.0)),
+            })
+        return sorted(groups, key=lambda group: (-len(group["columns"]), -group["missing_together"]))
+
+    def row_signatures(self, top=10):
+        """Most frequent sets of missing columns among rows with a missing cell.
+
+        Rows without missing cells are skipped word by word (the OR of all
+        bitmaps), so complete rows cost nothing beyond that OR.
+
+        Returns:
+            list[dict]: ``{"columns", "rows", "percentage"}`` for the ``top``
+            most frequent signatures.
+        """
+        columns = self.columns_with_nulls()
+        if not columns:
+            return []
+        bitmaps = [self.bitmaps[col] for col in columns]
+        any_missing = np.bitwise_or.reduce(bitmaps)
+        block_words = _SIGNATURE_BLOCK_ROWS // 64
+
+        counts = {}
+        for start in range(0, any_missing.size, block_words):
+            block = slice(start, start + block_words)
+            if not any_missing[block].any():
+                continue
+            n_bits = min(_SIGNATURE_BLOCK_ROWS, self.n_rows - start * 64)
+            rows = np.unpackbits(any_missing[block].view(np.uint8), count=n_bits, bitorder="little").view(bool)
+            # One bit per column for each row that has a missing cell
+            matrix = np.empty((int(rows.sum()), len(columns)), dtype=bool)
+            for j, bitmap in enumerate(bitmaps):
+                matrix[:, j] = np.unpackbits(bitmap[block].view(np.uint8), count=n_bits, bitorder="little").view(bool)[rows]
+            signatures = np.packbits(matrix, axis=1, bitorder="little")
+            unique, unique_counts = np.unique(signatures, axis=0, return_counts=True)
+            for signature, count in zip(unique, unique_counts):
+                key = signature.tobytes()
+                counts[key] = counts.get(key, 0) + int(count)
+
+        result = []
+        for key, count in sorted(counts.items(), key=lambda item: -item[1])[:top]:
+            flags = np.unpackbits(np.frombuffer(key, dtype=np.uint8), count=len(columns), bitorder="little")
+            result.append({
+                "columns": [col for col, flag in zip(columns, flags) if flag],
+                "rows": count,
+                "percentage": count / self.n_rows * 100,
+            })
+        return result
+
+    def missingness_patterns(self, min_jaccard=0.9, top=10):
+        """Summary of the missing cells: counts, co-missing groups and row signatures."""
+        return {
+            "rows": self.n_rows,
+            "missing_cells": self.missing_cells,
+            "rows_with_nulls": self.rows_with_nulls(),
+            "groups": self.co_missing_groups(min_jaccard),
+            "signatures": self.row_signatures(top),
+        }
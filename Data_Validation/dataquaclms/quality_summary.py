@@ -1,10 +1,8 @@
 def generate_quality_summary(df, scores_df):
     try:
-        # Initialize the HTML content with a link to the external CSS
+        # Initialize the HTML content (Gqcls.css is part of the combined report's asset bundle)
         html_content = []
         html_content.append("""
-        <link rel="stylesheet" href="Data_Validation\\dataquaclms\\Gqcls.css">
-
         <div class="container">
             <div class="metrics-container">
         """)
@@ -0,0 +1,499 @@
+import datetime
+import operator
+import re
+
+import numpy as np
+import pandas as pd
+
+from Data_Validation.datatime.datetime_scoring import detect_datetime_columns, parse_datetime_column
+
+# Rows evaluated at a time; every rule of a set is evaluated on the same chunk
+DEFAULT_CHUNKSIZE = 100_000
+
+_TOKEN = re.compile(r"""
+    (?P<space>\s+)
+  | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<quoted>`[^`]+`)
+  | (?P<name>[A-Za-z_][A-Za-z0-9_.]*)
+  | (?P<op>->|=>|<=|>=|==|!=|<>|\+/-|&&|\|\||[±<>=+\-*/(),!])
+""", re.VERBOSE)
+_REGEX = re.compile(r"/((?:[^/\\]|\\.)*)/([i]*)")
+
+_KEYWORDS = {"and", "or", "not", "in", "matches", "is", "null", "true", "false"}
+_COMPARISONS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+    "==": operator.eq, "=": operator.eq, "!=": operator.ne, "<>": operator.ne,
+}
+_ARITHMETIC = {"+": operator.add, "-": operator.sub, "*": operator.mul, "/": operator.truediv}
+
+
+def _tokenize(text):
+    tokens = []
+    position = 0
+    while position < len(text):
+        if tokens and tokens[-1] == ("keyword", "matches"):
+            match = _REGEX.match(text, position)
+            if match:
+                flags = re.IGNORECASE if "i" in match.group(2) else 0
+                tokens.append(("regex", re.compile(match.group(1), flags)))
+                position = match.end()
+                continue
+        match = _TOKEN.match(text, position)
+        if not match:
+            raise ValueError(f"Unexpected character {text[position]!r} at position {position} in rule: {text}")
+        kind, value = match.lastgroup, match.group()
+        position = match.end()
+        if kind == "space":
+            continue
+        if kind == "name" and value.lower() in _KEYWORDS:
+            kind, value = "keyword", value.lower()
+        elif kind == "quoted":
+            kind, value = "name", value[1:-1]
+        elif kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        elif kind == "number":
+            value = float(value) if any(c in value for c in ".eE") else int(value)
+        tokens.append((kind, value))
+    tokens.append(("end", None))
+    return tokens
+
+
+# Values are pandas Series (one chunk of a column) or scalars; predicates are
+# (truth, known) pairs of boolean arrays, so a missing value makes a
+# comparison unknown rather than false.
+
+def _known(value, size):
+    if isinstance(value, pd.Series):
+        return value.notna().to_numpy(dtype=bool)
+    return np.full(size, not pd.isna(value))
+
+
+def _as_predicate(value, size):
+    if isinstance(value, pd.Series):
+        return value.fillna(False).astype(bool).to_numpy(), value.notna().to_numpy(dtype=bool)
+    return np.full(size, bool(value)), np.full(size, not pd.isna(value))
+
+
+def _is_datetime(value):
+    if isinstance(value, pd.Series):
+        return pd.api.types.is_datetime64_any_dtype(value)
+    return isinstance(value, (datetime.date, np.datetime64))
+
+
+def _as_datetime(value):
+    # Text that does not parse becomes NaT, so its comparisons are unknown
+    if isinstance(value, pd.Series):
+        if pd.api.types.is_object_dtype(value) or pd.api.types.is_string_dtype(value):
+            return pd.to_datetime(value, errors="coerce", format="mixed")
+        return value
+    if isinstance(value, str):
+        return pd.to_datetime(value, errors="coerce")
+    return value
+
+
+def _coerce_pair(left, right):
+    # When one side is a date, text on the other side (a literal or a column not detected as dates) is read as dates
+    if _is_datetime(left) and not _is_datetime(right):
+        return left, _as_datetime(right)
+    if _is_datetime(right) and not _is_datetime(left):
+        return _as_datetime(left), right
+    return left, right
+
+
+def _elementwise(function, size, *operands):
+    """``function`` applied value by value, for operands of mixed types.
+
+    Returns:
+        tuple: (truth, comparable) boolean arrays; pairs that cannot be
+        compared (a TypeError, e.g. text against a number) are not comparable.
+    """
+    def apply(*values):
+        try:
+            return bool(function(*values)), True
+        except TypeError:
+            return False, False
+
+    arrays = [operand.to_numpy(dtype=object) if isinstance(operand, pd.Series) else np.full(size, operand, dtype=object)
+              for operand in operands]
+    truth, comparable = np.frompyfunc(apply, len(arrays), 2)(*arrays)
+    return truth.astype(bool), comparable.astype(bool)
+
+
+class _Parser:
+    """Recursive descent over the rule grammar, producing closures over a chunk.
+
+    implication := or_expr [("->" | "=>") or_expr]
+    or_expr     := and_expr {("or" | "||") and_expr}
+    and_expr    := not_expr {("and" | "&&") not_expr}
+    not_expr    := ("not" | "!") not_expr | comparison
+    comparison  := sum [op sum [("±" | "+/-") sum]] | sum ["not"] "in" "(" literals ")"
+                 | sum "matches" /regex/ | sum "is" ["not"] "null"
+    sum         := product {("+" | "-") product}
+    product     := unary {("*" | "/") unary}
+    unary       := "-" unary | number | string | true | false | null | column | "(" implication ")"
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.position = 0
+        self.columns = []
+
+    def peek(self, *values):
+        kind, value = self.tokens[self.position]
+        return kind in ("op", "keyword") and value in values
+
+    def take(self):
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def expect(self, value):
+        if not self.peek(value):
+            self.error(f"expected '{value}'")
+        self.take()
+
+    def error(self, message):
+        kind, value = self.tokens[self.position]
+        found = "end of rule" if kind == "end" else repr(value)
+        raise ValueError(f"Invalid consistency rule ({message}, found {found}): {self.text}")
+
+    def parse(self):
+        kind, node = self.implication()
+        if self.tokens[self.position][0] != "end":
+            self.error("unexpected token")
+        return self.predicate(kind, node)
+
+    @staticmethod
+    def predicate(kind, node):
+        if kind == "predicate":
+            return node
+        return lambda chunk: _as_predicate(node(chunk), chunk.size)
+
+    def implication(self):
+        kind, left = self.or_expr()
+        if self.peek("->", "=>"):
+            self.take()
+            condition = self.predicate(kind, left)
+            consequence = self.predicate(*self.or_expr())
+
+            def implies(chunk):
+                truth1, known1 = condition(chunk)
+                truth2, known2 = consequence(chunk)
+                # not condition or consequence
+                return ~truth1 | truth2, (known1 & ~truth1) | (known2 & truth2) | (known1 & known2)
+            return "predicate", implies
+        return kind, left
+
+    def or_expr(self):
+        kind, left = self.and_expr()
+        while self.peek("or", "||"):
+            self.take()
+            first, second = self.predicate(kind, left), self.predicate(*self.and_expr())
+
+            def either(chunk, first=first, second=second):
+                truth1, known1 = first(chunk)
+                truth2, known2 = second(chunk)
+                return truth1 | truth2, (known1 & truth1) | (known2 & truth2) | (known1 & known2)
+            kind, left = "predicate", either
+        return kind, left
+
+    def and_expr(self):
+        kind, left = self.not_expr()
+        while self.peek("and", "&&"):
+            self.take()
+            first, second = self.predicate(kind, left), self.predicate(*self.not_expr())
+
+            def both(chunk, first=first, second=second):
+                truth1, known1 = first(chunk)
+                truth2, known2 = second(chunk)
+                return truth1 & truth2, (known1 & ~truth1) | (known2 & ~truth2) | (known1 & known2)
+            kind, left = "predicate", both
+        return kind, left
+
+    def not_expr(self):
+        if self.peek("not", "!"):
+            self.take()
+            inner = self.predicate(*self.not_expr())
+
+            def negate(chunk):
+                truth, known = inner(chunk)
+                return ~truth, known
+            return "predicate", negate
+        return self.comparison()
+
+    def comparison(self):
+        kind, left = self.sum()
+        if kind == "predicate":
+            return kind, left
+
+        if self.peek(*_COMPARISONS):
+            compare = _COMPARISONS[self.take()[1]]
+            right = self.value(*self.sum())
+            tolerance = None
+            if self.peek("±", "+/-"):
+                if compare not in (operator.eq, operator.ne):
+                    self.error("a tolerance only applies to == and !=")
+                self.take()
+                tolerance = self.value(*self.sum())
+
+            def compared(chunk):
+                a, b = _coerce_pair(left(chunk), right(chunk))
+                known = _known(a, chunk.size) & _known(b, chunk.size)
+                try:
+                    if tolerance is None:
+                        truth = compare(a, b)
+                    else:
+                        within = abs(a - b) <= tolerance(chunk)
+                        truth = within if compare is operator.eq else ~within
+                except TypeError:
+                    # Mixed types: compared value by value, and values that cannot be compared are unknown
+                    if tolerance is None:
+                        truth, comparable = _elementwise(compare, chunk.size, a, b)
+                    else:
+                        truth, comparable = _elementwise(lambda x, y, t: (abs(x - y) <= t) == (compare is operator.eq),
+                                                         chunk.size, a, b, tolerance(chunk))
+                    known &= comparable
+                if isinstance(truth, pd.Series):
+                    truth = truth.fillna(False).to_numpy(dtype=bool)
+                return np.broadcast_to(np.asarray(truth, dtype=bool), (chunk.size,)), known
+            return "predicate", compared
+
+        negated = False
+        if self.peek("not"):
+            self.take()
+            negated = True
+            if not self.peek("in"):
+                self.error("expected 'in' after 'not'")
+        if self.peek("in"):
+            self.take()
+            options = self.literal_list()
+
+            def member(chunk):
+                value = left(chunk)
+                truth = np.asarray(pd.Series(value).isin(options).to_numpy(dtype=bool))
+                if not isinstance(value, pd.Series):
+                    truth = np.full(chunk.size, truth[0])
+                return (~truth if negated else truth), _known(value, chunk.size)
+            return "predicate", member
+
+        if self.peek("matches"):
+            self.take()
+            kind, pattern = self.take()
+            if kind != "regex":
+                self.position -= 1
+                self.error("expected /regex/ after 'matches'")
+
+            def matches(chunk):
+                value = chunk.raw(left.column) if hasattr(left, "column") else left(chunk)
+                text = pd.Series(value, index=range(chunk.size)) if not isinstance(value, pd.Series) else value
+                truth = text.astype(str).str.fullmatch(pattern).fillna(False).to_numpy(dtype=bool)
+                return truth, _known(text, chunk.size)
+            return "predicate", matches
+
+        if self.peek("is"):
+            self.take()
+            negated = False
+            if self.peek("not"):
+                self.take()
+                negated = True
+            self.expect("null")
+
+            def is_null(chunk):
+                value = chunk.raw(left.column) if hasattr(left, "column") else left(chunk)
+                missing = ~_known(value, chunk.size)
+                return (~missing if negated else missing), np.ones(chunk.size, dtype=bool)
+            return "predicate", is_null
+        return kind, left
+
+    def literal_list(self):
+        self.expect("(")
+        options = []
+        while True:
+            kind, value = self.take()
+            if kind in ("number", "string"):
+                options.append(value)
+            elif kind == "keyword" and value in ("true", "false"):
+                options.append(value == "true")
+            else:
+                self.position -= 1
+                self.error("expected a literal")
+            if self.peek(")"):
+                self.take()
+                return options
+            self.expect(",")
+
+    def value(self, kind, node):
+        if kind == "predicate":
+            self.error("expected a value, not a condition")
+        return node
+
+    def sum(self):
+        kind, left = self.product()
+        while self.peek("+", "-"):
+            apply = _ARITHMETIC[self.take()[1]]
+            first, second = self.value(kind, left), self.value(*self.product())
+            kind, left = "value", (lambda chunk, first=first, second=second, apply=apply: apply(first(chunk), second(chunk)))
+        return kind, left
+
+    def product(self):
+        kind, left = self.unary()
+        while self.peek("*", "/"):
+            apply = _ARITHMETIC[self.take()[1]]
+            first, second = self.value(kind, left), self.value(*self.unary())
+            kind, left = "value", (lambda chunk, first=first, second=second, apply=apply: apply(first(chunk), second(chunk)))
+        return kind, left
+
+    def unary(self):
+        if self.peek("-"):
+            self.take()
+            inner = self.value(*self.unary())
+            return "value", lambda chunk: -inner(chunk)
+        if self.peek("("):
+            self.take()
+            result = self.implication()
+            self.expect(")")
+            return result
+
+        kind, value = self.take()
+        if kind in ("number", "string"):
+            return "value", lambda chunk: value
+        if kind == "keyword" and value in ("true", "false", "null"):
+            constant = {"true": True, "false": False, "null": None}[value]
+            return "value", lambda chunk: constant
+        if kind == "name":
+            if value not in self.columns:
+                self.columns.append(value)
+
+            def column(chunk):
+                return chunk.value(value)
+            column.column = value
+            return "value", column
+        self.position -= 1
+        self.error("expected a value")
+
+
+# One chunk of the referenced columns; date columns are parsed once per chunk
+class _Chunk:
+    def __init__(self, frame, date_formats):
+        self.frame = frame
+        self.size = len(frame)
+        self.date_formats = date_formats
+        self._values = {}
+
+    def raw(self, column):
+        return self.frame[column].reset_index(drop=True)
+
+    def value(self, column):
+        if column not in self._values:
+            values = self.raw(column)
+            if column in self.date_formats:
+                values = parse_datetime_column(values, self.date_formats[column])
+            self._values[column] = values
+        return self._values[column]
+
+
+class ConsistencyRule:
+    """A cross-column constraint compiled into vectorized column expressions.
+
+    Examples::
+
+        start_date <= end_date
+        total == qty * price ± 0.01
+        country in ('US', 'CA') -> zip matches /^[0-9A-Z -]{3,10}$/
+        `order status` = 'shipped' -> shipped_at is not null
+
+    Comparisons (``< <= > >= == != =``), arithmetic (``+ - * /``), ``and``,
+    ``or``, ``not``, implication (``->``), ``in (...)``, ``matches /regex/``
+    (full match, ``/.../i`` ignores case) and ``is [not] null`` are supported;
+    column names with spaces go in backquotes. Text columns holding dates are
+    parsed, so they compare as dates; text compared with a date is parsed
+    too. A missing value, or values that cannot be compared (text against a
+    number, text that is not a date against a date), make a comparison
+    unknown; rows where the whole rule is unknown count as consistent (require
+    values explicitly with ``is not null``).
+    """
+
+    def __init__(self, text):
+        self.text = text
+        parser = _Parser(text)
+        self._predicate = parser.parse()
+        self.columns = parser.columns
+
+    def __repr__(self):
+        return f"ConsistencyRule({self.text!r})"
+
+    def evaluate(self, chunk):
+        """Return (consistent, decided) boolean arrays for a ``_Chunk``."""
+        truth, known = self._predicate(chunk)
+        return truth | ~known, known
+
+
+# A set of rules sharing one scan over the columns they reference
+class ConsistencyRules:
+    """Evaluate many rules chunk by chunk in a single pass over the data.
+
+    Only the columns some rule references are read; each chunk of those
+    columns (with its parsed dates) is shared by every rule.
+
+    Args:
+        rules (iterable): Rule texts or ``ConsistencyRule`` objects.
+    """
+
+    def __init__(self, rules):
+        self.rules = [rule if isinstance(rule, ConsistencyRule) else ConsistencyRule(rule) for rule in rules]
+        self.columns = list(dict.fromkeys(col for rule in self.rules for col in rule.columns))
+
+    def evaluate(self, df, chunksize=DEFAULT_CHUNKSIZE, failures=None):
+        """Score every rule on ``df`` (a DataFrame or an iterable of chunks).
+
+        ``failures`` is an optional ``FailureSamples``; inconsistent rows are
+        sampled under the check "Consistency Rules", keyed by the rule text.
+
+        Returns:
+            pd.DataFrame: One row per rule with Rows, Violations, Undecided and
+            Score (percentage of consistent rows).
+        """
+        date_formats = None
+        if isinstance(df, pd.DataFrame):
+            chunks = (df.iloc[start:start + chunksize] for start in range(0, max(len(df), 1), chunksize))
+            if set(self.columns) <= set(df.columns):
+                date_formats = detect_datetime_columns(df[self.columns])
+        else:
+            chunks = df
+
+        violations = np.zeros(len(self.rules), dtype=np.int64)
+        undecided = np.zeros(len(self.rules), dtype=np.int64)
+        rows = 0
+        for chunk in chunks:
+            unknown = [col for col in self.columns if col not in chunk.columns]
+            if unknown:
+                raise ValueError(f"Consistency rules reference unknown column(s): {', '.join(map(str, unknown))}.")
+            frame = chunk[self.columns]
+            if date_formats is None:  # streamed chunks: detected on the first one
+                date_formats = detect_datetime_columns(frame)
+            view = _Chunk(frame, date_formats)
+            for i, rule in enumerate(self.rules):
+                try:
+                    consistent, decided = rule.evaluate(view)
+                except TypeError as e:
+                    raise ValueError(f"Cannot evaluate consistency rule '{rule.text}': {e}") from e
+                violations[i] += view.size - int(consistent.sum())
+                undecided[i] += view.size - int(decided.sum())
+                if failures is not None and not consistent.all():
+                    failures.record("Consistency Rules", rule.text, ~consistent, frame[rule.columns], offset=rows)
+            rows += view.size
+
+        scores = (rows - violations) / rows * 100 if rows else np.full(len(self.rules), 100.0)
+        return pd.DataFrame({
+            "Rows": rows,
+            "Violations": violations,
+            "Undecided": undecided,
+            "Score": scores,
+        }, index=pd.Index([rule.text for rule in self.rules], name="Rule"))
+
+
+def evaluate_consistency_rules(df, rules, chunksize=DEFAULT_CHUNKSIZE, failures=None):
+    """Compile ``rules`` and score them on ``df`` in one scan (see ``ConsistencyRules``)."""
+    return ConsistencyRules(rules).evaluate(df, chunksize, failures)
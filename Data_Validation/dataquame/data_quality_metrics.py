@@ -1,11 +1,22 @@
 import pandas as pd
-import re
+from Data_Validation.datatime.datetime_scoring import parse_datetime_columns, timeliness_score
+from Data_Validation.datainstr.instrumentation import column_timer
+from Data_Validation.dataconf.rule_config import ColumnView, compile_scan_plan, validity_mask
+from Data_Validation.datanull.null_mask_index import NullMaskIndex
+from Data_Validation.dataquame.dictionary_encoding import ReferenceEncoding, mismatch_counts
+from Data_Validation.dataquame.numeric_accuracy import numeric_accuracy, numeric_columns, numeric_matches
+from Data_Validation.datastats.wide_table import distinct_counts, is_wide
 
-def completeness_score(column):
-    """Calculate the completeness score of a column."""
+def completeness_score(column, nulls=None):
+    """Calculate the completeness score of a column.
+
+    ``nulls`` is an optional ``NullMaskIndex`` of the column's frame; the missing
+    count is read from it instead of scanning the column.
+    """
     if len(column) == 0:
         return 0.0  # Return 0% if the column is empty
-    return (len(column) - column.isnull().sum()) / len(column) * 100
+    missing = nulls.count(column.name) if nulls is not None else column.isnull().sum()
+    return (len(column) - missing) / len(column) * 100
 
 def uniqueness_score(column):
     """Calculate the uniqueness score of a column."""
@@ -13,8 +24,12 @@ def uniqueness_score(column):
         return 0.0  # Return 0% if the column is empty
     return column.nunique() / len(column) * 100
 
-def validity_score(column, validation_function=None):
-    """Calculate the validity score of a column based on a validation function."""
+def validity_score(column, validation_function=None, failures=None):
+    """Calculate the validity score of a column based on a validation function.
+
+    ``failures`` is an optional ``FailureSamples`` that keeps a bounded sample of
+    the invalid rows.
+    """
     if len(column) == 0:
         return 0.0  # Return 0% if the column is empty
 
@@ -26,23 +41,34 @@ def validity_score(column, validation_function=None):
         else:
             validation_function = lambda x: isinstance(x, str) and x.strip() != ""
     
-    valid_entries = column.apply(validation_function).sum()
+    valid = column.apply(validation_function).astype(bool).to_numpy()
+    if failures is not None:
+        failures.record("Validity", column.name, ~valid, column)
+    valid_entries = valid.sum()
     return valid_entries / len(column) * 100
 
-# def timeliness_score(column, threshold_date):
-#     """Calculate the timeliness score of a datetime column."""
-#     if pd.api.types.is_datetime64_any_dtype(column):
-#         if threshold_date is None:
-#             raise ValueError("Threshold date must be provided and cannot be None.")
-        
-#         threshold_date = pd.to_datetime(threshold_date).tz_localize(None)
-#         timely_entries = (column >= threshold_date).sum()
-#         return timely_entries / len(column) * 100
+def accuracy_matches(col1, col2, reference=None):
+    """Rows of ``col1`` that agree with ``col2`` (aligned on row labels): both missing or equal.
+
+    Both columns are compared as codes of one shared dictionary; ``reference``
+    is an optional ``ReferenceEncoding`` of ``col2`` that was already built.
+    Returns a boolean array with one entry per row of ``col1``.
+    """
+    if reference is None:
+        reference = ReferenceEncoding(col2)
+    codes, _ = reference.encode(col1)
+    return codes == reference.aligned_codes(col1.index)
 
-#     return 100.0  # If not a datetime column, assume 100% timeliness
+def accuracy_score(df, df2, column_name, threshold=None, failures=None, reference=None):
+    """Calculates the accuracy score between two DataFrames for a specific column.
 
-def accuracy_score(df, df2, column_name, threshold=None):
-    """Calculates the accuracy score between two DataFrames for a specific column."""
+    With ``threshold``, numeric columns match when they differ by at most that
+    much (see ``numeric_accuracy`` for relative tolerances and many columns at
+    once); other columns, and ``threshold=None``, compare exactly.
+    ``failures`` is an optional ``FailureSamples`` that keeps a bounded sample of
+    the mismatched (df, df2) value pairs. ``reference`` is an optional
+    ``ReferenceEncoding`` of ``df2[column_name]`` already built for this call.
+    """
     
     # Check if the column exists in both DataFrames
     missing_columns = []
@@ -61,19 +87,35 @@ def accuracy_score(df, df2, column_name, threshold=None):
     # Total rows
     total_entries = len(col1)
     
-    # Create masks for different cases
-    both_missing = col1.isna() & col2.isna()
-    non_missing = ~col1.isna() & ~col2.isna()
-    mismatched = col1[non_missing] != col2[non_missing]
-    
     # Calculate correct entries
-    correct_entries = both_missing.sum() + (col1[non_missing] == col2[non_missing]).sum()
+    aligned = col2 if col2.index.equals(col1.index) else col2.reindex(col1.index)
+    if threshold is not None and numeric_columns(df, df2, [column_name]):
+        correct = numeric_matches(col1, aligned, atol=threshold)
+    else:
+        correct = accuracy_matches(col1, col2, reference)
+    correct_entries = correct.sum()
+
+    if failures is not None:
+        failures.record("Accuracy", column_name, ~correct, col1, aligned)
     
     # Calculate accuracy percentage
     accuracy_percentage = (correct_entries / total_entries) * 100 if total_entries > 0 else 100
     
     return accuracy_percentage
 
+def accuracy_mismatches(df, df2, column_name, top=10, reference=None):
+    """Most frequent (value, reference value) pairs among the rows where ``column_name`` disagrees.
+
+    ``reference`` is an optional ``ReferenceEncoding`` of ``df2[column_name]``.
+
+    Returns:
+        list[dict]: ``{"value", "reference", "rows"}``; missing values are None.
+    """
+    if reference is None:
+        reference = ReferenceEncoding(df2[column_name])
+    codes, values = reference.encode(df[column_name])
+    return mismatch_counts(codes, reference.aligned_codes(df[column_name].index), values, top)
+
 
 # def accuracy_score(df, df2, column_name, threshold=None):
 #     """Calculates the accuracy score between two DataFrames for a specific column."""
@@ -108,8 +150,23 @@ def accuracy_score(df, df2, column_name, threshold=None):
 
 
 
-def consistency_score(df, df2, column1, column2=None):
-    """Calculates the consistency score by comparing two columns."""
+def consistency_matches(values1, values2):
+    """Positions where two equally long columns agree: both missing or equal.
+
+    Both missing counts as consistent (both codes are -1); one missing value or
+    different values does not.
+    """
+    reference = ReferenceEncoding(values2)
+    codes, _ = reference.encode(values1)
+    return codes == reference.codes
+
+def consistency_score(df, df2, column1, column2=None, failures=None, reference=None):
+    """Calculates the consistency score by comparing two columns row by row (by position).
+
+    ``failures`` is an optional ``FailureSamples`` that keeps a bounded sample of
+    the inconsistent (df, df2) value pairs. ``reference`` is an optional
+    ``ReferenceEncoding`` of ``df2[column2]`` already built for this call.
+    """
     
     if column2 is None:
         column2 = column1  # If column2 is not provided, compare column1 with itself
@@ -118,63 +175,124 @@ def consistency_score(df, df2, column1, column2=None):
     if column1 not in df.columns or column2 not in df2.columns:
         raise ValueError(f"Columns '{column1}' or '{column2}' are not found in their respective DataFrames.")
 
-    # Compare the two columns row by row
-    consistency = 0
     total = len(df)
+    if len(df2) < total:
+        raise ValueError(f"The second DataFrame has {len(df2)} rows; at least {total} are needed to compare by position.")
 
-    for i in range(total):
-        val1 = df.iloc[i][column1]
-        val2 = df2.iloc[i][column2]
-
-        # If both values are NaN, consider them consistent
-        if pd.isna(val1) and pd.isna(val2):
-            consistency += 1
-        # If both values are the same (non-NaN), consider them consistent
-        elif val1 == val2:
-            consistency += 1
-        # If one value is NaN and the other is not, consider it inconsistent
-        elif pd.isna(val1) or pd.isna(val2):
-            consistency += 0
-        # If values are different (and neither are NaN), consider it inconsistent
-        else:
-            consistency += 0
+    # Compare the two columns position by position as codes of the reference's dictionary
+    if reference is None:
+        reference = ReferenceEncoding(df2[column2])
+    codes, _ = reference.encode(df[column1])
+    consistent = codes == reference.codes[:total]
+    consistency = consistent.sum()
+
+    if failures is not None:
+        values2 = df2[column2].iloc[:total].reset_index(drop=True)
+        failures.record("Consistency", column1, ~consistent, df[column1], values2)
 
     # Calculate consistency percentage
     consistency_percentage = (consistency / total) * 100 if total > 0 else 100
     return consistency_percentage
 
-def calculate_scores(df, df2, selected_metrics=None, threshold_date=None):
+def calculate_scores(df, df2, selected_metrics=None, threshold_date=None, date_formats=None, rules=None,
+                     failures=None, wide=None, nulls=None):
+    """Score every column with the checks configured for it.
 
-    if selected_metrics is None:
-        selected_metrics = ["Completeness", "Validity", "Uniqueness", "Accuracy", "Consistency"]
-    
+    ``rules`` is a rule configuration (see ``Data_Validation.dataconf.rule_config``);
+    by default email-like columns are checked against an email pattern. The rules
+    are compiled into one scan plan so each column is visited once for all its checks.
+    ``failures`` is an optional ``FailureSamples`` that samples the rows failing
+    validity, accuracy and consistency during the same pass. ``wide`` selects
+    wide-table execution (see ``datastats.wide_table``); by default it is used
+    for frames with ``WIDE_TABLE_MIN_COLUMNS`` columns or more. ``nulls`` is the
+    ``NullMaskIndex`` of ``df`` when the caller already built it.
+    """
+    plan = compile_scan_plan(rules, df.columns, selected_metrics)
+    return execute_scan_plan(plan, df, df2, threshold_date, date_formats, failures, wide, nulls)
+
+def execute_scan_plan(plan, df, df2=None, threshold_date=None, date_formats=None, failures=None, wide=None, nulls=None):
+    """Run a plan from ``compile_scan_plan`` and return the per-column scores.
+
+    In wide-table mode the distinct counts behind Uniqueness are computed a
+    dtype block at a time instead of one ``nunique`` call per column.
+    """
     if threshold_date is None:
         threshold_date = pd.to_datetime("today")
-    
+
+    # Date columns are detected from a sample and parsed once, only when timeliness is requested
+    needs_timeliness = any("Timeliness" in column_plan["metrics"] for column_plan in plan.values())
+    date_columns = parse_datetime_columns(df, date_formats) if needs_timeliness else {}
+
+    # Numeric columns with a tolerance are compared together as one 2-D block
+    tolerance_columns = [col for col, column_plan in plan.items()
+                         if "Accuracy" in column_plan["metrics"] and column_plan["tolerance"]]
+    tolerant_accuracy = None
+    if tolerance_columns:
+        with column_timer("calculate_scores.Accuracy", "numeric tolerance"):
+            tolerant_accuracy = numeric_accuracy(
+                df, df2, tolerance_columns,
+                atol={col: plan[col]["tolerance"].get("atol", 0.0) for col in tolerance_columns},
+                rtol={col: plan[col]["tolerance"].get("rtol", 0.0) for col in tolerance_columns},
+                failures=failures,
+            )["Accuracy"]
+
+    if nulls is None:
+        nulls = NullMaskIndex.from_frame(df)
+    distinct = None
+    uniqueness_columns = [col for col, column_plan in plan.items() if "Uniqueness" in column_plan["metrics"]]
+    if uniqueness_columns and is_wide(df, wide):
+        with column_timer("calculate_scores.Uniqueness", "wide table"):
+            distinct = distinct_counts(df, uniqueness_columns)
+
     detailed_scores = {}
-    for col in df.columns:
+    for col, column_plan in plan.items():
         column_data = df[col]
+        view = ColumnView(column_data, nulls)  # missing mask and text form are shared by the checks
+        metrics = column_plan["metrics"]
         column_scores = {}
 
-        if "Completeness" in selected_metrics:
-            column_scores["Completeness"] = completeness_score(column_data)
+        # Each metric is timed per column when a PipelineTrace is active
+        if "Completeness" in metrics:
+            with column_timer("calculate_scores.Completeness", col):
+                column_scores["Completeness"] = (view.size - view.null_count) / view.size * 100 if view.size else 0.0
+
+        if "Uniqueness" in metrics:
+            if distinct is not None:
+                column_scores["Uniqueness"] = distinct[col] / len(df) * 100 if len(df) else 0.0
+            else:
+                with column_timer("calculate_scores.Uniqueness", col):
+                    column_scores["Uniqueness"] = uniqueness_score(column_data)
+
+        if "Validity" in metrics:
+            with column_timer("calculate_scores.Validity", col):
+                if not column_plan["validators"]:
+                    column_scores["Validity"] = 100
+                else:
+                    valid = validity_mask(view, column_plan["validators"])
+                    if failures is not None:
+                        failures.record("Validity", col, ~valid, column_data)
+                    column_scores["Validity"] = valid.sum() / view.size * 100 if view.size else 0.0
 
-        if "Uniqueness" in selected_metrics:
-            column_scores["Uniqueness"] = uniqueness_score(column_data)
+        if "Timeliness" in metrics:
+            with column_timer("calculate_scores.Timeliness", col):
+                column_scores["Timeliness"] = timeliness_score(date_columns[col], threshold_date, column_data) if col in date_columns else 100
 
-        if "Validity" in selected_metrics:
-            column_scores["Validity"] = validity_score(
-                column_data,
-                lambda x: bool(
-                    re.match(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$", str(x))
-                ),
-            ) if "email" in col.lower() else 100
+        # The reference column is encoded once for this run, shared by Accuracy and Consistency
+        reference = None
+        if ("Accuracy" in metrics and not (tolerant_accuracy is not None and col in tolerant_accuracy.index)) \
+                or "Consistency" in metrics:
+            reference = ReferenceEncoding(df2[col]) if col in df2.columns else None
 
-        if "Accuracy" in selected_metrics:
-            column_scores["Accuracy"] = accuracy_score(df, df2, col)
+        if "Accuracy" in metrics:
+            if tolerant_accuracy is not None and col in tolerant_accuracy.index:
+                column_scores["Accuracy"] = tolerant_accuracy[col]
+            else:
+                with column_timer("calculate_scores.Accuracy", col):
+                    column_scores["Accuracy"] = accuracy_score(df, df2, col, failures=failures, reference=reference)
 
-        if "Consistency" in selected_metrics:
-            column_scores["Consistency"] = consistency_score(df, df2, col)
+        if "Consistency" in metrics:
+            with column_timer("calculate_scores.Consistency", col):
+                column_scores["Consistency"] = consistency_score(df, df2, col, failures=failures, reference=reference)
 
         detailed_scores[col] = column_scores
 
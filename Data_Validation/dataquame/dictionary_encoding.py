@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+
+
+# Reference column encoded once, against which other columns are compared as integer codes
+class ReferenceEncoding:
+    """Dictionary encoding of a reference column.
+
+    The reference is factorized once into ``codes`` (-1 for missing values) and
+    its distinct ``values``. A compared column is factorized with the reference
+    dictionary first, so equal values get the reference's code and values the
+    reference never had get new codes past the end of the dictionary; only the
+    column's distinct values are looked up in the dictionary. Checking
+    agreement is then an integer comparison, and both-missing rows match
+    because both sides are -1.
+
+    Values compare as in ``pd.factorize`` of the two columns concatenated, the
+    same equality ``==`` applies to pandas object arrays (1 and 1.0 are equal,
+    1 and "1" are not).
+    """
+
+    def __init__(self, column):
+        codes, values = pd.factorize(column)
+        self.codes = codes.astype(np.int64, copy=False)
+        self.values = pd.Series(values)
+        self.index = column.index
+
+    def __len__(self):
+        return len(self.values)
+
+    def encode(self, column):
+        """Codes of ``column`` in the reference dictionary.
+
+        Returns:
+            tuple: (codes, values); ``values`` extends the reference dictionary
+            with the values only ``column`` has.
+        """
+        codes, uniques = pd.factorize(column)
+        codes = codes.astype(np.int64, copy=False)
+        if len(self.values) == 0 or len(uniques) == 0:
+            return codes, (uniques if len(uniques) else self.values.to_numpy())
+        # Only the distinct values are looked up in the reference dictionary
+        mapped, values = pd.factorize(pd.concat([self.values, pd.Series(uniques)], ignore_index=True))
+        translate = np.append(mapped[len(self.values):].astype(np.int64, copy=False), -1)
+        return translate[codes], values
+
+    def aligned_codes(self, index):
+        """Reference codes for the rows labelled ``index`` (-1 for labels the reference lacks)."""
+        if index.equals(self.index):
+            return self.codes
+        positions = self.index.get_indexer(index)
+        aligned = np.full(len(positions), -1, dtype=np.int64)
+        found = positions >= 0
+        aligned[found] = self.codes[positions[found]]
+        return aligned
+
+
+def mismatch_counts(codes, reference_codes, values, top=10):
+    """Most frequent (value, reference value) pairs among rows whose codes differ.
+
+    Args:
+        codes (np.ndarray): Codes of the compared column (from ``ReferenceEncoding.encode``).
+        reference_codes (np.ndarray): Codes of the reference for the same rows.
+        values: Dictionary returned with ``codes``; missing values (-1) become None.
+        top (int): Number of pairs returned.
+
+    Returns:
+        list[dict]: ``{"value", "reference", "rows"}``, most frequent first.
+    """
+    mismatched = codes != reference_codes
+    if not mismatched.any():
+        return []
+    size = len(values) + 1
+    pairs = (codes[mismatched] + 1) * size + (reference_codes[mismatched] + 1)
+    unique, counts = np.unique(pairs, return_counts=True)
+    order = np.argsort(-counts, kind="stable")[:top]
+
+    def value(code):
+        if code < 0:
+            return None
+        return values[code].item() if isinstance(values[code], np.generic) else values[code]
+
+    return [
+        {"value": value(pair // size - 1), "reference": value(pair % size - 1), "rows": int(count)}
+        for pair, count in zip(unique[order], counts[order])
+    ]
@@ -0,0 +1,203 @@
+import html
+import json
+
+import numpy as np
+import pandas as pd
+
+# Failing rows kept per check and column
+DEFAULT_CAPACITY = 20
+
+
+def _take(values, positions):
+    """Values at ``positions`` of a Series, DataFrame or array, without copying the rest.
+
+    Rows of a DataFrame become ``{column: value}`` dictionaries.
+    """
+    if isinstance(values, pd.DataFrame):
+        rows = values.take(positions)
+        taken = np.empty(len(rows), dtype=object)
+        taken[:] = [dict(zip(rows.columns, row)) for row in rows.itertuples(index=False, name=None)]
+        return taken
+    if isinstance(values, (pd.Series, pd.Index)):
+        return values.take(positions).to_numpy(dtype=object)
+    return np.asarray(values, dtype=object)[positions]
+
+
+def _plain(value):
+    """Turn a cell into a JSON friendly value (missing values become None)."""
+    if isinstance(value, dict):
+        return {str(key): _plain(item) for key, item in value.items()}
+    if value is None or (np.ndim(value) == 0 and pd.isna(value)):
+        return None
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (pd.Timestamp, pd.Timedelta)):
+        return str(value)
+    if isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+# Fixed-size sample of the rows that failed one check
+class FailureReservoir:
+    """Uniform sample of at most ``capacity`` failing rows of one check.
+
+    Uses priority (bottom-k) sampling: every failing row draws a random key and
+    the ``capacity`` smallest keys are kept. A batch of failures is handled with
+    array operations and only the rows that enter the sample are materialized,
+    so memory stays fixed however many rows fail. Reservoirs built over
+    different chunks combine with ``merge`` into a uniform sample of the union.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, seed=0):
+        self.capacity = int(capacity)
+        self.failures = 0
+        self._rng = np.random.default_rng(seed)
+        self._keys = np.empty(0, dtype=np.float64)
+        self._positions = np.empty(0, dtype=np.int64)
+        self._rows = np.empty(0, dtype=object)
+        self._values = np.empty(0, dtype=object)
+        self._references = np.empty(0, dtype=object)
+
+    def update(self, positions, index, values, reference=None, offset=0):
+        """Offer the failing ``positions`` of a column (or chunk of one).
+
+        Args:
+            positions (np.ndarray): Positions of the failing rows within ``values``.
+            index (pd.Index): Row labels of the column.
+            values (pd.Series or array): The checked values (full column).
+            reference (pd.Series or array, optional): The values compared against,
+                e.g. the second dataset for accuracy and consistency.
+            offset (int): Position of the chunk's first row in the whole dataset.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        self.failures += positions.size
+        if positions.size == 0 or self.capacity == 0:
+            return self
+
+        keys = self._rng.random(positions.size)
+        if self._keys.size == self.capacity:
+            # Rows with a key above the current largest kept key can never enter the sample
+            candidates = np.flatnonzero(keys < self._keys.max())
+        else:
+            candidates = np.arange(positions.size)
+        if candidates.size > self.capacity:
+            candidates = candidates[np.argpartition(keys[candidates], self.capacity - 1)[:self.capacity]]
+        if candidates.size == 0:
+            return self
+
+        chosen = positions[candidates]
+        self._add(
+            keys[candidates],
+            chosen + offset,
+            _take(index, chosen),
+            _take(values, chosen),
+            _take(reference, chosen) if reference is not None else np.full(chosen.size, None, dtype=object),
+        )
+        return self
+
+    def _add(self, keys, positions, rows, values, references):
+        keys = np.concatenate([self._keys, keys])
+        keep = np.argsort(keys, kind="stable")[:self.capacity]
+        self._keys = keys[keep]
+        self._positions = np.concatenate([self._positions, positions])[keep]
+        self._rows = np.concatenate([self._rows, rows])[keep]
+        self._values = np.concatenate([self._values, values])[keep]
+        self._references = np.concatenate([self._references, references])[keep]
+
+    def merge(self, other):
+        """Fold another reservoir of the same check into this one and return self."""
+        self.failures += other.failures
+        if other._keys.size:
+            self._add(other._keys, other._positions, other._rows, other._values, other._references)
+        return self
+
+    def samples(self):
+        """Sampled failures in row order, as a list of dictionaries."""
+        order = np.argsort(self._positions, kind="stable")
+        return [
+            {
+                "position": int(self._positions[i]),
+                "row": _plain(self._rows[i]),
+                "value": _plain(self._values[i]),
+                "reference": _plain(self._references[i]),
+            }
+            for i in order
+        ]
+
+    def to_dict(self):
+        return {"failures": self.failures, "capacity": self.capacity, "samples": self.samples()}
+
+
+# Failure reservoirs of every check and column of a run
+class FailureSamples:
+    """Collects a ``FailureReservoir`` per (check, column).
+
+    Pass one instance as ``failures=`` to ``calculate_scores`` (or to
+    ``validity_score``, ``accuracy_score`` and ``consistency_score``) and the
+    failing rows are sampled during the same pass that computes the score.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY, seed=0):
+        self.capacity = capacity
+        self.seed = seed
+        self.reservoirs = {}
+
+    def reservoir(self, check, column):
+        key = (check, column)
+        if key not in self.reservoirs:
+            self.reservoirs[key] = FailureReservoir(self.capacity, self.seed)
+        return self.reservoirs[key]
+
+    def record(self, check, column, failed, values, reference=None, offset=0):
+        """Sample the rows of ``values`` where the boolean array ``failed`` is True."""
+        positions = np.flatnonzero(np.asarray(failed, dtype=bool))
+        index = values.index if isinstance(values, (pd.Series, pd.DataFrame)) else np.arange(len(values))
+        self.reservoir(check, column).update(positions, index, values, reference, offset)
+
+    def merge(self, other):
+        for (check, column), reservoir in other.reservoirs.items():
+            self.reservoir(check, column).merge(reservoir)
+        return self
+
+    def to_dict(self):
+        """``{check: {column: {"failures", "capacity", "samples"}}}`` for checks that failed."""
+        result = {}
+        for (check, column), reservoir in self.reservoirs.items():
+            if reservoir.failures:
+                result.setdefault(check, {})[str(column)] = reservoir.to_dict()
+        return result
+
+    def to_json(self, path):
+        """Write the sampled failures as JSON and return the path."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+
+# HTML section for the combined report
+def render_failure_section(failures):
+    """Render the sampled failing rows of every check as an HTML fragment."""
+    html_content = ["<div class='failure-section'>", "<h2>Failing Rows</h2>"]
+    sampled = failures.to_dict()
+    if not sampled:
+        html_content.append("<p>No rows failed the sampled checks.</p>")
+
+    for check, columns in sampled.items():
+        html_content.append(f"<h3>{html.escape(check)}</h3>")
+        for column, reservoir in columns.items():
+            shown = len(reservoir["samples"])
+            html_content.append(
+                f"<h4>{html.escape(column)}: {reservoir['failures']} failing rows ({shown} sampled)</h4>"
+            )
+            html_content.append("<table class='stats-table'>")
+            html_content.append("<tr><th>Row</th><th>Value</th><th>Reference</th></tr>")
+            for sample in reservoir["samples"]:
+                reference = "" if sample["reference"] is None else html.escape(str(sample["reference"]))
+                html_content.append(
+                    f"<tr><td>{html.escape(str(sample['row']))}</td><td>{html.escape(str(sample['value']))}</td>"
+                    f"<td>{reference}</td></tr>"
+                )
+            html_content.append("</table>")
+    html_content.append("</div>")
+    return "\n".join(html_content)
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+# Cells compared per block of rows (rows x columns), bounding the temporary arrays
+BLOCK_CELLS = 1 << 16
+
+STAT_COLUMNS = ["Accuracy", "Mismatches", "Missing Mismatches", "Mean Abs Diff", "Max Abs Diff", "Max Rel Diff"]
+
+
+def numeric_matches(values, reference, atol=0.0, rtol=0.0):
+    """Cells where ``values`` is within ``atol + rtol * |reference|`` of ``reference``.
+
+    Works on 1-D or 2-D float arrays; ``atol`` and ``rtol`` are scalars or one
+    value per column. Two missing values match, one missing value does not,
+    and equal infinities match.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    reference = np.asarray(reference, dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        close = np.abs(values - reference) <= atol + rtol * np.abs(reference)
+    return close | (values == reference) | (np.isnan(values) & np.isnan(reference))
+
+
+def _numeric(dtype):
+    return pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype)
+
+
+def numeric_columns(df, df2, columns=None):
+    """Columns that are numeric (not boolean) in both frames."""
+    columns = df.columns if columns is None else columns
+    dtypes, dtypes2 = df.dtypes.to_dict(), df2.dtypes.to_dict()
+    return [col for col in columns if col in dtypes and col in dtypes2 and _numeric(dtypes[col]) and _numeric(dtypes2[col])]
+
+
+def _per_column(tolerance, columns):
+    if isinstance(tolerance, dict):
+        return np.array([tolerance.get(col, 0.0) for col in columns], dtype=np.float64)
+    return np.full(len(columns), tolerance, dtype=np.float64)
+
+
+def _stack(df, columns):
+    # Column-major, so each column is copied in one contiguous pass
+    matrix = np.empty((len(df), len(columns)), dtype=np.float64, order="F")
+    for j, col in enumerate(columns):
+        matrix[:, j] = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+    return matrix
+
+
+def numeric_accuracy(df, df2, columns=None, atol=0.0, rtol=0.0, failures=None):
+    """Accuracy of all numeric columns at once, within absolute/relative tolerances.
+
+    The numeric columns of ``df`` and ``df2`` (aligned on row labels, like
+    ``accuracy_score``) are stacked into two float64 matrices and compared in
+    one broadcasted operation per block of rows; see ``numeric_matches``.
+
+    Args:
+        df (pd.DataFrame): The dataset.
+        df2 (pd.DataFrame): The reference dataset.
+        columns (list, optional): Columns to compare; those that are not numeric in
+            both frames are skipped. Defaults to every shared numeric column.
+        atol, rtol (float or dict): Tolerances, or ``{column: tolerance}``.
+        failures (FailureSamples, optional): Samples the rows out of tolerance.
+
+    Returns:
+        pd.DataFrame: One row per column with ``STAT_COLUMNS``: the accuracy (%),
+        the rows out of tolerance, those where only one side is missing, and the
+        mean/max absolute and max relative difference of the rows out of
+        tolerance where both sides are present.
+    """
+    columns = numeric_columns(df, df2, columns)
+    if not columns:
+        return pd.DataFrame(columns=STAT_COLUMNS, dtype=np.float64)
+    reference = df2 if df2.index.equals(df.index) else df2[columns].reindex(df.index)
+    values = _stack(df, columns)
+    reference = _stack(reference, columns)
+    atol = _per_column(atol, columns)
+    rtol = _per_column(rtol, columns)
+
+    n_rows, n_columns = values.shape
+    mismatches = np.zeros(n_columns, dtype=np.int64)
+    missing_mismatches = np.zeros(n_columns, dtype=np.int64)
+    diff_sum = np.zeros(n_columns)
+    diff_max = np.zeros(n_columns)
+    relative_max = np.zeros(n_columns)
+    matched = np.empty((n_rows, n_columns), dtype=bool) if failures is not None else None
+
+    block_rows = max(1, BLOCK_CELLS // n_columns)
+    for start in range(0, n_rows, block_rows):
+        block = slice(start, start + block_rows)
+        a, b = values[block], reference[block]
+        diff = np.subtract(a, b)
+        np.abs(diff, out=diff)
+        magnitude = np.abs(b)
+        tolerance = atol + rtol * magnitude if rtol.any() else atol
+        # NaN differences (a missing side, or equal infinities) compare False here and are sorted out below
+        wrong = diff > tolerance
+        rows, cols = np.nonzero(np.isnan(diff))
+        mismatches += wrong.sum(axis=0)
+        np.copyto(diff, 0.0, where=~wrong)
+        diff_sum += diff.sum(axis=0)
+        diff_max = np.fmax(diff_max, diff.max(axis=0, initial=0.0))
+        relative = np.divide(diff, magnitude, out=np.zeros_like(diff), where=magnitude > 0)
+        relative_max = np.fmax(relative_max, relative.max(axis=0, initial=0.0))
+
+        missing = ~((a[rows, cols] == b[rows, cols]) | (np.isnan(a[rows, cols]) & np.isnan(b[rows, cols])))
+        missing_mismatches += np.bincount(cols[missing], minlength=n_columns)
+        if matched is not None:
+            match = ~wrong
+            match[rows[missing], cols[missing]] = False
+            matched[block] = match
+    mismatches += missing_mismatches
+
+    if matched is not None:
+        for j, col in enumerate(columns):
+            if mismatches[j]:
+                failures.record("Accuracy", col, ~matched[:, j], df[col], df2[col].reindex(df.index))
+
+    present_mismatches = mismatches - missing_mismatches
+    return pd.DataFrame({
+        "Accuracy": (n_rows - mismatches) / n_rows * 100 if n_rows else np.full(n_columns, 100.0),
+        "Mismatches": mismatches,
+        "Missing Mismatches": missing_mismatches,
+        "Mean Abs Diff": np.divide(diff_sum, present_mismatches, out=np.zeros(n_columns), where=present_mismatches > 0),
+        "Max Abs Diff": diff_max,
+        "Max Rel Diff": relative_max,
+    }, index=pd.Index(columns))
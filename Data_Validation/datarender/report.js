@@ -0,0 +1,162 @@
+// Navigation of the combined report
+function showSection(sectionId) {
+    const sections = document.querySelectorAll('.section-content');
+    sections.forEach(section => section.classList.remove('active'));
+    document.getElementById(sectionId).classList.add('active');
+}
+
+function showRows(rowId) {
+    const allTables = document.querySelectorAll('.row-table');
+    allTables.forEach(table => table.style.display = 'none');
+    document.getElementById(rowId).style.display = 'block';
+}
+
+function filterColumnStats(selectedValue) {
+    const allContainers = document.querySelectorAll('.column-container');
+    if (selectedValue === 'all') {
+        allContainers.forEach(container => container.style.display = 'block');
+    } else {
+        allContainers.forEach(container => {
+            container.style.display = container.getAttribute('data-column') === selectedValue ? 'block' : 'none';
+        });
+    }
+}
+
+// Detailed report: overview and alerts
+function toggleOverview() {
+    const sections = ['dataset-statistics', 'detailed-scores', 'average-scores', 'missing-values', 'visualizations', 'overall-score'];
+    sections.forEach(section => {
+        const elem = document.getElementById(section);
+        if (elem) elem.style.display = 'block';
+    });
+    document.getElementById('alerts-section').style.display = 'none';
+}
+
+function toggleAlerts() {
+    const hidden = ['dataset-statistics', 'detailed-scores', 'average-scores', 'missing-values', 'visualizations', 'overall-score'];
+    hidden.forEach(section => {
+        const elem = document.getElementById(section);
+        if (elem) elem.style.display = 'none';
+    });
+    document.querySelectorAll('.charts-side-by-side').forEach(chart => chart.style.display = 'none');
+
+    const alertsSection = document.getElementById('alerts-section');
+    if (alertsSection) {
+        alertsSection.style.display = 'block';
+        if (!alertsSection.dataset.loaded) {
+            const alerts = JSON.parse(document.getElementById('alerts-data').textContent);
+            showAlertList(document.getElementById('alerts-content'), alerts);
+            alertsSection.dataset.loaded = 'true';
+        }
+    }
+}
+
+// Alerts are listed virtually: only the rows in view exist in the DOM
+const ALERT_ROW_HEIGHT = 80;
+const ALERT_OVERSCAN = 5;
+const ALERT_ICONS = {critical: '\u26D4', warning: '\u26A0', info: '\u2139'};
+
+function countBy(alerts, key) {
+    const counts = new Map();
+    alerts.forEach(alert => counts.set(alert[key], (counts.get(alert[key]) || 0) + 1));
+    return counts;
+}
+
+function alertFilter(counts, allLabel) {
+    const select = document.createElement('select');
+    select.appendChild(new Option(allLabel, ''));
+    counts.forEach((count, value) => select.appendChild(new Option(`${value.replace(/_/g, ' ')} (${count})`, value)));
+    return select;
+}
+
+function alertRow(alert, position) {
+    const row = document.createElement('li');
+    row.className = `alert-row severity-${alert.severity}`;
+    row.style.top = `${position * ALERT_ROW_HEIGHT}px`;
+    row.title = alert.message;
+    const icon = document.createElement('span');
+    icon.className = 'icon';
+    icon.textContent = ALERT_ICONS[alert.severity] || '!';
+    const text = document.createElement('span');
+    text.className = 'text';
+    text.textContent = alert.message;
+    row.append(icon, text);
+    return row;
+}
+
+function showAlertList(container, alerts) {
+    container.textContent = '';
+    if (alerts.length === 0) {
+        const empty = document.createElement('p');
+        empty.textContent = 'No alerts found for this dataset.';
+        container.appendChild(empty);
+        return;
+    }
+
+    const filters = document.createElement('div');
+    filters.className = 'alert-filters';
+    const typeFilter = alertFilter(countBy(alerts, 'type'), `All alert types (${alerts.length})`);
+    const severityFilter = alertFilter(countBy(alerts, 'severity'), 'All severities');
+    const columnFilter = document.createElement('input');
+    columnFilter.type = 'search';
+    columnFilter.placeholder = 'Filter by column';
+    filters.append(typeFilter, severityFilter, columnFilter);
+
+    const summary = document.createElement('p');
+    summary.className = 'alert-summary';
+    const viewport = document.createElement('div');
+    viewport.className = 'alert-viewport';
+    const list = document.createElement('ul');
+    list.className = 'alert-list';
+    viewport.appendChild(list);
+    container.append(filters, summary, viewport);
+
+    let shown = alerts;
+    let pending = false;
+    function render() {
+        pending = false;
+        const first = Math.max(0, Math.floor(viewport.scrollTop / ALERT_ROW_HEIGHT) - ALERT_OVERSCAN);
+        const last = Math.min(shown.length, Math.ceil((viewport.scrollTop + viewport.clientHeight) / ALERT_ROW_HEIGHT) + ALERT_OVERSCAN);
+        const rows = document.createDocumentFragment();
+        for (let i = first; i < last; i++) rows.appendChild(alertRow(shown[i], i));
+        list.replaceChildren(rows);
+    }
+    function applyFilters() {
+        const type = typeFilter.value;
+        const severity = severityFilter.value;
+        const column = columnFilter.value.trim().toLowerCase();
+        shown = alerts.filter(alert =>
+            (!type || alert.type === type) &&
+            (!severity || alert.severity === severity) &&
+            (!column || String(alert.column ?? '').toLowerCase().includes(column)));
+        list.style.height = `${shown.length * ALERT_ROW_HEIGHT}px`;
+        summary.textContent = `Showing ${shown.length} of ${alerts.length} alerts`;
+        viewport.scrollTop = 0;
+        render();
+    }
+
+    viewport.addEventListener('scroll', () => {
+        if (!pending) {
+            pending = true;
+            window.requestAnimationFrame(render);
+        }
+    });
+    typeFilter.addEventListener('change', applyFilters);
+    severityFilter.addEventListener('change', applyFilters);
+    columnFilter.addEventListener('input', applyFilters);
+    applyFilters();
+}
+
+// Detailed report: per-column charts
+function showChart(column) {
+    const charts = document.querySelectorAll("[id$='-charts']");
+    charts.forEach(chart => chart.style.display = 'none');
+
+    if (column) {
+        const selectedChart = document.getElementById(`${column}-charts`);
+        document.getElementById("chart-container").style.display = 'block';
+        selectedChart.style.display = 'flex';
+    } else {
+        document.getElementById("chart-container").style.display = 'none';
+    }
+}
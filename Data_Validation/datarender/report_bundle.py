@@ -0,0 +1,172 @@
+import base64
+import gzip
+import hashlib
+import json
+import os
+import re
+import zipfile
+
+# Output modes of write_report_bundle
+BUNDLE_MODES = ("html", "gzip", "brotli", "zip")
+
+_DATA_URI = re.compile(r"""src=(["'])data:(image/[a-z+.-]+);base64,([A-Za-z0-9+/=\s]+)\1""")
+_LOCAL_REFERENCE = re.compile(r"""(?:href|src)=["'](?![a-zA-Z][a-zA-Z0-9+.-]*:|#|/)([^"'#?]+)["']""")
+
+# Restores deduplicated images from the JSON map written by dedupe_images
+_IMAGE_LOADER = """<script type="application/json" id="dq-images">{images}</script>
+<script>
+(function () {{
+    const images = JSON.parse(document.getElementById('dq-images').textContent);
+    document.querySelectorAll('img[data-dq-image]').forEach(img => {{
+        img.src = images[img.getAttribute('data-dq-image')];
+    }});
+}})();
+</script>"""
+
+# Inflates the gzip payload in the browser and replaces the page with the report
+_GZIP_LOADER = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="UTF-8"><title>{title}</title></head>
+<body>
+<noscript>This report is gzip-compressed; open it in a browser with JavaScript enabled.</noscript>
+<script type="application/octet-stream" id="dq-report">{payload}</script>
+<script>
+(async function () {{
+    const encoded = atob(document.getElementById('dq-report').textContent);
+    const bytes = Uint8Array.from(encoded, c => c.charCodeAt(0));
+    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+    const html = await new Response(stream).text();
+    document.open();
+    document.write(html);
+    document.close();
+}})();
+</script>
+</body>
+</html>
+"""
+
+
+def _image_key(payload):
+    return hashlib.sha256(payload.encode("ascii")).hexdigest()[:16]
+
+
+def extract_images(html):
+    """Replace inline base64 images by ``data-dq-image`` references.
+
+    Returns:
+        tuple: (html, ``{key: (mime type, base64 payload)}``); identical images
+        share one key, so each distinct chart is stored once.
+    """
+    images = {}
+
+    def replace(match):
+        mime, payload = match.group(2), re.sub(r"\s+", "", match.group(3))
+        key = _image_key(payload)
+        images.setdefault(key, (mime, payload))
+        return f'data-dq-image="{key}"'
+
+    return _DATA_URI.sub(replace, html), images
+
+
+def dedupe_images(html):
+    """Store every distinct inline image once and point the ``<img>`` tags at it."""
+    html, images = extract_images(html)
+    if not images:
+        return html
+    data_uris = {key: f"data:{mime};base64,{payload}" for key, (mime, payload) in images.items()}
+    loader = _IMAGE_LOADER.format(images=json.dumps(data_uris, separators=(",", ":")))
+    position = html.rfind("</body>")
+    if position == -1:
+        return html + loader
+    return html[:position] + loader + "\n" + html[position:]
+
+
+def _title(html):
+    match = re.search(r"<title>(.*?)</title>", html, flags=re.S | re.I)
+    return match.group(1).strip() if match else "Data Quality Report"
+
+
+def _write(path, data):
+    mode = "wb" if isinstance(data, bytes) else "w"
+    with open(path, mode, **({} if isinstance(data, bytes) else {"encoding": "utf-8"})) as f:
+        f.write(data)
+    return path
+
+
+def write_report_bundle(html, output_path, mode="html"):
+    """Write a rendered report in one of ``BUNDLE_MODES``.
+
+    - ``html``: the page as is.
+    - ``gzip``: a self-contained ``.html`` holding the gzip-compressed page and a
+      small loader that inflates it with the browser's DecompressionStream.
+    - ``brotli``: ``<output_path>.br`` for web servers that send it with
+      ``Content-Encoding: br`` (needs the optional ``brotli`` package).
+    - ``zip``: ``<name>.zip`` with ``report.html``, every distinct chart once as
+      a binary file under ``charts/``, and the local files the page links (shared
+      CSS/JS, logo).
+
+    All modes except ``html`` store identical images once. Shared asset files
+    (``dq_<bundle>.<hash>.css/js`` from ``datarender.templates``) stay in the
+    output directory, where every report written there links the same copy.
+
+    Returns:
+        str: Path of the written file.
+    """
+    if mode not in BUNDLE_MODES:
+        raise ValueError(f"Unknown bundle mode '{mode}'. Use one of {', '.join(BUNDLE_MODES)}.")
+    if mode == "html":
+        return _write(output_path, html)
+
+    if mode == "zip":
+        return _write_zip(html, output_path)
+
+    html = dedupe_images(html)
+    if mode == "gzip":
+        payload = base64.b64encode(gzip.compress(html.encode("utf-8"), compresslevel=9, mtime=0)).decode("ascii")
+        return _write(output_path, _GZIP_LOADER.format(title=_title(html), payload=payload))
+
+    try:
+        import brotli
+    except ImportError as e:
+        raise ImportError("Brotli bundles require the brotli package (pip install brotli).") from e
+    return _write(f"{output_path}.br", brotli.compress(html.encode("utf-8")))
+
+
+def _write_zip(html, output_path):
+    html, images = extract_images(html)
+    directory = os.path.dirname(os.path.abspath(output_path))
+
+    files = {}
+    for key, (mime, payload) in images.items():
+        extension = mime.split("/", 1)[1].split("+", 1)[0]
+        files[key] = f"charts/{key}.{extension}"
+    html = re.sub(r'data-dq-image="([0-9a-f]+)"', lambda match: f'src="{files[match.group(1)]}"', html)
+
+    zip_path = os.path.splitext(output_path)[0] + ".zip"
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("report.html", html)
+        for key, name in files.items():
+            # PNG data is already compressed
+            archive.writestr(name, base64.b64decode(images[key][1]), compress_type=zipfile.ZIP_STORED)
+        for reference in sorted(set(_LOCAL_REFERENCE.findall(html)) - set(files.values())):
+            path = os.path.normpath(os.path.join(directory, reference))
+            if os.path.isfile(path) and path.startswith(directory + os.sep):
+                archive.write(path, os.path.relpath(path, directory).replace(os.sep, "/"))
+    return zip_path
+
+
+def read_report_bundle(path):
+    """Return the HTML of a report written by ``write_report_bundle`` (images stay deduplicated)."""
+    if path.endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            return archive.read("report.html").decode("utf-8")
+    if path.endswith(".br"):
+        import brotli
+        with open(path, "rb") as f:
+            return brotli.decompress(f.read()).decode("utf-8")
+    with open(path, encoding="utf-8") as f:
+        html = f.read()
+    match = re.search(r'<script type="application/octet-stream" id="dq-report">([A-Za-z0-9+/=]+)</script>', html)
+    if match:
+        return gzip.decompress(base64.b64decode(match.group(1))).decode("utf-8")
+    return html
@@ -0,0 +1,117 @@
+import functools
+import hashlib
+import os
+import re
+import string
+
+RENDER_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_VALIDATION_DIR = os.path.dirname(RENDER_DIR)
+
+# Stylesheets and scripts of each page, in cascade order
+ASSET_BUNDLES = {
+    "combined": {
+        "css": [
+            os.path.join(DATA_VALIDATION_DIR, "dataProfrep", "Dpr.css"),
+            os.path.join(DATA_VALIDATION_DIR, "datadetairep", "Gde.css"),
+            os.path.join(RENDER_DIR, "report.css"),
+            os.path.join(DATA_VALIDATION_DIR, "dataquaclms", "Gqcls.css"),
+        ],
+        "js": [
+            os.path.join(DATA_VALIDATION_DIR, "datadetairep", "DR.js"),
+            os.path.join(RENDER_DIR, "report.js"),
+        ],
+    },
+    "ydata": {
+        "css": [
+            os.path.join(RENDER_DIR, "ydata_report.css"),
+            os.path.join(DATA_VALIDATION_DIR, "dataProfrep", "native_profile.css"),
+        ],
+        "js": [os.path.join(RENDER_DIR, "ydata_report.js")],
+    },
+}
+
+
+# Templates are read and compiled once per process
+@functools.lru_cache(maxsize=None)
+def load_template(name):
+    """Return the compiled ``string.Template`` for ``<name>.html`` in this package."""
+    with open(os.path.join(RENDER_DIR, f"{name}.html"), encoding="utf-8") as f:
+        return string.Template(f.read())
+
+
+def render_template(name, **values):
+    """Fill a page template; every ``$placeholder`` must be given."""
+    return load_template(name).substitute(values)
+
+
+def minify_css(css):
+    """Drop comments and the whitespace around CSS punctuation."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_js(js):
+    """Drop comment-only and blank lines and the indentation of the rest (string literals are untouched)."""
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+def _read(paths):
+    parts = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            parts.append(f.read())
+    return "\n".join(parts)
+
+
+@functools.lru_cache(maxsize=None)
+def bundle_assets(bundle):
+    """Concatenated, minified CSS and JS of a bundle, built once per process.
+
+    Returns:
+        dict: ``{"css": str, "js": str, "hash": str}``; the hash names the
+        written files so a changed bundle never reuses a stale file.
+    """
+    files = ASSET_BUNDLES[bundle]
+    css = minify_css(_read(files["css"]))
+    js = minify_js(_read(files["js"]))
+    digest = hashlib.sha256((css + "\0" + js).encode("utf-8")).hexdigest()[:12]
+    return {"css": css, "js": js, "hash": digest}
+
+
+def write_assets(bundle, directory):
+    """Write a bundle's CSS and JS next to the reports in ``directory`` unless already there.
+
+    Returns:
+        tuple: File names of the stylesheet and the script, relative to ``directory``.
+    """
+    assets = bundle_assets(bundle)
+    names = []
+    for kind in ("css", "js"):
+        name = f"dq_{bundle}.{assets['hash']}.{kind}"
+        path = os.path.join(directory, name)
+        if not os.path.exists(path):
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                f.write(assets[kind])
+            os.replace(temp_path, path)  # concurrent writers produce the same file
+        names.append(name)
+    return tuple(names)
+
+
+def asset_tags(bundle, output_path, inline=False):
+    """``<link>``/``<script>`` tags for a report written to ``output_path``.
+
+    By default the bundle is written once per output directory and linked, so
+    a batch of reports shares one copy. With ``inline=True`` the minified CSS
+    and JS are embedded instead, making the page self-contained.
+    """
+    if inline:
+        assets = bundle_assets(bundle)
+        return f"<style>{assets['css']}</style>\n<script>{assets['js']}</script>"
+    directory = os.path.dirname(os.path.abspath(output_path))
+    css_name, js_name = write_assets(bundle, directory)
+    return f'<link rel="stylesheet" href="{css_name}">\n<script src="{js_name}"></script>'
@@ -0,0 +1,21 @@
+// Navigation of the YData profiling page
+function showSection(sectionId) {
+    const sections = document.querySelectorAll('.section-content');
+    sections.forEach(section => section.classList.remove('active'));
+    document.getElementById(sectionId).classList.add('active');
+}
+
+// Detailed report: per-column charts
+function showColumnCharts(column) {
+    const chartSections = document.querySelectorAll('.chart-section');
+    chartSections.forEach(section => section.style.display = 'none');
+    if (column) {
+        const selectedSection = document.getElementById(`${column}-charts`);
+        if (selectedSection) {
+            document.getElementById('charts-container').style.display = 'block';
+            selectedSection.style.display = 'block';
+        }
+    } else {
+        document.getElementById('charts-container').style.display = 'none';
+    }
+}
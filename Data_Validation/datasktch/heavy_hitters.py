@@ -0,0 +1,121 @@
+import pandas as pd
+
+# Counters kept per column. Values seen fewer than (non-missing values / capacity) times may be dropped.
+DEFAULT_CAPACITY = 100
+
+
+# Mergeable Space-Saving summary of the most frequent values
+class HeavyHitters:
+    """Most frequent values of a column with at most ``capacity`` counters.
+
+    Each monitored value has an estimated ``count`` and an ``error`` bound: the
+    true count lies in ``[count - error, count]``. ``floor`` bounds the count
+    of any value that is not monitored, so every value seen more than ``floor``
+    times is in the summary. Batches are counted exactly and folded in with
+    the Space-Saving merge (counts of values missing on one side are bounded
+    by that side's floor), so summaries of chunks and partitions combine in any
+    order, and ``floor`` stays at most ``n / capacity``.
+
+    While a column has at most ``capacity`` distinct values nothing is dropped:
+    ``floor`` is 0, the counts are exact and ``distinct()`` is the exact number
+    of distinct values.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1.")
+        self.capacity = int(capacity)
+        self.n = 0
+        self.floor = 0
+        self.counters = {}  # value -> (count, error), most frequent first after each update
+
+    @property
+    def is_exact(self):
+        """True while no value has been dropped, i.e. all counts are exact."""
+        return self.floor == 0
+
+    def update(self, values):
+        """Add a batch of values (a Series or array); missing values are ignored."""
+        counts = pd.Series(values, copy=False).value_counts(dropna=True, sort=False)
+        counts = counts[counts > 0]  # categoricals list their unused categories
+        if counts.empty:
+            return self
+        batch = HeavyHitters(self.capacity)
+        batch.n = int(counts.sum())
+        if len(counts) > self.capacity:
+            # Only the values that can survive the truncation, plus the largest one dropped (the floor)
+            counts = counts.nlargest(self.capacity + 1, keep="first")
+        batch.counters = {value: (count, 0) for value, count in zip(counts.index.tolist(), counts.tolist())}
+        batch._truncate()
+        return self.merge(batch)
+
+    def merge(self, other):
+        """Fold another summary into this one (in place) and return self."""
+        merged = {}
+        for value, (count, error) in self.counters.items():
+            other_count, other_error = other.counters.get(value, (other.floor, other.floor))
+            merged[value] = (count + other_count, error + other_error)
+        for value, (count, error) in other.counters.items():
+            if value not in merged:
+                merged[value] = (count + self.floor, error + self.floor)
+        self.counters = merged
+        self.n += other.n
+        self.floor += other.floor
+        self._truncate()
+        return self
+
+    def _truncate(self):
+        # Stable sort: ties keep the order values were first seen in, like value_counts
+        ranked = sorted(self.counters.items(), key=lambda item: -item[1][0])
+        if len(ranked) > self.capacity:
+            self.floor = max(self.floor, ranked[self.capacity][1][0])
+            ranked = ranked[:self.capacity]
+        self.counters = dict(ranked)
+
+    def distinct(self):
+        """Exact number of distinct values, or None once values have been dropped."""
+        return len(self.counters) if self.is_exact else None
+
+    def top(self, k=10):
+        """The ``k`` most frequent values, most frequent first.
+
+        Returns:
+            list[dict]: ``{"value", "count", "error", "percentage"}``; ``percentage``
+            is of the non-missing values seen.
+        """
+        return [
+            {"value": value, "count": count, "error": error, "percentage": count / self.n * 100}
+            for value, (count, error) in list(self.counters.items())[:k]
+        ]
+
+    def top_values(self, k=10):
+        """The ``k`` most frequent values alone."""
+        return list(self.counters)[:k]
+
+
+def track_top_values(df, columns=None, capacity=DEFAULT_CAPACITY, chunksize=None):
+    """Build a ``HeavyHitters`` summary per column in one scan of ``df`` or of chunks of it.
+
+    Args:
+        df (pd.DataFrame or iterable of pd.DataFrame): The data, or chunks of it.
+        columns (list, optional): Columns to track. Defaults to the text,
+            categorical and boolean columns (of the first chunk).
+        capacity (int): Counters per column.
+        chunksize (int, optional): Process an in-memory frame in chunks of this size.
+
+    Returns:
+        dict: Column name -> HeavyHitters.
+    """
+    if isinstance(df, pd.DataFrame):
+        chunks = [df] if not chunksize else (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+    else:
+        chunks = df
+    trackers = None
+    for chunk in chunks:
+        if trackers is None:
+            if columns is None:
+                columns = chunk.select_dtypes(include=["object", "category", "bool"]).columns
+            trackers = {col: HeavyHitters(capacity) for col in columns}
+        for col, tracker in trackers.items():
+            tracker.update(chunk[col])
+    return trackers if trackers is not None else {col: HeavyHitters(capacity) for col in (columns or [])}
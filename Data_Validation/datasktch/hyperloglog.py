@@ -0,0 +1,44 @@
+import numpy as np
+
+# Mergeable distinct-count sketch over 64-bit hashes
+class HyperLogLog:
+    """HyperLogLog distinct counter fed with uint64 hashes.
+
+    ``precision`` p uses 2**p one-byte registers (16 KiB for the default 14) and
+    gives a relative standard error of about 1.04 / sqrt(2**p) (~0.8%).
+    Sketches with the same precision merge exactly by taking register maxima.
+    """
+
+    def __init__(self, precision=14):
+        if not 4 <= precision <= 18:
+            raise ValueError("precision must be between 4 and 18.")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    def update(self, hashes):
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        if hashes.size == 0:
+            return self
+        p = self.precision
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - p)) - 1)
+        # Position of the leftmost 1-bit in the remaining 64 - p bits
+        bit_length = np.where(rest > 0, np.frexp(rest.astype(np.float64))[1], 0)
+        rank = (64 - p - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+        return self
+
+    def merge(self, other):
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge HyperLogLog sketches with different precision.")
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+    def count(self):
+        m = self.registers.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)  # linear counting for small cardinalities
+        return int(round(estimate))
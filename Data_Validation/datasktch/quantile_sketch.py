@@ -0,0 +1,266 @@
+import numpy as np
+import pandas as pd
+
+# Default compactor size. Larger values give tighter quantiles at the cost of memory.
+DEFAULT_K = 200
+
+# A KLL-style mergeable quantile sketch
+class QuantileSketch:
+    """Mergeable approximate quantile sketch (KLL compactor hierarchy).
+
+    Values are fed in batches with ``update`` and sketches built over different
+    chunks or partitions can be combined with ``merge``. Memory stays bounded by
+    roughly ``3 * k`` retained items regardless of how many values are seen.
+    While fewer than ``k`` values have been seen nothing is compacted and every
+    query is exact (linear interpolation, same as ``pd.Series.quantile``).
+    ``seed`` drives the compaction coin flips, so the same values fed in the
+    same order always give the same sketch.
+    """
+
+    def __init__(self, k=DEFAULT_K, seed=0):
+        self.k = int(k)
+        self.n = 0
+        self.min = np.inf
+        self.max = -np.inf
+        self._levels = [np.empty(0, dtype=np.float64)]
+        self._rng = np.random.default_rng(seed)
+        self._compacted = False
+
+    @property
+    def is_exact(self):
+        """True while no compaction has happened, i.e. all values are retained."""
+        return not self._compacted
+
+    def _capacity(self, level):
+        depth = len(self._levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def _compress(self):
+        while True:
+            level = next(
+                (i for i, items in enumerate(self._levels) if items.size > self._capacity(i)),
+                None,
+            )
+            if level is None:
+                return
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0, dtype=np.float64))
+
+            items = np.sort(self._levels[level])
+            keep = items[-1:] if items.size % 2 else items[:0]
+            pairs = items[:-1] if items.size % 2 else items
+            promoted = pairs[self._rng.integers(2)::2]
+
+            self._levels[level] = keep
+            self._levels[level + 1] = np.concatenate([self._levels[level + 1], promoted])
+            self._compacted = True
+
+    def update(self, values):
+        """Add a batch of values. NaNs and non-numeric entries are ignored."""
+        values = pd.to_numeric(pd.Series(values, copy=False), errors="coerce").to_numpy(dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return self
+
+        self.n += values.size
+        self.min = min(self.min, values.min())
+        self.max = max(self.max, values.max())
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+        return self
+
+    def merge(self, other):
+        """Fold another sketch into this one (in place) and return self."""
+        if other.n == 0:
+            return self
+
+        while len(self._levels) < len(other._levels):
+            self._levels.append(np.empty(0, dtype=np.float64))
+        for level, items in enumerate(other._levels):
+            self._levels[level] = np.concatenate([self._levels[level], items])
+
+        self.n += other.n
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._compacted = self._compacted or other._compacted
+        self._compress()
+        return self
+
+    def _weighted_items(self):
+        items = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [np.full(level.size, 2 ** i, dtype=np.float64) for i, level in enumerate(self._levels)]
+        )
+        order = np.argsort(items, kind="mergesort")
+        return items[order], np.cumsum(weights[order])
+
+    def quantile(self, q):
+        """Return the approximate value at quantile ``q`` (scalar or array-like)."""
+        scalar = np.ndim(q) == 0
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+
+        if self.n == 0:
+            result = np.full(q.shape, np.nan)
+        elif self.is_exact:
+            result = np.quantile(self._levels[0], q)
+        else:
+            items, cumulative = self._weighted_items()
+            targets = q * cumulative[-1]
+            positions = np.minimum(np.searchsorted(cumulative, targets, side="left"), items.size - 1)
+            result = items[positions]
+            result = np.where(q <= 0, self.min, np.where(q >= 1, self.max, result))
+
+        return float(result[0]) if scalar else result
+
+    def cdf(self, x):
+        """Approximate fraction of values that are ``<= x`` (scalar or array-like)."""
+        scalar = np.ndim(x) == 0
+        x = np.atleast_1d(np.asarray(x, dtype=np.float64))
+
+        if self.n == 0:
+            result = np.full(x.shape, np.nan)
+        else:
+            items, cumulative = self._weighted_items()
+            positions = np.searchsorted(items, x, side="right")
+            result = np.where(positions > 0, cumulative[np.maximum(positions - 1, 0)], 0.0) / cumulative[-1]
+
+        return float(result[0]) if scalar else result
+
+    def rank_error_bound(self):
+        """Approximate normalized rank error (99% confidence) for the current state."""
+        return 0.0 if self.is_exact else 1.7 / self.k
+
+    def to_dict(self):
+        """Serialize the sketch into plain Python types (JSON friendly)."""
+        return {
+            "k": self.k,
+            "n": self.n,
+            "min": None if self.n == 0 else float(self.min),
+            "max": None if self.n == 0 else float(self.max),
+            "compacted": self._compacted,
+            "levels": [level.tolist() for level in self._levels],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a sketch serialized with ``to_dict``."""
+        sketch = cls(k=data["k"])
+        sketch.n = data["n"]
+        sketch.min = np.inf if data["min"] is None else data["min"]
+        sketch.max = -np.inf if data["max"] is None else data["max"]
+        sketch._compacted = data["compacted"]
+        sketch._levels = [np.asarray(level, dtype=np.float64) for level in data["levels"]]
+        return sketch
+
+
+# Build a sketch from an in-memory column
+def sketch_series(column, k=DEFAULT_K):
+    """Build a quantile sketch over a numeric column."""
+    return QuantileSketch(k=k).update(column)
+
+
+# Build sketches for many columns in one pass over chunked data
+def sketch_chunks(chunks, columns=None, k=DEFAULT_K):
+    """Build one sketch per numeric column in a single pass over DataFrame chunks.
+
+    Args:
+        chunks (iterable of pd.DataFrame): Chunks or partitions of the same table,
+            e.g. ``pd.read_csv(..., chunksize=...)``.
+        columns (list, optional): Columns to sketch. Defaults to the numeric
+            columns of each chunk.
+        k (int): Compactor size of each sketch.
+
+    Returns:
+        dict: Column name -> QuantileSketch.
+    """
+    sketches = {}
+    for chunk in chunks:
+        selected = columns if columns is not None else chunk.select_dtypes(include="number").columns
+        for col in selected:
+            if col in chunk.columns:
+                sketches.setdefault(col, QuantileSketch(k=k)).update(chunk[col])
+    return sketches
+
+
+# Merge per-partition sketch dictionaries
+def merge_sketches(sketch_maps):
+    """Merge several ``{column: QuantileSketch}`` dictionaries into one."""
+    merged = {}
+    for sketch_map in sketch_maps:
+        for col, sketch in sketch_map.items():
+            if col in merged:
+                merged[col].merge(sketch)
+            else:
+                merged[col] = QuantileSketch(k=sketch.k).merge(sketch)
+    return merged
+
+
+# Quantiles of a sketch, or exact quantiles of a column held in memory
+def quantile_values(source, q):
+    """Return the values at quantiles ``q`` of a QuantileSketch or an in-memory column.
+
+    A column (pd.Series or array-like) is answered exactly with
+    ``pd.Series.quantile``; sketches are only needed when the column is not in
+    memory as a whole (chunked or partitioned passes).
+    """
+    if isinstance(source, QuantileSketch):
+        return source.quantile(q)
+    values = pd.to_numeric(pd.Series(source, copy=False), errors="coerce").astype(np.float64)
+    result = values.quantile(q)
+    return float(result) if np.ndim(q) == 0 else result.to_numpy()
+
+
+def iqr_bounds(sketch, multiplier=1.5):
+    """Return the (lower, upper) IQR fences of a sketch or an in-memory column."""
+    q1, q3 = quantile_values(sketch, [0.25, 0.75])
+    iqr = q3 - q1
+    return q1 - multiplier * iqr, q3 + multiplier * iqr
+
+
+def percentile_caps(sketch, lower=0.05, upper=0.95):
+    """Return the (lower, upper) values used to cap or winsorize a column (or its sketch)."""
+    lower_lim, upper_lim = quantile_values(sketch, [lower, upper])
+    return lower_lim, upper_lim
+
+
+def fraction_within(sketch, lower_bound, upper_bound):
+    """Approximate share of sketched values inside [lower_bound, upper_bound]."""
+    if sketch.n == 0 or np.isnan(lower_bound) or np.isnan(upper_bound):
+        return 0.0
+    below = sketch.cdf(np.nextafter(lower_bound, -np.inf))
+    return max(0.0, sketch.cdf(upper_bound) - below)
+
+
+# Compare a sketch against the exact quantiles of the full column
+def quantile_error_report(sketch, column, quantiles=(0.05, 0.25, 0.5, 0.75, 0.95)):
+    """Report the error of a sketch against exact quantiles of ``column``.
+
+    Returns:
+        pd.DataFrame: One row per quantile with the exact and approximate values,
+        the absolute value error and the rank error (fraction of the column lying
+        between the two values), plus the sketch's theoretical rank error bound.
+    """
+    values = pd.to_numeric(column, errors="coerce").dropna().to_numpy(dtype=np.float64)
+    values.sort()
+    quantiles = np.asarray(quantiles, dtype=np.float64)
+
+    exact = np.quantile(values, quantiles) if values.size else np.full(quantiles.shape, np.nan)
+    approx = sketch.quantile(quantiles)
+
+    if values.size:
+        exact_rank = np.searchsorted(values, exact, side="right") / values.size
+        approx_rank = np.searchsorted(values, approx, side="right") / values.size
+        rank_error = np.abs(approx_rank - exact_rank)
+    else:
+        rank_error = np.full(quantiles.shape, np.nan)
+
+    return pd.DataFrame(
+        {
+            "Quantile": quantiles,
+            "Exact": exact,
+            "Approximate": approx,
+            "Absolute Error": np.abs(approx - exact),
+            "Rank Error": rank_error,
+            "Rank Error Bound": sketch.rank_error_bound(),
+        }
+    )
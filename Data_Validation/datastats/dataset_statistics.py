@@ -0,0 +1,128 @@
+import pandas as pd
+
+from Data_Validation.datasktch.hyperloglog import HyperLogLog
+from Data_Validation.datadupl.duplicate_detection import DuplicateCounter, _HashSet, value_hashes
+
+
+# Accumulates dataset-wide statistics from per-column partial results
+class DatasetStatistics:
+    """Dataset statistics built from per-column partials, chunk by chunk.
+
+    Each column contributes its cell count, missing count, deep memory and the
+    hashes of its distinct values; nothing copies the whole frame into one array.
+    Distinct cells are exact (union of per-column hash sets) or, with
+    ``distinct_mode="sketch"``, estimated with a HyperLogLog sketch of fixed size.
+
+    Args:
+        distinct_mode (str): "exact" or "sketch".
+        duplicates (bool): Also count duplicate rows from row hashes.
+    """
+
+    def __init__(self, distinct_mode="exact", duplicates=True):
+        if distinct_mode not in ("exact", "sketch"):
+            raise ValueError("distinct_mode must be 'exact' or 'sketch'.")
+        self.distinct_mode = distinct_mode
+        self.n_rows = 0
+        self.columns = []
+        self.missing = {}
+        self.memory = {}
+        self.index_memory = 0
+        self._distinct_hashes = _HashSet()
+        self._distinct_sketch = HyperLogLog() if distinct_mode == "sketch" else None
+        self._duplicates = DuplicateCounter(track_columns=False) if duplicates else None
+
+    def update(self, chunk, nulls=None):
+        # nulls: the chunk's NullMaskIndex, when built already, for the missing counts
+        for col in chunk.columns:
+            if col not in self.missing:
+                self.columns.append(col)
+                self.missing[col] = 0
+                self.memory[col] = 0
+
+            column = chunk[col]
+            self.missing[col] += nulls.count(col) if nulls is not None else int(column.isna().sum())
+            self.memory[col] += int(column.memory_usage(index=False, deep=True))
+
+            # Same hashing as the duplicate counts: 1, 1.0 and True are one value in any column
+            hashes = value_hashes(column)[column.notna().to_numpy()]
+            if self._distinct_sketch is not None:
+                self._distinct_sketch.update(hashes)
+            else:
+                self._distinct_hashes.add(hashes)
+
+        if self._duplicates is not None:
+            self._duplicates.update(chunk)
+        self.n_rows += len(chunk)
+        self.index_memory = max(self.index_memory, int(chunk.index.memory_usage()))
+        return self
+
+    def merge(self, other):
+        for col in other.columns:
+            if col not in self.missing:
+                self.columns.append(col)
+                self.missing[col] = 0
+                self.memory[col] = 0
+            self.missing[col] += other.missing[col]
+            self.memory[col] += other.memory[col]
+
+        if self._distinct_sketch is not None:
+            self._distinct_sketch.merge(other._distinct_sketch)
+        else:
+            self._distinct_hashes.merge(other._distinct_hashes)
+        if self._duplicates is not None:
+            self._duplicates.merge(other._duplicates)
+        self.n_rows += other.n_rows
+        self.index_memory = max(self.index_memory, other.index_memory)
+        return self
+
+    def result(self):
+        """Return the raw dataset statistics as a dictionary of numbers."""
+        total_cells = self.n_rows * len(self.columns)
+        missing_cells = sum(self.missing.values())
+        if self._distinct_sketch is not None:
+            distinct_cells = self._distinct_sketch.count()
+        else:
+            distinct_cells = int(self._distinct_hashes.values().size)
+        distinct_cells += int(missing_cells > 0)  # pd.unique counts NaN as one value
+
+        return {
+            "rows": self.n_rows,
+            "columns": len(self.columns),
+            "total_cells": total_cells,
+            "missing_cells": missing_cells,
+            "distinct_cells": distinct_cells,
+            "distinct_exact": self._distinct_sketch is None,
+            "duplicate_rows": self._duplicates.summary()["duplicate_rows"] if self._duplicates is not None else None,
+            "memory_bytes": sum(self.memory.values()) + self.index_memory,
+        }
+
+
+def compute_dataset_statistics(df, duplicates=None, distinct_mode="exact", chunksize=None, nulls=None):
+    """Compute dataset-wide statistics from per-column partial results.
+
+    Args:
+        df (pd.DataFrame or iterable of pd.DataFrame): The data, or chunks of it.
+        duplicates (dict, optional): Summary from ``find_duplicates``; reused for the
+                                     duplicate row count instead of hashing rows again.
+        distinct_mode (str): "exact" or "sketch" (HyperLogLog estimate).
+        chunksize (int, optional): Process an in-memory frame in chunks of this size.
+        nulls (NullMaskIndex, optional): Missing-value bitmaps of an in-memory frame.
+
+    Returns:
+        dict: rows, columns, total_cells, missing_cells, distinct_cells, distinct_exact,
+        duplicate_rows and memory_bytes.
+    """
+    engine = DatasetStatistics(distinct_mode=distinct_mode, duplicates=duplicates is None)
+    if isinstance(df, pd.DataFrame) and not chunksize:
+        engine.update(df, nulls)
+    else:
+        chunks = df
+        if isinstance(df, pd.DataFrame):
+            chunks = (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+        for chunk in chunks:
+            engine.update(chunk)
+
+    statistics = engine.result()
+    if duplicates is not None:
+        statistics["duplicate_rows"] = duplicates["duplicate_rows"]
+    return statistics
@@ -0,0 +1,289 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from Data_Validation.datastats.wide_table import dtype_blocks
+
+# Bins of each histogram
+DEFAULT_BINS = 32
+
+# "fixed": equal-width bins over the column's range; "adaptive": equal-frequency bins from its quantiles
+BINNING_MODES = ("fixed", "adaptive")
+
+
+def histogram_kind(dtype):
+    """"numeric", "datetime" or None for the columns that get no histogram (booleans, text, ...)."""
+    if pd.api.types.is_bool_dtype(dtype):
+        return None
+    if pd.api.types.is_numeric_dtype(dtype):
+        return "numeric"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "datetime"
+    return None
+
+
+# Mergeable histogram over fixed edges
+class Histogram:
+    """Counts of a column's values between ``edges``, plus underflow, overflow and missing counts.
+
+    Bins are closed on the left, the last one on both sides (like
+    ``np.histogram``). Datetime columns are binned on nanoseconds since the
+    epoch. Histograms over the same edges merge exactly; otherwise both are
+    re-binned onto equal-width edges spanning both ranges, taking values as
+    spread evenly within each bin, so counts may become fractional.
+    """
+
+    def __init__(self, edges, kind="numeric"):
+        self.edges = np.asarray(edges, dtype=np.float64)
+        if self.edges.ndim != 1 or len(self.edges) < 2 or np.any(np.diff(self.edges) <= 0):
+            raise ValueError("edges must be at least two increasing values.")
+        self.kind = kind
+        self.counts = np.zeros(len(self.edges) - 1)
+        self.underflow = 0.0
+        self.overflow = 0.0
+        self.missing = 0
+
+    @property
+    def bins(self):
+        return len(self.counts)
+
+    @property
+    def n(self):
+        """Non-missing values counted, inside and outside the edges."""
+        return float(self.counts.sum() + self.underflow + self.overflow)
+
+    def is_uniform(self):
+        widths = np.diff(self.edges)
+        return bool(np.allclose(widths, widths[0], rtol=1e-9, atol=0))
+
+    def update(self, values):
+        """Add a batch of values (a Series or array)."""
+        block = _as_float(pd.Series(values, copy=False))[:, None]
+        if self.is_uniform():
+            counts = _bin_uniform(block, self.edges[:1], self.edges[-1:], self.bins)[0]
+        else:
+            counts = _bin_edges(block[:, 0], self.edges)
+        self._add(counts)
+        return self
+
+    def _add(self, counts):
+        # counts: [underflow, bins..., overflow, missing]
+        self.underflow += counts[0]
+        self.counts += counts[1:-2]
+        self.overflow += counts[-2]
+        self.missing += int(counts[-1])
+
+    def merge(self, other):
+        """Fold another histogram into this one (in place) and return self."""
+        if len(other.edges) == len(self.edges) and np.array_equal(other.edges, self.edges):
+            self.counts = self.counts + other.counts
+            self.underflow += other.underflow
+            self.overflow += other.overflow
+        else:
+            edges = np.linspace(min(self.edges[0], other.edges[0]), max(self.edges[-1], other.edges[-1]),
+                                max(self.bins, other.bins) + 1)
+            merged = self.rebin(edges)
+            rebinned = other.rebin(edges)
+            self.edges, self.counts = merged.edges, merged.counts + rebinned.counts
+            self.underflow = merged.underflow + rebinned.underflow
+            self.overflow = merged.overflow + rebinned.overflow
+        self.missing += other.missing
+        return self
+
+    def rebin(self, edges):
+        """This histogram on other ``edges``, taking values as spread evenly within each bin."""
+        result = Histogram(edges, self.kind)
+        cumulative = np.concatenate([[0.0], np.cumsum(self.counts)])
+        below = np.interp(result.edges, self.edges, cumulative)  # in-range values below each new edge
+        result.counts = np.diff(below)
+        result.underflow = self.underflow + below[0]
+        result.overflow = self.overflow + cumulative[-1] - below[-1]
+        result.missing = self.missing
+        return result
+
+    def fractions(self):
+        """Share of the non-missing values in [underflow, bins..., overflow]."""
+        counts = np.concatenate([[self.underflow], self.counts, [self.overflow]])
+        total = counts.sum()
+        return counts / total if total else counts
+
+    def labels(self):
+        """Bin edges for display: floats, or timestamps (to the millisecond) for datetime columns."""
+        if self.kind == "datetime":
+            return list(pd.to_datetime(self.edges.astype(np.int64)).round("ms"))
+        return self.edges.tolist()
+
+    def to_dict(self):
+        """Compact JSON-friendly form: equal-width edges as their range, whole counts as ints."""
+        data = {"kind": self.kind}
+        if self.is_uniform():
+            data.update(low=float(self.edges[0]), high=float(self.edges[-1]), bins=self.bins)
+        else:
+            data["edges"] = self.edges.tolist()
+        whole = np.array_equal(self.counts, np.round(self.counts))
+        data["counts"] = self.counts.astype(np.int64).tolist() if whole else np.round(self.counts, 3).tolist()
+        data.update(underflow=_compact(self.underflow), overflow=_compact(self.overflow), missing=self.missing)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        edges = data["edges"] if "edges" in data else np.linspace(data["low"], data["high"], data["bins"] + 1)
+        histogram = cls(edges, data.get("kind", "numeric"))
+        histogram.counts = np.asarray(data["counts"], dtype=np.float64)
+        histogram.underflow = float(data["underflow"])
+        histogram.overflow = float(data["overflow"])
+        histogram.missing = int(data["missing"])
+        return histogram
+
+
+def _compact(value):
+    return int(value) if float(value).is_integer() else round(float(value), 3)
+
+
+def _as_float(column):
+    # Datetimes as nanoseconds since the epoch; missing values as NaN
+    if pd.api.types.is_datetime64_any_dtype(column.dtype):
+        if isinstance(column.dtype, pd.DatetimeTZDtype):
+            column = column.dt.tz_convert(None)
+        values = column.to_numpy(dtype="datetime64[ns]")
+        result = values.view(np.int64).astype(np.float64)
+        result[np.isnat(values)] = np.nan
+        return result
+    return column.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _block_values(df, columns, dtype):
+    if histogram_kind(dtype) == "datetime":
+        return np.column_stack([_as_float(df[col]) for col in columns]) if len(df) else np.empty((0, len(columns)))
+    return df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _bin_uniform(values, lows, highs, bins):
+    """Counts per column of a 2-D block over equal-width edges, from one ``bincount``.
+
+    Returns:
+        np.ndarray: (columns, bins + 3) counts laid out as [underflow, bins..., overflow, missing].
+    """
+    n_rows, n_columns = values.shape
+    with np.errstate(invalid="ignore", divide="ignore"):
+        position = np.floor((values - lows) / ((highs - lows) / bins))
+    position = np.clip(position, -1, bins) + 1  # 0: underflow, bins + 1: overflow
+    position[values == highs] = bins  # the last bin is closed on the right
+    position[np.isnan(values)] = bins + 2
+    position = position.astype(np.int64) + np.arange(n_columns) * (bins + 3)
+    return np.bincount(position.ravel(), minlength=n_columns * (bins + 3)).reshape(n_columns, bins + 3)
+
+
+def _bin_edges(values, edges):
+    """Counts of a 1-D array over arbitrary edges, laid out like ``_bin_uniform``."""
+    bins = len(edges) - 1
+    position = np.searchsorted(edges, values, side="right")  # 0: underflow, bins + 1: overflow
+    position[values == edges[-1]] = bins
+    position[np.isnan(values)] = bins + 2
+    return np.bincount(position, minlength=bins + 3)
+
+
+def _edges(low, high, bins):
+    if not (np.isfinite(low) and np.isfinite(high)):
+        return np.linspace(0.0, 1.0, bins + 1)
+    if low == high:
+        low, high = low - 0.5, high + 0.5
+    return np.linspace(low, high, bins + 1)
+
+
+def _block_histograms(values, columns, kind, bins, binning, edges):
+    # Columns with given edges are binned on them; the others get edges from this block
+    histograms = {}
+    finite = np.where(np.isfinite(values), values, np.nan)
+    if binning == "adaptive":
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-missing columns
+            quantiles = np.nanquantile(finite, np.linspace(0, 1, bins + 1), axis=0) if len(values) else None
+    uniform = {}
+    for j, col in enumerate(columns):
+        if col in edges:
+            histograms[col] = Histogram(edges[col], kind)
+        elif binning == "adaptive" and quantiles is not None and np.isfinite(quantiles[0, j]):
+            column_edges = np.unique(quantiles[:, j])
+            histograms[col] = Histogram(column_edges if len(column_edges) > 1 else _edges(column_edges[0], column_edges[0], 1), kind)
+        else:
+            present = finite[:, j][~np.isnan(finite[:, j])]
+            low, high = (present.min(), present.max()) if len(present) else (np.nan, np.nan)
+            histograms[col] = Histogram(_edges(low, high, bins), kind)
+        if histograms[col].bins == bins and histograms[col].is_uniform():
+            uniform[j] = col
+
+    # Equal-width columns with the same number of bins are counted together
+    if uniform:
+        lows = np.array([histograms[col].edges[0] for col in uniform.values()])
+        highs = np.array([histograms[col].edges[-1] for col in uniform.values()])
+        counts = _bin_uniform(values[:, list(uniform)], lows, highs, bins)
+        for row, col in enumerate(uniform.values()):
+            histograms[col]._add(counts[row])
+    for j, col in enumerate(columns):
+        if j not in uniform:
+            histograms[col]._add(_bin_edges(values[:, j], histograms[col].edges))
+    return histograms
+
+
+def build_histograms(df, columns=None, bins=DEFAULT_BINS, binning="fixed", edges=None, chunksize=None):
+    """Histogram every numeric and datetime column in one vectorized pass per dtype block.
+
+    Columns of a dtype block that share equal-width binning are counted with a
+    single ``np.bincount`` over the whole block; columns with adaptive
+    (equal-frequency) or given edges are binned with one ``searchsorted`` each.
+
+    Args:
+        df (pd.DataFrame or iterable of pd.DataFrame): The data, or chunks of it.
+        columns (list, optional): Columns to bin. Defaults to the numeric (not
+            boolean) and datetime columns (of the first chunk).
+        bins (int): Bins per column.
+        binning (str): "fixed" (equal width over the range) or "adaptive"
+            (equal frequency, from the quantiles); see ``BINNING_MODES``.
+        edges (dict, optional): Column name -> edges to use instead, e.g. those of
+            a previous run's histograms, which makes the counts directly comparable.
+        chunksize (int, optional): Process an in-memory frame in chunks of this size.
+
+    Returns:
+        dict: Column name -> Histogram. With chunks, edges come from each chunk
+        unless given, and the chunk histograms are merged (see ``Histogram.merge``).
+    """
+    if binning not in BINNING_MODES:
+        raise ValueError(f"binning must be one of {BINNING_MODES}.")
+    if bins < 1:
+        raise ValueError("bins must be at least 1.")
+    edges = edges or {}
+    if isinstance(df, pd.DataFrame):
+        chunks = [df] if not chunksize else (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+    else:
+        chunks = df
+
+    histograms = None
+    for chunk in chunks:
+        if histograms is None:
+            if columns is None:
+                columns = [col for col, dtype in chunk.dtypes.items() if histogram_kind(dtype)]
+            histograms = {}
+        chunk_histograms = {}
+        for dtype, block_columns in dtype_blocks(chunk, columns):
+            kind = histogram_kind(dtype)
+            if kind is None:
+                raise ValueError(f"Column(s) {block_columns} are neither numeric nor datetime.")
+            chunk_histograms.update(_block_histograms(_block_values(chunk, block_columns, dtype), block_columns,
+                                                      kind, bins, binning, edges))
+        for col in columns:
+            if col in histograms:
+                histograms[col].merge(chunk_histograms[col])
+            else:
+                histograms[col] = chunk_histograms[col]
+    return histograms if histograms is not None else {}
+
+
+def histogram_psi(previous, current, epsilon=1e-4):
+    """Population stability index of ``current`` against ``previous``, on the previous edges."""
+    if previous.n == 0 or current.n == 0:
+        return 0.0 if previous.n == current.n else np.inf
+    expected = np.clip(previous.fractions(), epsilon, None)
+    actual = np.clip(current.rebin(previous.edges).fractions(), epsilon, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
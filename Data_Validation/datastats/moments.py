@@ -0,0 +1,233 @@
+import numpy as np
+import pandas as pd
+
+# Cells converted to float64 per block of rows when a frame is added
+BLOCK_CELLS = 1 << 18
+
+# pandas treats central moment sums below this as floating point error (nanops._zero_out_fperr)
+_FPERR = 1e-14
+
+SUMMARY_COLUMNS = ["count", "mean", "variance", "std", "coefficient_of_variation", "skewness", "kurtosis"]
+
+
+def _zero_out_fperr(values):
+    return np.where(np.abs(values) < _FPERR, 0.0, values)
+
+
+# Central moments of several numeric columns, mergeable across chunks and partitions
+class MomentsAccumulator:
+    """Count, mean and central moment sums M2, M3, M4 of every column.
+
+    A block of rows is reduced in one vectorized pass over all columns (missing
+    values skipped per column); blocks and partials are combined with Pébay's
+    pairwise update, which is exact in arithmetic and stays stable because
+    every sum is centered on its own mean. Variance, coefficient of variation,
+    skewness and kurtosis follow the definitions of ``Series.var``,
+    ``Series.skew`` and ``Series.kurtosis``.
+    """
+
+    def __init__(self, columns):
+        k = len(columns)
+        self.columns = list(columns)
+        self.n = np.zeros(k)
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.m3 = np.zeros(k)
+        self.m4 = np.zeros(k)
+
+    def update(self, values):
+        """Add a block of rows (2-D float array with one column per column, NaN for missing)."""
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 1:
+            values = values[:, None]
+        present = ~np.isnan(values)
+        block = MomentsAccumulator(self.columns)
+        block.n = present.sum(axis=0).astype(np.float64)
+        d = np.where(present, values, 0.0)
+        block.mean = np.divide(d.sum(axis=0), block.n, out=np.zeros(len(self.columns)), where=block.n > 0)
+        d -= block.mean
+        d[~present] = 0.0
+        d2 = d * d
+        block.m2 = d2.sum(axis=0)
+        d *= d2
+        block.m3 = d.sum(axis=0)
+        d2 *= d2
+        block.m4 = d2.sum(axis=0)
+        return self.merge(block)
+
+    def update_frame(self, df):
+        """Add the rows of ``df[self.columns]``, converted to float64 a block of rows at a time."""
+        if not self.columns:
+            return self
+        block_rows = max(1, BLOCK_CELLS // len(self.columns))
+        frame = df[self.columns]
+        for start in range(0, len(frame), block_rows):
+            self.update(frame.iloc[start:start + block_rows].to_numpy(dtype=np.float64, na_value=np.nan))
+        return self
+
+    def merge(self, other):
+        na, nb = self.n, other.n
+        n = na + nb
+        delta = other.mean - self.mean
+        delta_n = np.divide(delta, n, out=np.zeros_like(delta), where=n > 0)
+        # Higher moments first: they use the M2 and M3 of both sides before the update
+        self.m4 = (self.m4 + other.m4 + delta * delta_n ** 3 * na * nb * (na * na - na * nb + nb * nb)
+                   + 6 * delta_n ** 2 * (na * na * other.m2 + nb * nb * self.m2)
+                   + 4 * delta_n * (na * other.m3 - nb * self.m3))
+        self.m3 = (self.m3 + other.m3 + delta * delta_n ** 2 * na * nb * (na - nb)
+                   + 3 * delta_n * (na * other.m2 - nb * self.m2))
+        self.m2 = self.m2 + other.m2 + delta * delta_n * na * nb
+        self.mean = self.mean + delta_n * nb
+        self.n = n
+        return self
+
+    def variance(self, ddof=1):
+        """Variance of each column (NaN with ``ddof`` or fewer values)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.n > ddof, self.m2 / (self.n - ddof), np.nan)
+
+    def std(self, ddof=1):
+        return np.sqrt(self.variance(ddof))
+
+    def coefficient_of_variation(self):
+        """Standard deviation over the absolute mean (NaN where the mean is zero)."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.mean != 0, self.std() / np.abs(self.mean), np.nan)
+
+    def skewness(self):
+        """Adjusted Fisher-Pearson skewness (same definition as Series.skew)."""
+        n = self.n
+        m2 = _zero_out_fperr(self.m2)
+        m3 = _zero_out_fperr(self.m3)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result = (n * (n - 1) ** 0.5 / (n - 2)) * (m3 / m2 ** 1.5)
+        result = np.where(m2 == 0, 0.0, result)
+        return np.where(n < 3, np.nan, result)
+
+    def kurtosis(self):
+        """Excess kurtosis (same definition as Series.kurtosis)."""
+        n = self.n
+        with np.errstate(invalid="ignore", divide="ignore"):
+            adj = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+            numerator = _zero_out_fperr(n * (n + 1) * (n - 1) * self.m4)
+            denominator = _zero_out_fperr((n - 2) * (n - 3) * self.m2 ** 2)
+            result = numerator / denominator - adj
+        result = np.where(denominator == 0, 0.0, result)
+        return np.where(n < 4, np.nan, result)
+
+    def summary(self):
+        """One row per column with ``SUMMARY_COLUMNS``."""
+        return pd.DataFrame({
+            "count": self.n.astype(np.int64),
+            "mean": np.where(self.n > 0, self.mean, np.nan),
+            "variance": self.variance(),
+            "std": self.std(),
+            "coefficient_of_variation": self.coefficient_of_variation(),
+            "skewness": self.skewness(),
+            "kurtosis": self.kurtosis(),
+        }, index=pd.Index(self.columns), columns=SUMMARY_COLUMNS)
+
+
+# Pairwise co-moments for df.corr (pairwise complete observations), mergeable across partitions
+class CoMoments:
+    """Count, means, sums of squares and co-moments of every pair of columns.
+
+    Each pair only uses the rows where both columns are present, like
+    ``DataFrame.corr``. Partitions are combined with Chan's parallel update.
+    With ``other_columns`` the pairs are ``columns`` against ``other_columns``
+    (a tile of the matrix) and ``update`` takes a block of each.
+    """
+
+    def __init__(self, columns, other_columns=None):
+        self.columns = list(columns)
+        self.other_columns = None if other_columns is None else list(other_columns)
+        shape = (len(self.columns), len(self.columns if other_columns is None else self.other_columns))
+        self.n = np.zeros(shape)
+        self.mean_x = np.zeros(shape)
+        self.mean_y = np.zeros(shape)
+        self.m2_x = np.zeros(shape)
+        self.m2_y = np.zeros(shape)
+        self.c = np.zeros(shape)
+
+    def update(self, values, other_values=None):
+        """Add a block of rows (2-D float array, NaN for missing), and of ``other_columns`` if set."""
+        x, mask, shift_x = _centred(values)
+        if self.other_columns is None:
+            y, mask_y, shift_y = x, mask, shift_x
+        else:
+            y, mask_y, shift_y = _centred(other_values)
+
+        n = mask.T @ mask_y
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sum_x = x.T @ mask_y  # [i, j]: sum of column i over rows where i and j are present
+            mean_x = np.where(n > 0, sum_x / n, 0.0)
+            block = CoMoments(self.columns, self.other_columns)
+            block.n = n
+            block.m2_x = (x ** 2).T @ mask_y - n * mean_x ** 2
+            if self.other_columns is None:
+                mean_y = mean_x.T
+                block.m2_y = block.m2_x.T
+            else:
+                mean_y = np.where(n > 0, (mask.T @ y) / n, 0.0)
+                block.m2_y = mask.T @ y ** 2 - n * mean_y ** 2
+            block.c = x.T @ y - n * mean_x * mean_y
+            block.mean_x = mean_x + shift_x[:, None]
+            block.mean_y = mean_y + shift_y[None, :]
+        return self.merge(block)
+
+    def merge(self, other):
+        n = self.n + other.n
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(n > 0, self.n * other.n / n, 0.0)
+            ratio = np.where(n > 0, other.n / n, 0.0)
+        delta_x = other.mean_x - self.mean_x
+        delta_y = other.mean_y - self.mean_y
+        self.m2_x = self.m2_x + other.m2_x + delta_x ** 2 * weight
+        self.m2_y = self.m2_y + other.m2_y + delta_y ** 2 * weight
+        self.c = self.c + other.c + delta_x * delta_y * weight
+        self.mean_x = self.mean_x + delta_x * ratio
+        self.mean_y = self.mean_y + delta_y * ratio
+        self.n = n
+        return self
+
+    def correlation(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            denominator = np.sqrt(self.m2_x * self.m2_y)
+            corr = np.where((self.n > 0) & (denominator != 0), self.c / denominator, np.nan)
+        other_columns = self.columns if self.other_columns is None else self.other_columns
+        return pd.DataFrame(np.clip(corr, -1, 1), index=self.columns, columns=other_columns)
+
+
+def _centred(values):
+    # Values centred on the block's column means (keeps the sums small), zero where missing
+    present = ~np.isnan(values)
+    counts = present.sum(axis=0)
+    x = np.where(present, values, 0.0)
+    shift = np.divide(x.sum(axis=0), counts, out=np.zeros(values.shape[1]), where=counts > 0)
+    return np.where(present, x - shift, 0.0), present.astype(np.float64), shift
+
+
+def compute_moments(df, columns=None, chunksize=None):
+    """Moments of the numeric columns of a frame or of chunks of it.
+
+    Args:
+        df (pd.DataFrame or iterable of pd.DataFrame): The data, or chunks of it.
+        columns (list, optional): Columns to summarize. Defaults to the int64 and
+            float64 columns (of the first chunk).
+        chunksize (int, optional): Process an in-memory frame in chunks of this size.
+
+    Returns:
+        MomentsAccumulator: see ``summary`` for a table of the statistics.
+    """
+    if isinstance(df, pd.DataFrame):
+        chunks = [df] if not chunksize else (df.iloc[start:start + chunksize] for start in range(0, len(df), chunksize))
+    else:
+        chunks = df
+    moments = None
+    for chunk in chunks:
+        if moments is None:
+            if columns is None:
+                columns = chunk.select_dtypes(include=["int64", "float64"]).columns
+            moments = MomentsAccumulator(columns)
+        moments.update_frame(chunk)
+    return moments if moments is not None else MomentsAccumulator(columns if columns is not None else [])
@@ -0,0 +1,167 @@
+import numpy as np
+import pandas as pd
+
+from Data_Validation.datanull.null_mask_index import NullMaskIndex
+from Data_Validation.datastats.moments import CoMoments, MomentsAccumulator, SUMMARY_COLUMNS
+
+# Frames with at least this many columns use wide-table execution unless told otherwise
+WIDE_TABLE_MIN_COLUMNS = 1000
+
+# Cells per 2-D block; a dtype group is split into column slices of about this size
+BLOCK_CELLS = 1 << 22
+
+# Cells of the correlation matrix computed at a time by ``wide_correlation_pairs``
+CORRELATION_TILE_CELLS = 1 << 21
+
+PAIR_COLUMNS = ["column", "related", "correlation"]
+
+STATISTIC_COLUMNS = ["missing", "distinct", "min", "max", "negatives"] + SUMMARY_COLUMNS
+
+
+def is_wide(df, wide=None):
+    """Whether to use wide-table execution: ``wide`` when given, else by the number of columns."""
+    return len(df.columns) >= WIDE_TABLE_MIN_COLUMNS if wide is None else bool(wide)
+
+
+def _numeric(dtype):
+    return dtype.kind in "iuf"
+
+
+def dtype_blocks(df, columns=None, block_cells=BLOCK_CELLS):
+    """Columns grouped by dtype, each group split into blocks of about ``block_cells`` cells.
+
+    Returns:
+        list: ``(dtype, [columns])`` pairs, groups in order of first appearance.
+    """
+    columns = df.columns if columns is None else columns
+    dtypes = df.dtypes.to_dict()
+    groups = {}
+    for col in columns:
+        groups.setdefault(dtypes[col], []).append(col)
+    step = max(1, block_cells // max(len(df), 1))
+    return [(dtype, group[start:start + step]) for dtype, group in groups.items() for start in range(0, len(group), step)]
+
+
+def _distinct_counts(values):
+    """Distinct non-missing values of every column of a 2-D array, from one sort along the rows."""
+    ordered = np.sort(values, axis=0)
+    if len(ordered) == 0:
+        return np.zeros(ordered.shape[1], dtype=np.int64)
+    new = np.empty(ordered.shape, dtype=bool)
+    new[0] = True
+    np.not_equal(ordered[1:], ordered[:-1], out=new[1:])
+    if ordered.dtype.kind == "f":
+        new &= ~np.isnan(ordered)  # NaNs sort last and are not values
+    return new.sum(axis=0)
+
+
+def distinct_counts(df, columns=None):
+    """``{column: df[column].nunique()}``, sorted out a dtype block at a time for numeric and boolean columns."""
+    counts = {}
+    for dtype, block_columns in dtype_blocks(df, columns):
+        if (_numeric(dtype) or dtype.kind == "b") and len(df):
+            counts.update(zip(block_columns, _distinct_counts(df[block_columns].to_numpy()).tolist()))
+        else:
+            counts.update((col, int(df[col].nunique(dropna=True))) for col in block_columns)
+    return counts
+
+
+def wide_column_statistics(df, columns=None, distinct=True, nulls=None):
+    """Per-column statistics computed a 2-D dtype block at a time.
+
+    Columns of the same dtype are reduced together, one NumPy call per
+    statistic and block, instead of one pandas call per column and statistic;
+    on tables with thousands of columns the per-call overhead is what costs.
+    Missing counts come from the frame's ``NullMaskIndex`` (``nulls``, built
+    when not given). Numeric (integer
+    and float, not boolean) columns get min/max, negative counts and the
+    ``MomentsAccumulator`` moments; see ``distinct_counts`` for the distinct
+    values.
+
+    Args:
+        df (pd.DataFrame): The dataset.
+        columns (list, optional): Columns to describe. Defaults to all columns.
+        distinct (bool): Also count distinct values (needs a sort of each block).
+
+    Returns:
+        pd.DataFrame: One row per column with ``STATISTIC_COLUMNS``; statistics
+        that do not apply to a column are NaN.
+    """
+    columns = list(df.columns if columns is None else columns)
+    if nulls is None:
+        nulls = NullMaskIndex.from_frame(df)
+    stats = pd.DataFrame(np.nan, index=pd.Index(columns), columns=STATISTIC_COLUMNS)
+    stats["missing"] = [nulls.count(col) for col in columns]
+    if distinct:
+        stats["distinct"] = pd.Series(distinct_counts(df, columns))
+    if len(df) == 0:
+        return stats
+
+    for dtype, block_columns in dtype_blocks(df, columns):
+        if _numeric(dtype):
+            values = df[block_columns].to_numpy()
+            moments = MomentsAccumulator(block_columns).update(values)
+            summary = moments.summary()
+            stats.loc[block_columns, SUMMARY_COLUMNS] = summary.to_numpy()
+            if dtype.kind == "f":
+                with np.errstate(invalid="ignore"):
+                    stats.loc[block_columns, "min"] = np.fmin.reduce(values, axis=0)
+                    stats.loc[block_columns, "max"] = np.fmax.reduce(values, axis=0)
+            else:
+                stats.loc[block_columns, "min"] = values.min(axis=0)
+                stats.loc[block_columns, "max"] = values.max(axis=0)
+            stats.loc[block_columns, "negatives"] = (values < 0).sum(axis=0)
+    return stats
+
+
+def _pair_frame(columns, rows, cols, values):
+    order = np.lexsort((cols, rows))
+    names = np.asarray(columns, dtype=object)
+    return pd.DataFrame({"column": names[rows[order]], "related": names[cols[order]],
+                         "correlation": values[order]}, columns=PAIR_COLUMNS)
+
+
+def correlation_pairs(matrix, threshold):
+    """Pairs of a correlation matrix with |r| at or above ``threshold``, each pair once.
+
+    Returns:
+        pd.DataFrame: ``PAIR_COLUMNS`` rows, ``column`` before ``related`` in the
+        matrix order, sorted by that order.
+    """
+    values = matrix.to_numpy()
+    with np.errstate(invalid="ignore"):
+        rows, cols = np.nonzero(np.triu(np.abs(values) >= threshold, k=1))
+    return _pair_frame(list(matrix.columns), rows, cols, values[rows, cols])
+
+
+def wide_correlation_pairs(df, threshold, block_cells=BLOCK_CELLS, tile_cells=CORRELATION_TILE_CELLS):
+    """``correlation_pairs(df.corr(numeric_only=True), threshold)`` without the whole matrix.
+
+    Pairwise complete observations like ``DataFrame.corr``, but the pair sums
+    are BLAS matrix products (see ``CoMoments``) instead of a loop over every
+    pair of columns, which is what dominates on thousands of columns. The
+    upper triangle is computed a tile of about ``tile_cells`` pairs at a time
+    (rows of the frame in blocks of about ``block_cells`` cells) and only the
+    strong pairs of each tile are kept, so memory does not grow with the
+    square of the number of columns. Results agree with pandas to floating
+    point rounding.
+    """
+    columns = list(df.select_dtypes(include=["number", "bool"]).columns)
+    k = len(columns)
+    tile = max(1, tile_cells // max(k, 1))
+    found = []
+    for start in range(0, k, tile):
+        tile_columns, other_columns = columns[start:start + tile], columns[start:]
+        comoments = CoMoments(tile_columns, other_columns)
+        frame = df[other_columns]
+        block_rows = max(1, block_cells // len(other_columns))
+        for row in range(0, len(frame), block_rows):
+            values = frame.iloc[row:row + block_rows].to_numpy(dtype=np.float64, na_value=np.nan)
+            comoments.update(values[:, :len(tile_columns)], values)
+        corr = comoments.correlation().to_numpy()
+        with np.errstate(invalid="ignore"):
+            rows, cols = np.nonzero(np.triu(np.abs(corr) >= threshold, k=1))  # tile column j is frame column start + j
+        found.append((rows + start, cols + start, corr[rows, cols]))
+    if not found:
+        return _pair_frame(columns, np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0))
+    return _pair_frame(columns, *(np.concatenate(parts) for parts in zip(*found)))
@@ -0,0 +1,169 @@
+import pandas as pd
+
+try:
+    from pandas.tseries.api import guess_datetime_format
+except ImportError:  # pandas < 2.2
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+
+# Number of non-null values inspected when deciding whether a column holds dates
+DATE_SAMPLE_SIZE = 200
+# Share of the sample that must parse with the guessed format
+MIN_PARSE_RATIO = 0.9
+
+# Column name -> detected format, reused by later runs and chunks of the same feed
+# while it still parses the column's sample (another file may use the name differently)
+_FORMAT_CACHE = {}
+
+
+def clear_format_cache():
+    """Forget all cached date formats."""
+    _FORMAT_CACHE.clear()
+
+
+def _parses(sample, fmt):
+    """Whether ``fmt`` parses at least ``MIN_PARSE_RATIO`` of the sample."""
+    parsed = pd.to_datetime(sample, format=fmt, errors="coerce")
+    return parsed.notna().mean() >= MIN_PARSE_RATIO
+
+
+def _guess_column_format(sample):
+    """Guess one strftime format for a sample of strings, or None."""
+    for value in sample[:5]:
+        fmt = guess_datetime_format(value)
+        if fmt is not None and _parses(sample, fmt):
+            return fmt
+    return None
+
+
+# Detect date columns from a small sample of each text column
+def detect_datetime_columns(df, sample_size=DATE_SAMPLE_SIZE, use_cache=True):
+    """Detect columns holding dates by inspecting a sample of each text column.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to inspect.
+        sample_size (int): Non-null values inspected per column.
+        use_cache (bool): Reuse the format detected for the same column name
+            earlier when it still parses this column's sample.
+
+    Returns:
+        dict: Column name -> strftime format. Columns that are already
+        datetime64 are included with a format of None.
+    """
+    formats = {}
+    for col in df.columns:
+        column = df[col]
+        if pd.api.types.is_datetime64_any_dtype(column):
+            formats[col] = None
+            continue
+        if not (pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column)):
+            continue
+
+        # Only look at the head of the column so detection cost does not grow with the data
+        sample = column.iloc[: sample_size * 5].dropna().head(sample_size)
+        sample = sample[sample.map(type) == str].str.strip()
+        if sample.empty:
+            continue
+
+        cached = _FORMAT_CACHE.get(col) if use_cache else None
+        fmt = cached if cached is not None and _parses(sample, cached) else _guess_column_format(sample)
+        if fmt is not None:
+            formats[col] = fmt
+            _FORMAT_CACHE[col] = fmt
+    return formats
+
+
+def parse_datetime_column(column, fmt=None):
+    """Parse a column with a known format; unparseable entries become NaT."""
+    if pd.api.types.is_datetime64_any_dtype(column):
+        parsed = column
+    else:
+        parsed = pd.to_datetime(column, format=fmt, errors="coerce", cache=True)
+
+    # Compare everything as timezone-naive UTC
+    if getattr(parsed.dt, "tz", None) is not None:
+        parsed = parsed.dt.tz_convert(None)
+    return parsed
+
+
+# Parse detected date columns without touching the input DataFrame
+def parse_datetime_columns(df, formats=None, sample_size=DATE_SAMPLE_SIZE):
+    """Return ``{column: parsed datetime Series}`` for every date column of ``df``."""
+    if formats is None:
+        formats = detect_datetime_columns(df, sample_size=sample_size)
+    return {col: parse_datetime_column(df[col], fmt) for col, fmt in formats.items() if col in df.columns}
+
+
+def _naive_timestamp(value):
+    value = pd.Timestamp(value)
+    return value.tz_convert(None) if value.tzinfo is not None else value
+
+
+def timely_mask(column, threshold_date, source=None):
+    """Boolean array of entries that are missing or on/after ``threshold_date``.
+
+    ``source`` is the column before parsing; entries present there that did
+    not parse are not timely.
+    """
+    if threshold_date is None:
+        raise ValueError("Threshold date must be provided and cannot be None.")
+    missing = column.isna()
+    if source is not None:
+        missing &= source.isna()
+    return (missing | (column >= _naive_timestamp(threshold_date))).to_numpy(dtype=bool)
+
+
+def timeliness_score(column, threshold_date, source=None):
+    """Percentage of entries that are missing or on/after ``threshold_date`` (see ``timely_mask``)."""
+    if len(column) == 0:
+        return 0.0
+
+    timely_entries = timely_mask(column, threshold_date, source).sum()
+    return timely_entries / len(column) * 100
+
+
+def freshness_lag(column, as_of=None):
+    """Days between ``as_of`` (default: now) and the most recent entry, or None."""
+    latest = column.max()
+    if pd.isna(latest):
+        return None
+    as_of = _naive_timestamp("now" if as_of is None else as_of)
+    return (as_of - latest) / pd.Timedelta(days=1)
+
+
+def future_date_score(column, as_of=None):
+    """Percentage of entries that are missing or not later than ``as_of`` (default: now)."""
+    if len(column) == 0:
+        return 0.0
+    as_of = _naive_timestamp("now" if as_of is None else as_of)
+    valid_entries = (column.isna() | (column <= as_of)).sum()
+    return valid_entries / len(column) * 100
+
+
+# Score every date column of a DataFrame
+def datetime_scores(df, threshold_date=None, as_of=None, formats=None):
+    """Calculate timeliness, freshness lag and future-date checks for date columns.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to analyze.
+        threshold_date (pd.Timestamp, optional): Timeliness cutoff. Defaults to today.
+        as_of (pd.Timestamp, optional): Reference time for freshness and future dates.
+                                        Defaults to now.
+        formats (dict, optional): Column name -> format. Defaults to detection.
+
+    Returns:
+        pd.DataFrame: One row per date column with "Timeliness", "Freshness Lag (days)",
+        "Future Dates" (share of non-future entries, %) and "Unparseable" (count of
+        non-null entries that did not parse).
+    """
+    if threshold_date is None:
+        threshold_date = pd.to_datetime("today")
+
+    scores = {}
+    for col, parsed in parse_datetime_columns(df, formats).items():
+        scores[col] = {
+            "Timeliness": timeliness_score(parsed, threshold_date, df[col]),
+            "Freshness Lag (days)": freshness_lag(parsed, as_of),
+            "Future Dates": future_date_score(parsed, as_of),
+            "Unparseable": int((parsed.isna() & df[col].notna()).sum()),
+        }
+    return pd.DataFrame.from_dict(scores, orient="index")
@@ -0,0 +1,204 @@
+"""Time every pipeline stage on synthetic datasets of several sizes.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --shape wide --sizes 1000x200 1000x1000
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/<previous>.json
+
+Each run is saved as JSON under ``benchmarks/results`` (one file per label) so
+two versions can be compared stage by stage.
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+from benchmarks.synthetic_data import generate_dataset, generate_reference, generate_wide_dataset
+from Data_Validation.dataloD.data_loader import load_dataset
+from Data_Validation.dataquame.data_quality_metrics import calculate_scores, overall_quality_score
+from Data_Validation.datadetairep.detailed_report import generate_alerts, generate_detailed_report
+from Data_Validation.dataquaclms.quality_summary import generate_quality_summary
+from Data_Validation.dataProfrep.data_profiling_report import generate_statistics, generate_combined_report
+from Data_Validation.dataexec.partitioned_executor import run_partitioned_pipeline
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+DEFAULT_SIZES = {
+    "long": ["1000x12", "10000x12", "100000x12"],
+    "wide": ["1000x50", "1000x200", "1000x500"],
+}
+# Regressions smaller than this relative change are reported as noise
+NOISE_THRESHOLD = 0.10
+
+
+def _git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def _time_stage(func, repeat, setup=None):
+    """Run ``func`` ``repeat`` times and return (best seconds, last result).
+
+    With ``setup``, each repeat calls ``func(setup())`` and only ``func`` is
+    timed, e.g. to hand every repeat a fresh copy of a frame.
+    """
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        args = () if setup is None else (setup(),)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):  # report generators print on success
+            result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+# Benchmark the pipeline for one dataset size
+def benchmark_size(shape, n_rows, n_columns, repeat=3, seed=0, null_rate=0.05, duplicate_rate=0.02, skew=1.0):
+    """Generate one dataset and time each pipeline stage on it.
+
+    Returns:
+        dict: Dataset description and ``{stage: seconds}`` (best of ``repeat``).
+    """
+    options = dict(null_rate=null_rate, duplicate_rate=duplicate_rate, skew=skew, seed=seed)
+    if shape == "wide":
+        df = generate_wide_dataset(n_rows=n_rows, n_columns=n_columns, **options)
+    else:
+        n_numeric = max(1, n_columns // 2)
+        n_email = 1
+        n_date = 1
+        n_text = max(0, n_columns - 1 - n_numeric - n_email - n_date)
+        df = generate_dataset(n_rows=n_rows, n_numeric=n_numeric, n_text=n_text, n_email=n_email,
+                              n_date=n_date, **options)
+    reference = generate_reference(df, seed=seed + 1)
+
+    timings = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        data_path = os.path.join(tmp, "data.csv")
+        df.to_csv(data_path, index=False)
+        report_path = os.path.join(tmp, "report.html")
+
+        timings["load_dataset"], df = _time_stage(lambda: load_dataset(data_path), repeat)
+        timings["calculate_scores"], scores = _time_stage(lambda: calculate_scores(df, reference), repeat)
+        overall = overall_quality_score(scores)
+        timings["generate_alerts"], _ = _time_stage(lambda: generate_alerts(df), repeat)
+        timings["generate_statistics"], _ = _time_stage(lambda: generate_statistics(df), repeat)
+        timings["generate_detailed_report"], detailed = _time_stage(
+            lambda: generate_detailed_report(df, scores, overall), repeat
+        )
+        summary = generate_quality_summary(df, scores)
+        # Each repeat gets its own copy, so no repeat sees changes an earlier one made to the frame
+        timings["generate_combined_report"], _ = _time_stage(
+            lambda frame: generate_combined_report(frame, detailed, summary, report_path), repeat, setup=df.copy
+        )
+        report_size = os.path.getsize(report_path) if os.path.exists(report_path) else None
+
+        reference_path = os.path.join(tmp, "reference.csv")
+        reference.to_csv(reference_path, index=False)
+        timings["partitioned_pipeline"], _ = _time_stage(
+            lambda: run_partitioned_pipeline(data_path, reference_path), repeat
+        )
+
+    return {
+        "shape": shape,
+        "rows": n_rows,
+        "columns": n_columns,
+        "null_rate": null_rate,
+        "duplicate_rate": duplicate_rate,
+        "skew": skew,
+        "seed": seed,
+        "report_bytes": report_size,
+        "timings": timings,
+    }
+
+
+def run_benchmarks(shape="long", sizes=None, repeat=3, seed=0, label=None, **options):
+    """Benchmark every size and save the results. Returns the results dictionary."""
+    sizes = sizes or DEFAULT_SIZES[shape]
+    results = {
+        "label": label or _git_revision(),
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": [],
+    }
+    for size in sizes:
+        n_rows, n_columns = (int(part) for part in size.lower().split("x"))
+        run = benchmark_size(shape, n_rows, n_columns, repeat=repeat, seed=seed, **options)
+        results["runs"].append(run)
+        stages = ", ".join(f"{stage}={seconds:.3f}s" for stage, seconds in run["timings"].items())
+        print(f"{shape} {size}: {stages}")
+    return results
+
+
+def save_results(results, results_dir=RESULTS_DIR):
+    os.makedirs(results_dir, exist_ok=True)
+    path = os.path.join(results_dir, f"{results['label']}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    return path
+
+
+# Compare two saved runs stage by stage
+def compare_results(previous, current, noise_threshold=NOISE_THRESHOLD):
+    """Return rows of (size, stage, previous s, current s, relative change, verdict)."""
+    def key(run):
+        return (run["shape"], run["rows"], run["columns"])
+
+    previous_runs = {key(run): run for run in previous["runs"]}
+    rows = []
+    for run in current["runs"]:
+        old = previous_runs.get(key(run))
+        if old is None:
+            continue
+        for stage, seconds in run["timings"].items():
+            old_seconds = old["timings"].get(stage)
+            if not old_seconds:
+                continue
+            change = (seconds - old_seconds) / old_seconds
+            verdict = "slower" if change > noise_threshold else "faster" if change < -noise_threshold else "same"
+            rows.append((f"{run['shape']} {run['rows']}x{run['columns']}", stage, old_seconds, seconds, change, verdict))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the data quality pipeline stages.")
+    parser.add_argument("--shape", choices=sorted(DEFAULT_SIZES), default="long")
+    parser.add_argument("--sizes", nargs="+", help="Sizes as ROWSxCOLUMNS, e.g. 10000x12")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--null-rate", type=float, default=0.05)
+    parser.add_argument("--duplicate-rate", type=float, default=0.02)
+    parser.add_argument("--skew", type=float, default=1.0)
+    parser.add_argument("--label", help="Name of the results file (defaults to the git revision)")
+    parser.add_argument("--compare", help="Previous results JSON to compare against")
+    args = parser.parse_args()
+
+    results = run_benchmarks(
+        shape=args.shape, sizes=args.sizes, repeat=args.repeat, seed=args.seed, label=args.label,
+        null_rate=args.null_rate, duplicate_rate=args.duplicate_rate, skew=args.skew,
+    )
+    print(f"Results saved to {save_results(results)}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+        for size, stage, old, new, change, verdict in compare_results(previous, results):
+            print(f"{size:<20} {stage:<26} {old:9.3f}s -> {new:9.3f}s ({change:+.1%}) {verdict}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+
+_FIRST_NAMES = np.array(["john", "jane", "michael", "emily", "david", "sarah", "chris", "anna", "varun", "aditya"])
+_DOMAINS = np.array(["example.com", "gmail.com", "mail.org", "corp.net"])
+
+
+def _numeric_column(rng, n_rows, skew):
+    """Lognormal values; ``skew`` is the sigma of the underlying normal (0 = symmetric)."""
+    if skew <= 0:
+        return rng.normal(500.0, 150.0, n_rows).round(2)
+    return (rng.lognormal(mean=5.0, sigma=skew, size=n_rows)).round(2)
+
+
+def _text_column(rng, n_rows, cardinality):
+    return pd.Series(rng.integers(0, cardinality, n_rows)).map(lambda i: f"value_{i}").to_numpy(dtype=object)
+
+
+def _email_column(rng, n_rows, invalid_rate):
+    names = _FIRST_NAMES[rng.integers(0, len(_FIRST_NAMES), n_rows)]
+    numbers = rng.integers(0, 100_000, n_rows).astype(str)
+    domains = _DOMAINS[rng.integers(0, len(_DOMAINS), n_rows)]
+    emails = pd.Series(names) + "." + pd.Series(numbers) + "@" + pd.Series(domains)
+    invalid = rng.random(n_rows) < invalid_rate
+    emails[invalid] = emails[invalid].str.replace("@", "_at_", regex=False)
+    return emails.to_numpy(dtype=object)
+
+
+def _date_column(rng, n_rows):
+    start = np.datetime64("2019-01-01")
+    days = rng.integers(0, 6 * 365, n_rows)
+    return np.datetime_as_string(start + days.astype("timedelta64[D]"), unit="D").astype(object)
+
+
+# Generate a synthetic dataset with controllable quality issues
+def generate_dataset(n_rows=10_000, n_numeric=4, n_text=3, n_email=1, n_date=1, null_rate=0.05,
+                     duplicate_rate=0.02, skew=1.0, text_cardinality=50, invalid_email_rate=0.05, seed=0):
+    """Generate a reproducible DataFrame shaped like the feeds this project validates.
+
+    Args:
+        n_rows (int): Number of rows (duplicates included).
+        n_numeric (int): Number of numeric columns (``amount_0`` ...).
+        n_text (int): Number of categorical text columns (``category_0`` ...).
+        n_email (int): Number of email-like columns (``email_0`` ...).
+        n_date (int): Number of ISO date columns stored as text (``date_0`` ...).
+        null_rate (float): Share of cells set to missing in every column except the id.
+        duplicate_rate (float): Share of rows that are exact copies of earlier rows.
+        skew (float): Sigma of the lognormal numeric columns; 0 gives normal data.
+        text_cardinality (int): Distinct values per categorical column.
+        invalid_email_rate (float): Share of email values without an ``@``.
+        seed (int): Random seed; the same arguments always give the same frame.
+
+    Returns:
+        pd.DataFrame: The generated dataset.
+    """
+    rng = np.random.default_rng(seed)
+    columns = {"customer_id": rng.permutation(n_rows) + 10_000_000}
+
+    for i in range(n_numeric):
+        columns[f"amount_{i}"] = _numeric_column(rng, n_rows, skew)
+    for i in range(n_text):
+        columns[f"category_{i}"] = _text_column(rng, n_rows, text_cardinality)
+    for i in range(n_email):
+        columns[f"email_{i}"] = _email_column(rng, n_rows, invalid_email_rate)
+    for i in range(n_date):
+        columns[f"date_{i}"] = _date_column(rng, n_rows)
+
+    df = pd.DataFrame(columns)
+
+    # Null out cells (the id column stays complete)
+    if null_rate > 0:
+        for col in df.columns[1:]:
+            mask = rng.random(n_rows) < null_rate
+            if df[col].dtype == object:
+                df.loc[mask, col] = np.nan
+            else:
+                df[col] = df[col].astype("float64").mask(mask)
+
+    # Overwrite a share of rows with copies of other rows
+    n_duplicates = int(n_rows * duplicate_rate)
+    if n_duplicates > 0 and n_rows > 1:
+        targets = rng.choice(np.arange(1, n_rows), size=min(n_duplicates, n_rows - 1), replace=False)
+        sources = rng.integers(0, targets)
+        df.iloc[targets] = df.iloc[sources].to_numpy()
+
+    return df
+
+
+def generate_reference(df, mismatch_rate=0.05, seed=1):
+    """Return a copy of ``df`` with a share of cells changed, for accuracy/consistency checks."""
+    rng = np.random.default_rng(seed)
+    reference = df.copy()
+    for col in reference.columns[1:]:
+        mask = rng.random(len(reference)) < mismatch_rate
+        if pd.api.types.is_numeric_dtype(reference[col]):
+            reference.loc[mask, col] = reference.loc[mask, col] + 1
+        else:
+            reference.loc[mask, col] = "changed"
+    return reference
+
+
+def generate_wide_dataset(n_rows=1_000, n_columns=200, **kwargs):
+    """Shortcut for a wide table: mostly numeric columns with a few text and email columns."""
+    n_text = max(1, n_columns // 20)
+    n_email = max(1, n_columns // 50)
+    n_date = max(1, n_columns // 50)
+    n_numeric = max(0, n_columns - 1 - n_text - n_email - n_date)
+    return generate_dataset(n_rows=n_rows, n_numeric=n_numeric, n_text=n_text, n_email=n_email,
+                            n_date=n_date, **kwargs)
@@ -1,11 +1,24 @@
 from Data_Validation.dataloD.data_loader import load_dataset
+from Data_Validation.datanull.null_mask_index import NullMaskIndex
+from Data_Validation.dataloD.projection import plan_inputs
 from Data_Validation.dataquame.data_quality_metrics import calculate_scores, overall_quality_score
+from Data_Validation.dataconf.rule_config import load_rules, resolve_rules
+from Data_Validation.dataquame.failure_samples import FailureSamples, render_failure_section
+from Data_Validation.dataquame.consistency_rules import evaluate_consistency_rules
 from Data_Validation.datadetairep.detailed_report import generate_detailed_report
 from Data_Validation.dataquaclms.quality_summary import generate_quality_summary
-from Data_Validation.dataProfrep.data_profiling_report import generate_combined_report
+from Data_Validation.dataProfrep.data_profiling_report import render_combined_report, TIMING_PLACEHOLDER
+from Data_Validation.datarender.report_bundle import write_report_bundle
+from Data_Validation.datainstr.instrumentation import PipelineTrace, render_timing_section
+from Data_Validation.datadupl.duplicate_detection import find_duplicates
+from Data_Validation.datastats.histograms import build_histograms
+from Data_Validation.datadrift.drift_report import (build_run_snapshot, save_run_snapshot, load_run_snapshot,
+                                                    compare_runs, changed_columns, render_drift_section)
 import matplotlib
 import io
+import os
 import requests
+import sys
 import zipfile
 
 matplotlib.use("Agg")
@@ -16,37 +29,113 @@ if __name__ == "__main__":
             response = requests.get("https://www.kaggle.com/api/v1/datasets/download/dongrelaxman/amazon-reviews-dataset")
             zf = zipfile.ZipFile(io.BytesIO(response.content))
             zf.extractall("Data_Validation\\Ds'S")
-        # Step 1: Load the datasets
-        dataset_path = "Data_Validation\\Ds'S\\sample.csv"
-        dataset_path2 = "Data_Validation\\Ds'S\\second_dataset.csv"
-        df = load_dataset(dataset_path)
-        df2 = load_dataset(dataset_path2)
+        # Stage timings and memory are recorded in a trace; set DQ_PROFILE=cprofile
+        # (or pyinstrument) to also dump a profile of the whole run, and DQ_TRACK_ALLOCATIONS=1
+        # for per-stage peak Python allocations (tracemalloc, slows the run down)
+        trace = PipelineTrace(name="pipeline", profiler=os.environ.get("DQ_PROFILE"),
+                              track_allocations=os.environ.get("DQ_TRACK_ALLOCATIONS", "") not in ("", "0"))
+        with trace:
+            # Step 1: Load the datasets
+            dataset_path = "Data_Validation\\Ds'S\\sample.csv"
+            dataset_path2 = "Data_Validation\\Ds'S\\second_dataset.csv"
 
-        # Validate if the datasets are loaded properly
-        if df is None or df.empty:
-            raise ValueError(f"The dataset at {dataset_path} is empty or failed to load. Check the file path and content.")
-        if df2 is None or df2.empty:
-            raise ValueError(f"The dataset at {dataset_path2} is empty or failed to load. Check the file path and content.")
+            # Checks and thresholds come from DQ_RULES (JSON or YAML) when set, else the defaults
+            rules_path = os.environ.get("DQ_RULES")
+            rules = load_rules(rules_path) if rules_path else resolve_rules()
 
-        # Step 2: Calculate detailed scores for each column
-        detailed_scores_df = calculate_scores(df, df2)
+            # Only the columns the selected metrics and report sections use are read, and the
+            # second dataset only when Accuracy or Consistency compares against it
+            with trace.stage("load_dataset"):
+                inputs = plan_inputs(dataset_path, dataset_path2, rules)
+                df = load_dataset(dataset_path, usecols=inputs["columns"])
+                df2 = None
+                if inputs["reference_columns"] is not None:
+                    df2 = load_dataset(dataset_path2, usecols=inputs["reference_columns"])
 
-        # Step 3: Calculate the overall data quality score
-        overall_score = overall_quality_score(detailed_scores_df)
+            # Validate if the datasets are loaded properly
+            if df is None or df.empty:
+                raise ValueError(f"The dataset at {dataset_path} is empty or failed to load. Check the file path and content.")
+            if inputs["reference_columns"] is not None and (df2 is None or df2.empty):
+                raise ValueError(f"The dataset at {dataset_path2} is empty or failed to load. Check the file path and content.")
 
-        # Step 4: Generate the detailed report content
-        detailed_report_content = generate_detailed_report(df, detailed_scores_df, overall_score)
+            # Missing-value bitmaps of the loaded frame, shared by every metric and report section
+            with trace.stage("null_masks"):
+                nulls = NullMaskIndex.from_frame(df)
 
-        # Step 5: Generate the quality summary content
-        quality_summary_content = generate_quality_summary(df, detailed_scores_df)
+            # Step 2: Calculate detailed scores for each column
+            # A bounded sample of the failing rows of each check is kept while scoring
+            failures = FailureSamples()
+            with trace.stage("calculate_scores"):
+                detailed_scores_df = calculate_scores(df, df2, rules=rules, failures=failures, nulls=nulls)
 
-        # Step 6: Generate the combined report with all sections
-        output_path = "combined_data_quality_report.html"
-        generate_combined_report(df, detailed_report_content, quality_summary_content,output_path)
+            # Cross-column consistency rules share one scan; their failing rows join the samples
+            if rules["consistency_rules"]:
+                with trace.stage("consistency_rules"):
+                    rule_scores = evaluate_consistency_rules(df, rules["consistency_rules"], failures=failures)
+                print(rule_scores.to_string())
+            failures.to_json("failure_samples.json")
+
+            # Step 3: Calculate the overall data quality score
+            overall_score = overall_quality_score(detailed_scores_df)
+
+            # Row and column hashes for the duplicate counts, shared by every report section
+            with trace.stage("duplicates"):
+                duplicates = find_duplicates(df)
+
+            # Histograms of the numeric and datetime columns, shared by the snapshot and the column charts
+            with trace.stage("histograms"):
+                histograms = build_histograms(df)
+
+            # Delta mode: with DQ_PREVIOUS_SNAPSHOT set, only columns that drifted are rendered.
+            # The previous snapshot is read before this run's is saved (to DQ_SNAPSHOT, by default
+            # run_snapshot.json), so both may name the same file.
+            with trace.stage("drift"):
+                snapshot = build_run_snapshot(df, detailed_scores_df, histograms=histograms, nulls=nulls)
+                report_scores_df = detailed_scores_df
+                report_columns = None
+                drift_report_content = None
+                previous_snapshot_path = os.environ.get("DQ_PREVIOUS_SNAPSHOT")
+                if previous_snapshot_path:
+                    previous_snapshot = load_run_snapshot(previous_snapshot_path)
+                    drift_df = compare_runs(previous_snapshot, snapshot)
+                    report_columns = changed_columns(drift_df)
+                    report_scores_df = detailed_scores_df.loc[report_columns]
+                    drift_report_content = render_drift_section(drift_df, previous_snapshot["created"])
+                save_run_snapshot(snapshot, os.environ.get("DQ_SNAPSHOT", "run_snapshot.json"))
+
+            # Step 4: Generate the detailed report content
+            with trace.stage("detailed_report"):
+                detailed_report_content = generate_detailed_report(df, report_scores_df, overall_score, duplicates,
+                                                                    alert_thresholds=rules["alerts"], nulls=nulls)
+
+            # Step 5: Generate the quality summary content
+            with trace.stage("quality_summary"):
+                quality_summary_content = generate_quality_summary(df, detailed_scores_df)
+
+            # Step 6: Generate the combined report with all sections
+            output_path = "combined_data_quality_report.html"
+            with trace.stage("combined_report"):
+                report_html = render_combined_report(df, detailed_report_content, quality_summary_content, output_path,
+                                                     timing_report_content=TIMING_PLACEHOLDER, duplicates=duplicates,
+                                                     drift_report_content=drift_report_content, columns=report_columns,
+                                                     failure_report_content=render_failure_section(failures),
+                                                     histograms=histograms, nulls=nulls)
+
+        # The timing section is filled in once the trace is closed, so it covers every stage
+        # (the combined report included) and the total run time.
+        # Set DQ_REPORT_BUNDLE=gzip, brotli or zip to archive the report compressed
+        report_html = report_html.replace(TIMING_PLACEHOLDER, render_timing_section(trace))
+        # The bundle may be written under another name (e.g. the .zip in zip mode)
+        output_path = write_report_bundle(report_html, output_path, os.environ.get("DQ_REPORT_BUNDLE", "html"))
+        if not os.path.isfile(output_path):
+            raise RuntimeError(f"The report was not written to '{output_path}'.")
+        trace.to_json("pipeline_trace.json")
 
         print(f"Data quality report generated successfully and saved as '{output_path}'!")
 
     except FileNotFoundError as e:
         print(f"Error: {e}. Check if the file paths '{dataset_path}' and '{dataset_path2}' exist.")
+        sys.exit(1)
     except Exception as e:
-        print(f"An error occurred: {e}")
\ No newline at end of file
+        print(f"An error occurred: {e}")
+        sys.exit(1)
\ No newline at end of file
@@ -1,8 +1,10 @@
-from ydata_profiling import ProfileReport
 import matplotlib.pyplot as plt
 import numpy as np
 import io
 import base64
+from Data_Validation.datainstr.instrumentation import stage
+from Data_Validation.datarender.templates import asset_tags, render_template
+from Data_Validation.dataProfrep.native_profile import profile_dataset, render_native_profile
 
 def generate_detailed_report(df, detailed_scores_df, overall_score):
     try:
@@ -11,59 +13,7 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
         
         html_content = []
 
-        # General Styling for Data Quality Report
-        html_content.append("""
-        <style>
-            body {
-                font-family: Arial, sans-serif;
-                margin: 0;
-                padding: 0;
-                background-color: #f4f7f8;
-                color: #333;
-            }
-            h1, h2 {
-                text-align: center;
-                color: #2c3e50;
-            }
-            .container {
-                margin: 20px auto;
-                padding: 20px;
-                max-width: 1200px;
-                background: #fff;
-                box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
-                border-radius: 10px;
-            }
-            table {
-                width: 100%;
-                border-collapse: collapse;
-                margin: 20px 0;
-                box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
-            }
-            th, td {
-                border: 1px solid #ddd;
-                padding: 12px;
-                text-align: center;
-            }
-            th {
-                background-color: #2c3e50;
-                color: white;
-            }
-            tr:nth-child(even) {
-                background-color: #f2f2f2;
-            }
-            .dropdown-container {
-                margin: 20px auto;
-                text-align: center;
-            }
-            select {
-                padding: 10px;
-                border: 1px solid #ddd;
-                border-radius: 5px;
-                width: 100%;
-                max-width: 300px;
-            }
-        </style>
-        """)
+        # Styles and scripts are in the page's asset bundle (datarender/ydata_report.css and .js)
 
         # Section 1: Overall Quality Scores
         html_content.append("<div class='container'>")
@@ -122,10 +72,10 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
         html_content.append("</div>")  # Closing dropdown container
 
         # Charts Container
-        html_content.append("<div class='charts-container' id='charts-container' style='display: none;'>")
+        html_content.append("<div class='charts-container' id='charts-container'>")
         for col, charts in charts_data.items():
             html_content.append(f"""
-            <div id='{col}-charts' class='chart-section' style='display: none;'>
+            <div id='{col}-charts' class='chart-section'>
                 <h3>{col} - Bar Chart</h3>
                 <div class="chart-container">
                     <img src='data:image/png;base64,{charts['bar_chart']}' alt='Bar Chart' />
@@ -135,48 +85,6 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
         html_content.append("</div>")  # Closing charts container
         html_content.append("</div>")  # Closing visualizations container
 
-        # JavaScript for Interactivity
-        html_content.append("""
-        <script>
-            function showColumnCharts(column) {
-                const chartSections = document.querySelectorAll('.chart-section');
-                chartSections.forEach(section => section.style.display = 'none');
-                if (column) {
-                    const selectedSection = document.getElementById(`${column}-charts`);
-                    if (selectedSection) {
-                        document.getElementById('charts-container').style.display = 'block';
-                        selectedSection.style.display = 'block';
-                    }
-                } else {
-                    document.getElementById('charts-container').style.display = 'none';
-                }
-            }
-        </script>
-        """)
-
-        # Additional Styling for Visualizations Section
-        html_content.append("""
-        <style>
-            .visualizations-container {
-                background-color: #f9f9f9;
-                padding: 20px;
-                margin-top: 20px;
-                box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
-                border-radius: 10px;
-            }
-            .charts-container {
-                display: flex;
-                flex-direction: column;
-                align-items: center;
-                margin-top: 20px;
-            }
-            .chart-container {
-                width: 60%;
-                text-align: center;
-            }
-        </style>
-        """)
-
         return "\n".join(html_content)
 
     except Exception as e:
@@ -187,99 +95,9 @@ def generate_detailed_report(df, detailed_scores_df, overall_score):
 
 def generate_quality_summary(df, scores_df):
     try:
-        # Initialize the HTML content with inline CSS for styling
+        # Initialize the HTML content (styles are in the page's asset bundle)
         html_content = []
         html_content.append("""
-        <style>
-            /* General Reset and Body Styling */
-            body {
-                font-family: 'Arial', sans-serif;
-                line-height: 1.6;
-                margin: 0;
-                padding: 0;
-                background-color: #f4f7f8;
-                color: #333;
-            }
-
-            h1 {
-                text-align: center;
-                color: #2c3e50;
-                font-size: 2.5rem;
-                margin: 20px 0;
-            }
-
-            /* Main Container Styling */
-            .container {
-                max-width: 1200px;
-                margin: 0 auto;
-                padding: 20px;
-            }
-
-            /* Flexbox Cards for Metrics */
-            .metrics-container {
-                display: flex;
-                flex-wrap: wrap;
-                gap: 20px;
-                justify-content: center;
-            }
-
-            .metric-card {
-                flex: 1;
-                min-width: 300px;
-                background: linear-gradient(145deg, #ffffff, #e6e6e6);
-                border-radius: 15px;
-                box-shadow: 4px 4px 10px rgba(0, 0, 0, 0.1);
-                transition: transform 0.2s ease-in-out;
-                padding: 20px;
-                text-align: center;
-            }
-
-            .metric-card:hover {
-                transform: translateY(-5px);
-                box-shadow: 4px 6px 15px rgba(0, 0, 0, 0.2);
-            }
-
-            .metric-title {
-                font-size: 1.5rem;
-                color: #007bff;
-                margin-bottom: 15px;
-                font-weight: bold;
-            }
-
-            .passing-percentage {
-                font-size: 1.2rem;
-                color: #28a745;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }
-
-            /* List of Columns */
-            .columns-list {
-                list-style: none;
-                padding: 0;
-            }
-
-            .columns-list li {
-                padding: 8px;
-                margin-bottom: 5px;
-                background: #f0f9ff;
-                color: #333;
-                border-radius: 5px;
-                transition: background 0.2s ease-in-out;
-            }
-
-            .columns-list li:hover {
-                background: #007bff;
-                color: #fff;
-            }
-
-            /* Footer for No Columns Passed */
-            .no-columns {
-                color: #ff0000;
-                font-style: italic;
-            }
-        </style>
-
         <div class="container">
             <div class="metrics-container">
         """)
@@ -317,14 +135,47 @@ def generate_quality_summary(df, scores_df):
         print(f"Error generating quality summary report: {e}")
         return ""
 
-def generate_ydata_profiling_report(df, detailed_report_content, quality_summary_content, output_path="ydata_profiling_report.html"):
+def generate_profiling_report(df, detailed_report_content, quality_summary_content, output_path="profiling_report.html",
+                              inline_assets=False, sketches=None, top_values=None, deep=False):
+    """Write the profiling page with the native profile (see ``dataProfrep.native_profile``).
+
+    ``sketches`` and ``top_values`` from earlier stages are reused. ``deep=True``
+    runs the full ydata-profiling report instead (optional dependency, much slower).
+    """
+    if deep:
+        return generate_ydata_profiling_report(df, detailed_report_content, quality_summary_content, output_path,
+                                               inline_assets)
+    try:
+        with stage("native_profile"):
+            profile_body_content = render_native_profile(profile_dataset(df, sketches=sketches, top_values=top_values))
+
+        custom_sections = render_template(
+            "ydata_sections",
+            assets=asset_tags("ydata", output_path, inline=inline_assets),
+            profile_body=profile_body_content,
+            detailed_report=detailed_report_content,
+            quality_summary=quality_summary_content,
+        )
+        report_html = ("<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"UTF-8\">\n"
+                       "<title>Data Profiling Report</title>\n</head>\n<body>" + custom_sections + "</body>\n</html>\n")
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write(report_html)
+
+        print(f"Profiling Report generated successfully: {output_path}")
+    except Exception as e:
+        print(f"Error generating profiling report: {e}")
+
+def generate_ydata_profiling_report(df, detailed_report_content, quality_summary_content, output_path="ydata_profiling_report.html",
+                                    inline_assets=False):
     try:
-        # Generate the YData Profiling report
-        profile = ProfileReport(df, title="YData Profiling Report", explorative=True)
+        # ydata-profiling is optional and only imported for this deep-dive report
+        from ydata_profiling import ProfileReport
 
-        # Save the profiling report to a temporary file
+        # Generate the YData Profiling report and save it to a temporary file
         temp_path = "temp_report.html"
-        profile.to_file(temp_path)
+        with stage("ydata_profiling"):
+            profile = ProfileReport(df, title="YData Profiling Report", explorative=True)
+            profile.to_file(temp_path)
 
         with open(temp_path, "r", encoding="utf-8") as f:
             report_html = f.read()
@@ -335,124 +186,13 @@ def generate_ydata_profiling_report(df, detailed_report_content, quality_summary
         profile_body_content = report_html[start_body:end_body]
 
         # Enhanced design with navbar and clean section transitions
-        custom_sections = f"""
-<style>
-    /* General Reset */
-    * {{
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }}
-    body {{
-        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-        background-color: #f7f9fc;
-        color: #333;
-        line-height: 1.6;
-    }}
-
-    /* Navbar Styling */
-    .navbar {{
-        display: flex;
-        justify-content: center;
-        align-items: center;
-        background: linear-gradient(135deg, #6a11cb, #2575fc);
-        color: #fff;
-        padding: 15px 20px;
-        box-shadow: 0 4px 8px rgba(0, 0, 0, 0.1);
-        position: sticky;
-        top: 0;
-        z-index: 1000;
-    }}
-    .navbar a {{
-        color: #fff;
-        text-decoration: none;
-        font-weight: 500;
-        margin: 0 15px;
-        padding: 8px 12px;
-        border-radius: 4px;
-        transition: all 0.3s ease;
-    }}
-    .navbar a:hover {{
-        background-color: rgba(255, 255, 255, 0.2);
-        transform: scale(1.05);
-    }}
-
-    /* Section Container */
-    .section-content {{
-        display: none;
-        margin: 30px auto;
-        padding: 25px;
-        max-width: 95%;
-        background: #fff;
-        border-radius: 10px;
-        box-shadow: 0 6px 15px rgba(0, 0, 0, 0.1);
-        animation: fadeIn 0.5s ease-in-out;
-    }}
-    .section-content.active {{
-        display: block;
-    }}
-
-    /* Section Titles */
-    .section-title {{
-        font-size: 28px;
-        font-weight: bold;
-        text-align: center;
-        margin-bottom: 20px;
-        color: #2575fc;
-    }}
-
-    /* Quality Summary Styling */
-    .quality-summary {{
-        text-align: center;
-        padding: 30px;
-        border-radius: 10px;
-        background: #f6f8fa;
-        box-shadow: 0 6px 12px rgba(0, 0, 0, 0.1);
-        font-size: 18px;
-        color: #444;
-        margin-top: 20px;
-    }}
-    .quality-summary h2 {{
-        margin-bottom: 15px;
-        color: #6a11cb;
-        font-weight: bold;
-    }}
-
-    /* Animations */
-    @keyframes fadeIn {{
-        0% {{ opacity: 0; transform: translateY(10px); }}
-        100% {{ opacity: 1; transform: translateY(0); }}
-    }}
-</style>
-
-<!-- Navbar -->
-<div class="navbar">
-    <a href="#" onclick="showSection('overview')">Overview</a>
-    <a href="#" onclick="showSection('detailed-report')">Detailed Quality Report</a>
-    <a href="#" onclick="showSection('quality-summary')">Quality Summary</a>
-</div>
-
-<!-- Sections -->
-<div id="overview" class="section-content active">
-    {profile_body_content}
-</div>
-<div id="detailed-report" class="section-content">
-    <h2 class="section-title">Detailed Quality Report</h2>
-    {detailed_report_content}
-</div>
-<div id="quality-summary" class="section-content quality-summary">
-    <h2>Quality Summary</h2>
-    {quality_summary_content}
-</div>
-
-<script>
-    function showSection(sectionId) {{
-        const sections = document.querySelectorAll('.section-content');
-        sections.forEach(section => section.classList.remove('active'));
-        document.getElementById(sectionId).classList.add('active');
-    }}
-</script>
-"""
+        custom_sections = render_template(
+            "ydata_sections",
+            assets=asset_tags("ydata", output_path, inline=inline_assets),
+            profile_body=profile_body_content,
+            detailed_report=detailed_report_content,
+            quality_summary=quality_summary_content,
+        )
 
         # Replace <body> tag to include the custom sections
         report_html = report_html[:start_body] + custom_sections + report_html[end_body:]